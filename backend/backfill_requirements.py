@@ -0,0 +1,84 @@
+"""
+요구사항/우대사항 백필 스크립트
+
+job_postings, goals 의 requirements/preferred 중 이전 형식(JSON 문자열, {"description": ...} 객체 배열)으로
+남아 있는 행을 jsonb 문자열 배열로 변환한다. migration.sql 15번 적용 후, 그 사이 이전 버전 서버/크롤러가
+쓴 행을 정리할 때 사용한다. 바뀌는 행만 갱신하므로 반복 실행해도 안전하다.
+
+사용법:
+    python backfill_requirements.py [--dry-run] [--batch-size 500]
+"""
+import sys
+import argparse
+from datetime import datetime
+
+from config.database import supabase
+from utils.helpers import parse_job_requirements
+
+
+TABLES = ["job_postings", "goals"]
+FIELDS = ["requirements", "preferred"]
+
+
+def is_normalized(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def backfill_table(table_name, batch_size=500, dry_run=False):
+    """id 순으로 배치 조회하며 이전 형식 행만 변환"""
+    scanned = 0
+    updated = 0
+    last_id = 0
+
+    while True:
+        result = supabase.table(table_name).select("id, requirements, preferred").gt("id", last_id).order("id").limit(batch_size).execute()
+        rows = result.data or []
+        if not rows:
+            break
+
+        for row in rows:
+            scanned += 1
+            changes = {
+                field: parse_job_requirements(row.get(field))
+                for field in FIELDS
+                if not is_normalized(row.get(field))
+            }
+            if not changes:
+                continue
+
+            updated += 1
+            if dry_run:
+                print(f"  [dry-run] {table_name} #{row['id']}: {', '.join(changes)}")
+                continue
+
+            if table_name == "job_postings":
+                # 검색 색인이 변경분으로 감지하도록 updated_at 갱신
+                changes["updated_at"] = datetime.utcnow().isoformat()
+            supabase.table(table_name).update(changes).eq("id", row["id"]).execute()
+
+        last_id = rows[-1]["id"]
+
+    return scanned, updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="requirements/preferred 를 jsonb 문자열 배열로 백필")
+    parser.add_argument("--dry-run", action="store_true", help="변경 대상만 출력")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"요구사항 백필 {'(dry-run)' if args.dry_run else ''}")
+    print("=" * 60)
+
+    for table_name in TABLES:
+        try:
+            scanned, updated = backfill_table(table_name, args.batch_size, args.dry_run)
+            print(f"✓ {table_name}: {scanned}행 확인, {updated}행 변환")
+        except Exception as e:
+            print(f"✗ {table_name} 백필 실패: {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
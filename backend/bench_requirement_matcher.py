@@ -0,0 +1,95 @@
+"""
+요구사항 매칭 엔진 마이크로 벤치마크
+
+컴파일된 Aho-Corasick 매처와 키워드별 `in` 검사(기존 if/elif 방식)를 요구사항 수천 건에 대해 비교한다.
+
+사용법:
+    python bench_requirement_matcher.py [요구사항 수]
+"""
+import sys
+import time
+import random
+
+from utils.requirement_matcher import matcher, RequirementMatcher, RULES
+
+
+SAMPLE_REQUIREMENTS = [
+    "React, Vue.js 등 프론트엔드 프레임워크 경험 2년 이상",
+    "JavaScript/TypeScript 능숙",
+    "RESTful API 연동 경험",
+    "Java, Spring Framework 경험 3년 이상",
+    "RDBMS, NoSQL 활용 경험",
+    "대용량 트래픽 처리 경험",
+    "Kotlin 또는 Swift 기반 모바일 앱 출시 경험",
+    "팀 프로젝트 리딩 경험",
+    "TOEIC 800점 이상",
+    "정보처리기사 자격증 보유",
+    "웹 성능 최적화 경험",
+    "MSA 아키텍처 이해",
+]
+
+
+def make_naive_match(rules):
+    """규칙 순서대로 키워드마다 문자열 전체를 다시 검사 (기존 if/elif 방식)"""
+    def naive_match(requirement):
+        lowered = requirement.lower()
+        for rule in rules:
+            for keyword in rule["keywords"]:
+                if keyword.lower() in lowered:
+                    return rule["category"]
+        return None
+    return naive_match
+
+
+def extended_rules(extra_keywords):
+    """규칙 수 증가에 따른 비교용: 기존 규칙 뒤에 가상 키워드 규칙 추가"""
+    extra = [
+        {"category": f"extra_{i}", "keywords": [f"skill{i}", f"기술{i}"]}
+        for i in range(extra_keywords // 2)
+    ]
+    return RULES + extra
+
+
+def bench(name, func, requirements, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for requirement in requirements:
+            func(requirement)
+        best = min(best, time.perf_counter() - started)
+
+    print(f"{name:<24} {best * 1000:8.2f} ms  {len(requirements) / best:12,.0f} req/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    random.seed(42)
+    requirements = [
+        f"{random.choice(SAMPLE_REQUIREMENTS)} ({random.randint(1, 10)}년 이상 우대)"
+        for _ in range(count)
+    ]
+
+    print("=" * 60)
+    print(f"요구사항 매칭 벤치마크 ({count:,}건, 키워드 {sum(len(rule['keywords']) for rule in RULES)}개)")
+    print(f"오토마톤: {type(matcher._automaton).__module__}.{type(matcher._automaton).__name__}")
+    print("=" * 60)
+
+    bench("키워드별 in 검사", make_naive_match(RULES), requirements)
+    bench("matcher.match", matcher.match, requirements)
+    bench("matcher.task_for", matcher.task_for, requirements)
+
+    started = time.perf_counter()
+    matcher.match_many(requirements)
+    elapsed = time.perf_counter() - started
+    print(f"{'matcher.match_many':<24} {elapsed * 1000:8.2f} ms  {count / elapsed:12,.0f} req/s")
+
+    # 규칙이 늘어날수록 키워드별 검사는 선형으로 느려지고 컴파일된 매처는 거의 일정
+    for extra_keywords in (100, 500):
+        rules = extended_rules(extra_keywords)
+        print(f"\n--- 가상 키워드 {extra_keywords}개 추가 ---")
+        bench("키워드별 in 검사", make_naive_match(rules), requirements)
+        bench("RequirementMatcher.match", RequirementMatcher(rules).match, requirements)
+
+
+if __name__ == "__main__":
+    main()
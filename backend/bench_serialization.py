@@ -0,0 +1,97 @@
+"""
+목록 응답 직렬화 마이크로 벤치마크
+
+DB 행 N개를 응답 바이트로 만드는 비용을 비교한다.
+- FastAPI 기본 경로: response_model 검증 + jsonable_encoder + 표준 json
+- response_model 검증 + orjson (default_response_class=ORJSONResponse 만 적용한 경우)
+- 검증 생략 경로: trusted_rows + orjson (utils/serialization.py)
+
+사용법:
+    python bench_serialization.py [행 수]
+"""
+import sys
+import json
+import time
+import asyncio
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from models.schemas import Task, Goal, JobPosting
+from utils.serialization import trusted_rows
+
+
+def make_rows(model, count):
+    """PostgREST 가 돌려주는 형태의 행 (날짜는 ISO 문자열)"""
+    samples = {
+        Task: lambda i: {
+            "id": i, "user_id": "user-1", "goal_id": 1, "title": f"React 학습 {i}",
+            "description": "프론트엔드 프레임워크 학습 및 프로젝트 개발", "due_date": "2025-03-01",
+            "is_completed": i % 3 == 0, "completed_at": None, "priority": "high", "order_index": i,
+            "created_at": "2025-01-01T09:00:00.123456+00:00", "updated_at": "2025-01-02T09:00:00.123456+00:00"
+        },
+        Goal: lambda i: {
+            "id": i, "user_id": "user-1", "job_title": "프론트엔드 개발자", "company_name": "네이버",
+            "location": "성남", "deadline": "2025-03-01", "experience_level": "신입",
+            "requirements": ["React 경험", "TypeScript 능숙", "RESTful API 연동 경험"],
+            "preferred": ["TOEIC 800점 이상"], "is_active": True,
+            "created_at": "2025-01-01T09:00:00.123456+00:00", "updated_at": "2025-01-02T09:00:00.123456+00:00"
+        },
+        JobPosting: lambda i: {
+            "id": i, "company": "카카오", "title": f"백엔드 개발자 {i}", "description": "대용량 트래픽 서비스 개발",
+            "url": f"https://example.com/jobs/{i}", "requirements": ["Java, Spring 경험 3년 이상", "RDBMS 활용 경험"],
+            "preferred": ["MSA 아키텍처 이해"], "location": "판교", "experience_level": "경력", "is_active": True,
+            "created_at": "2025-01-01T09:00:00.123456+00:00", "updated_at": "2025-01-02T09:00:00.123456+00:00"
+        }
+    }
+    return [samples[model](i) for i in range(count)]
+
+
+async def fastapi_path(field, rows, response_class):
+    content = await serialize_response(field=field, response_content=rows)
+    return response_class(content).body
+
+
+def trusted_path(model, rows):
+    return ORJSONResponse(trusted_rows(model, rows)).body
+
+
+def bench(name, func, count, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func()
+        best = min(best, time.perf_counter() - started)
+
+    print(f"  {name:<28} {best * 1000:8.2f} ms  {best / count * 1e6:7.2f} µs/행  {len(body):>10,} bytes")
+    return body
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    loop = asyncio.new_event_loop()
+
+    print("=" * 72)
+    print(f"목록 응답 직렬화 벤치마크 ({count:,}행)")
+    print("=" * 72)
+
+    for model in (Task, Goal, JobPosting):
+        rows = make_rows(model, count)
+        field = create_response_field(name=f"bench_{model.__name__}", type_=List[model])
+
+        print(f"\n--- List[{model.__name__}] ---")
+        baseline = bench("검증 + 표준 json", lambda: loop.run_until_complete(fastapi_path(field, rows, JSONResponse)), count)
+        bench("검증 + orjson", lambda: loop.run_until_complete(fastapi_path(field, rows, ORJSONResponse)), count)
+        fast = bench("검증 생략 + orjson", lambda: trusted_path(model, rows), count)
+
+        # 두 경로의 응답 내용이 같은지 확인 (pydantic 은 UTC 를 "Z", DB 원본은 "+00:00" 로 표기)
+        same = json.loads(baseline.replace(b"Z\"", b"+00:00\"")) == json.loads(fast)
+        print(f"  응답 내용 일치: {'예' if same else '아니오 (표기 차이 확인 필요)'}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+앱 시작(임포트) 시간 예산 확인
+
+`python -X importtime` 으로 `import main` 과 `create_app()` 의 임포트 시간을 새 프로세스에서 측정하고,
+예산을 넘거나 임포트 시점에 네트워크 클라이언트가 만들어지면 실패(exit 1)한다.
+오토스케일로 새 인스턴스가 뜰 때 요청을 받기까지의 시간을 늘리는 변경을 배포 전에 잡기 위한 스크립트이다.
+
+사용법:
+    python check_import_time.py [--budget-ms 2000] [--top 15]
+    (같은 검사를 pytest 로도 실행: tests/test_import_time.py)
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# 임포트만으로 생성되면 안 되는 것들을 확인하고 결과를 JSON 한 줄로 출력
+PROBE = """
+import sys, json
+import main
+imported_on_import = sorted(m for m in sys.modules if m.startswith("routers."))
+main.create_app()
+import config.database as database
+print(json.dumps({
+    "routers_on_import": imported_on_import,
+    "sync_client_created": database._supabase is not None,
+    "async_client_created": database.db._client is not None,
+    "supabase_imported": "supabase" in sys.modules
+}))
+"""
+
+
+def parse_importtime(stderr: str):
+    """-X importtime 출력 → (최상위 모듈 누적 시간 합(ms), [(누적 ms, 모듈)])"""
+    modules = []
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0:
+            total_us += int(cumulative)
+        if depth <= 1:
+            modules.append((int(cumulative) / 1000, name.strip()))
+    return total_us / 1000, sorted(modules, reverse=True)
+
+
+def measure_import_time():
+    """새 프로세스에서 PROBE 실행 → (지연 초기화 확인 결과, 임포트 시간 합(ms), [(누적 ms, 모듈)])"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"앱 생성 실패\n{result.stderr[-2000:]}")
+
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    total_ms, modules = parse_importtime(result.stderr)
+    return probe, total_ms, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import main / create_app() 임포트 시간 예산 확인")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", 2000)))
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    try:
+        probe, total_ms, modules = measure_import_time()
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"임포트 시간: {total_ms:,.0f} ms (예산 {args.budget_ms:,.0f} ms)")
+    print("=" * 60)
+    for cumulative_ms, name in modules[:args.top]:
+        print(f"  {cumulative_ms:8.1f} ms  {name}")
+    print()
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"임포트 시간 예산 초과: {total_ms:,.0f} ms > {args.budget_ms:,.0f} ms")
+    if probe["routers_on_import"]:
+        failures.append(f"import main 만으로 라우터 임포트: {', '.join(probe['routers_on_import'])}")
+    if probe["sync_client_created"] or probe["supabase_imported"]:
+        failures.append("앱 생성 시 스크립트용 동기 Supabase 클라이언트를 임포트/생성함")
+    if probe["async_client_created"]:
+        failures.append("lifespan 이전에 PostgREST 커넥션 풀 생성")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✓ 임포트 시간 예산 및 지연 초기화 확인 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+PostgREST 호출용 httpx 커넥션 풀 설정과 지표
+
+- 풀 크기, keep-alive 유지 시간, HTTP/2, 타임아웃, 재시도를 환경변수로 설정한다
+- keep-alive 기본값(httpx 5초)은 트래픽이 몰렸다 빠질 때마다 연결을 닫고 다시 TLS 핸드셰이크를 하게 되므로
+  기본 60초로 늘린다
+- 전송 계층에서 사용 중/유휴 연결 수, 풀 대기 시간, 새 연결(재연결)/TLS 핸드셰이크 수,
+  호출 지연(응답 헤더 수신까지)을 집계한다
+- 호출이 끝날 때마다(응답 본문 수신 완료 시) query_listeners 에 (테이블, 작업, 소요 초, 상태 코드)를 알린다
+"""
+import os
+import time
+import asyncio
+from typing import Callable, List, Optional
+
+import httpx
+
+
+# 연결 실패는 요청이 서버에 도달하지 않았으므로 항상 재시도,
+# 읽기 중 끊김(서버가 닫은 keep-alive 연결 등)은 멱등 요청만 재시도
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+READ_ERRORS = (httpx.ReadError, httpx.RemoteProtocolError)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# HTTP 메서드 → PostgREST 작업 (POST 는 describe_query 에서 insert/upsert/rpc 로 구분)
+QUERY_OPERATIONS = {"GET": "select", "HEAD": "select", "PATCH": "update", "PUT": "upsert", "DELETE": "delete"}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+def pool_settings_from_env() -> dict:
+    """DB_POOL_* / DB_*_TIMEOUT / DB_HTTP2 / DB_RETRIES 환경변수로 풀 설정"""
+    return {
+        "max_connections": int(os.getenv("DB_POOL_MAX_CONNECTIONS", 100)),
+        "max_keepalive_connections": int(os.getenv("DB_POOL_MAX_KEEPALIVE", 20)),
+        "keepalive_expiry": float(os.getenv("DB_POOL_KEEPALIVE_EXPIRY", 60)),
+        "http2": _env_bool("DB_HTTP2", True),
+        "connect_timeout": float(os.getenv("DB_CONNECT_TIMEOUT", 5)),
+        "read_timeout": float(os.getenv("DB_READ_TIMEOUT", 30)),
+        "write_timeout": float(os.getenv("DB_WRITE_TIMEOUT", 30)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 10)),
+        "retries": int(os.getenv("DB_RETRIES", 2)),
+        "retry_backoff": float(os.getenv("DB_RETRY_BACKOFF", 0.1))
+    }
+
+
+def describe_query(request: httpx.Request) -> tuple:
+    """PostgREST 요청 → (테이블 또는 RPC 함수 이름, 작업 종류)"""
+    path = request.url.path.split("/rest/v1/", 1)[-1].strip("/")
+    if path.startswith("rpc/"):
+        return path[len("rpc/"):], "rpc"
+    if request.method == "POST":
+        prefer = request.headers.get("prefer", "")
+        return path, "upsert" if "resolution=" in prefer else "insert"
+    return path, QUERY_OPERATIONS.get(request.method, request.method.lower())
+
+
+class _ObservedStream(httpx.AsyncByteStream):
+    """응답 본문 스트림이 닫힐 때(본문 수신 완료/중단) 한 번 콜백 호출"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+def build_timeout(settings: dict) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=settings["connect_timeout"],
+        read=settings["read_timeout"],
+        write=settings["write_timeout"],
+        pool=settings["pool_timeout"]
+    )
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """풀 지표를 기록하고 재시도 정책을 적용하는 httpx 전송 계층"""
+
+    def __init__(self, settings: dict, query_listeners: Optional[List[Callable]] = None):
+        super().__init__(
+            http2=settings["http2"],
+            limits=httpx.Limits(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_keepalive_connections"],
+                keepalive_expiry=settings["keepalive_expiry"]
+            )
+        )
+        self.settings = settings
+        # 호출 완료 알림 대상 (utils/request_timing.record_query 등), Database 와 같은 리스트를 공유
+        self.query_listeners = query_listeners if query_listeners is not None else []
+
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.query_listeners:
+            return await self._request_with_retries(request)
+
+        started = time.perf_counter()
+        table, operation = describe_query(request)
+
+        def notify(status_code: int):
+            elapsed = time.perf_counter() - started
+            for listener in self.query_listeners:
+                listener(table, operation, elapsed, status_code)
+
+        try:
+            response = await self._request_with_retries(request)
+        except Exception:
+            notify(0)
+            raise
+        response.stream = _ObservedStream(response.stream, lambda: notify(response.status_code))
+        return response
+
+    async def _request_with_retries(self, request: httpx.Request) -> httpx.Response:
+        retries = self.settings["retries"]
+        attempt = 0
+        while True:
+            try:
+                return await self._timed_request(request)
+            except CONNECT_ERRORS + READ_ERRORS as e:
+                retryable = isinstance(e, CONNECT_ERRORS) or request.method in IDEMPOTENT_METHODS
+                if not retryable or attempt >= retries:
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self.settings["retry_backoff"] * (2 ** attempt))
+                attempt += 1
+
+    async def _timed_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        connect_started: Optional[float] = None
+        connect_seconds = 0.0
+        headers_sent: Optional[float] = None
+
+        async def trace(event: str, info: dict):
+            # httpcore 이벤트: 연결 생성/TLS 시간과 요청 헤더 전송 시각으로 풀 대기 시간 계산
+            nonlocal connect_started, connect_seconds, headers_sent
+            if event in ("connection.connect_tcp.started", "connection.start_tls.started", "http2.send_connection_init.started"):
+                connect_started = time.perf_counter()
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete", "http2.send_connection_init.complete"):
+                if connect_started is not None:
+                    connect_seconds += time.perf_counter() - connect_started
+                if event == "connection.connect_tcp.complete":
+                    self.new_connections += 1
+                elif event == "connection.start_tls.complete":
+                    self.tls_handshakes += 1
+            elif event.endswith("send_request_headers.started") and headers_sent is None:
+                headers_sent = time.perf_counter()
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            response = await super().handle_async_request(request)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.requests += 1
+            elapsed = time.perf_counter() - started
+            self.latency_seconds += elapsed
+            self.max_latency_seconds = max(self.max_latency_seconds, elapsed)
+            if headers_sent is not None:
+                waited = max(0.0, headers_sent - started - connect_seconds)
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return response
+
+    def stats(self) -> dict:
+        connections = list(self._pool.connections)
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "settings": self.settings,
+            "connections": len(connections),
+            "in_use_connections": len(connections) - idle,
+            "idle_connections": idle,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "avg_wait_ms": round(self.wait_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "avg_latency_ms": round(self.latency_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency_seconds * 1000, 2)
+        }
@@ -8,11 +8,14 @@
 4. 프로그래머스 (programmers.co.kr/job)
 """
 
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import httpx
+from postgrest.exceptions import APIError
 from supabase import create_client
 from dotenv import load_dotenv
+from utils.helpers import parse_job_requirements
 import os
 import random
 
@@ -204,45 +207,99 @@ def generate_more_jobs():
     return jobs
 
 
-def save_to_supabase(jobs):
-    """채용 공고를 Supabase에 저장"""
-    print(f"\n총 {len(jobs)}개의 채용 공고를 Supabase에 저장합니다...")
+RETRYABLE_STATUS_CODES = {"429", "500", "502", "503", "504"}
+
+
+def is_retryable_error(error):
+    """Rate limit(429) 또는 일시적인 서버/네트워크 오류인지 확인"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, APIError):
+        if str(error.code) in RETRYABLE_STATUS_CODES:
+            return True
+    message = str(error).lower()
+    return "rate limit" in message or "too many requests" in message
+
+
+def to_posting_row(job):
+    """크롤링한 공고를 job_postings 테이블 행으로 변환"""
+    return {
+        "company": job["company"],
+        "title": job["title"],
+        "description": job["description"],
+        "url": job["url"],
+        # jsonb 문자열 배열로 저장 (읽을 때 다시 파싱하지 않도록)
+        "requirements": parse_job_requirements(job["requirements"]),
+        "preferred": parse_job_requirements(job["preferred"]),
+        "location": job["location"],
+        "experience_level": job["experience_level"],
+        "is_active": True,
+        # API 서버의 검색 색인이 변경분을 감지하는 기준
+        "updated_at": datetime.utcnow().isoformat()
+    }
+
+
+def upsert_chunk(rows, max_retries=5, base_delay=0.5):
+    """한 청크를 url 기준으로 upsert (rate limit 시 지수 백오프 후 재시도)"""
+    for attempt in range(max_retries + 1):
+        try:
+            result = supabase.table("job_postings").upsert(rows, on_conflict="url").execute()
+            return len(result.data or [])
+        except Exception as e:
+            if attempt == max_retries or not is_retryable_error(e):
+                raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+            print(f"  ⏳ 재시도 {attempt + 1}/{max_retries} ({delay:.2f}초 후): {e}")
+            time.sleep(delay)
+
+
+def save_to_supabase(jobs, chunk_size=100, max_workers=4, max_retries=5):
+    """채용 공고를 Supabase에 저장 (url 기준 청크 단위 upsert)
+
+    Args:
+        jobs: 저장할 채용 공고 목록
+        chunk_size: 한 번의 요청으로 upsert할 행 수
+        max_workers: 동시에 실행할 요청 수
+        max_retries: rate limit/일시 오류 시 청크당 최대 재시도 횟수
+    """
+    # 같은 url이 한 요청에 두 번 들어가면 upsert가 실패하므로 마지막 값만 유지
+    rows = list({job["url"]: to_posting_row(job) for job in jobs}.values())
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    
+    print(f"\n총 {len(rows)}개의 채용 공고를 {len(chunks)}개 청크로 Supabase에 저장합니다...")
+    print(f"(chunk_size={chunk_size}, max_workers={max_workers}, max_retries={max_retries})")
     
     success_count = 0
     error_count = 0
+    started = time.perf_counter()
     
-    for idx, job in enumerate(jobs, 1):
+    def run_chunk(index, chunk):
+        chunk_started = time.perf_counter()
         try:
-            # requirements와 preferred를 JSON으로 변환
-            data = {
-                "company": job["company"],
-                "title": job["title"],
-                "description": job["description"],
-                "url": job["url"],
-                "requirements": json.dumps(job["requirements"], ensure_ascii=False),
-                "preferred": json.dumps(job["preferred"], ensure_ascii=False),
-                "location": job["location"],
-                "experience_level": job["experience_level"],
-                "is_active": True
-            }
-            
-            result = supabase.table("job_postings").insert(data).execute()
+            saved = upsert_chunk(chunk, max_retries=max_retries)
+            return index, saved, len(chunk) - saved, time.perf_counter() - chunk_started, None
+        except Exception as e:
+            return index, 0, len(chunk), time.perf_counter() - chunk_started, e
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_chunk, idx, chunk) for idx, chunk in enumerate(chunks, 1)]
+        
+        for future in as_completed(futures):
+            index, saved, failed, elapsed, error = future.result()
+            success_count += saved
+            error_count += failed
             
-            if result.data:
-                success_count += 1
-                print(f"[{idx}/{len(jobs)}] ✅ {job['company']} - {job['title']}")
+            rate = saved / elapsed if elapsed > 0 else 0
+            if error:
+                print(f"[청크 {index}/{len(chunks)}] ❌ 실패 {failed}개 ({elapsed:.2f}초): {error}")
             else:
-                error_count += 1
-                print(f"[{idx}/{len(jobs)}] ❌ {job['company']} - {job['title']} (저장 실패)")
-            
-            # API 호출 제한 방지
-            time.sleep(0.1)
-            
-        except Exception as e:
-            error_count += 1
-            print(f"[{idx}/{len(jobs)}] ❌ {job['company']} - {job['title']}: {str(e)}")
+                print(f"[청크 {index}/{len(chunks)}] ✅ 저장 {saved}개, 실패 {failed}개 ({elapsed:.2f}초, {rate:.1f} rows/sec)")
+    
+    total_elapsed = time.perf_counter() - started
+    throughput = success_count / total_elapsed if total_elapsed > 0 else 0
     
     print(f"\n완료! 성공: {success_count}개, 실패: {error_count}개")
+    print(f"소요 시간: {total_elapsed:.2f}초, 처리량: {throughput:.1f} rows/sec")
     return success_count, error_count
 
 
@@ -267,7 +324,12 @@ def main():
     
     # 4. Supabase에 저장
     print("\n[3단계] Supabase에 저장 중...")
-    success, errors = save_to_supabase(all_jobs)
+    success, errors = save_to_supabase(
+        all_jobs,
+        chunk_size=int(os.getenv("CRAWL_CHUNK_SIZE", 100)),
+        max_workers=int(os.getenv("CRAWL_MAX_WORKERS", 4)),
+        max_retries=int(os.getenv("CRAWL_MAX_RETRIES", 5))
+    )
     
     print("\n" + "=" * 60)
     print(f"작업 완료! 총 {success}개의 채용 공고가 저장되었습니다.")
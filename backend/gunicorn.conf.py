@@ -0,0 +1,87 @@
+"""
+운영 서버 설정 (gunicorn + uvicorn 워커)
+
+    gunicorn -c gunicorn.conf.py "main:create_app()"
+
+- 워커 수는 WEB_CONCURRENCY, 없으면 사용 가능한 CPU 코어 수
+- create_app()은 연결을 만들지 않으므로 마스터에서 미리 로드(preload)해 임포트 비용을 한 번만 치르고,
+  DB 커넥션 풀/색인/비밀번호 해시 풀은 포크 후 각 워커의 lifespan에서 만든다
+- 무중단 재시작: 마스터에 SIGHUP (`kill -HUP <pid>`) → 새 워커를 띄운 뒤 기존 워커를 정리
+- 메모리 누수/단편화 대비로 MAX_REQUESTS 건마다 워커를 교체 (지터로 동시에 교체되지 않게 함)
+- 채용 공고 색인은 워커마다 따로 가진다. 응답 캐시는 워커가 여럿이면 메모리 캐시를 끄므로(쓰기 후 다른 워커의
+  오래된 응답 방지) 캐시가 필요하면 CACHE_BACKEND=redis 사용
+- Prometheus 지표(/metrics)는 워커별로 PROMETHEUS_MULTIPROC_DIR 에 기록하고 스크레이프 시 합산한다
+  (앱보다 먼저 이 파일이 로드되므로 여기서 설정, 서버 시작 시 이전 실행의 파일을 비움)
+"""
+import os
+import glob
+import tempfile
+
+
+def default_workers() -> int:
+    """컨테이너 CPU 제한(cgroup 쿼터, affinity)을 반영한 코어 수"""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+
+    # cgroup v2 CPU 쿼터 (예: "50000 100000" → 0.5코어, 최소 1)
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cores = min(cores, max(1, -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return cores
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8000)}"
+workers = int(os.getenv("WEB_CONCURRENCY", default_workers()))
+# 앱(utils/cache.py)이 워커 수를 알 수 있도록 실제 값을 환경변수로 전달 (preload 전에 설정)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+
+max_requests = int(os.getenv("MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 1000))
+
+timeout = int(os.getenv("WORKER_TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("KEEPALIVE_SECONDS", 5))
+
+accesslog = "-"
+errorlog = "-"
+
+# prometheus_client 가 임포트되기 전(preload 포함)에 설정되어야 멀티 프로세스 모드로 동작
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "stepup-prometheus"))
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def on_starting(server):
+    # 이전 실행에서 남은 워커별 지표 파일 삭제 (재시작 후 카운터가 이어서 쌓이지 않도록)
+    for path in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], "*.db")):
+        os.remove(path)
+
+
+def when_ready(server):
+    if preload_app and not os.getenv("AUTH_TOKEN_SECRET"):
+        server.log.warning("AUTH_TOKEN_SECRET 미설정: 이 서버의 워커들은 마스터의 임시 키를 공유하지만 재시작/다른 인스턴스와는 호환되지 않습니다")
+
+
+def post_fork(server, worker):
+    """포크 후 워커별 자원 초기화 (마스터에서 만들어진 클라이언트를 물려받지 않도록)"""
+    from config import database
+
+    # 스크립트용 동기 클라이언트와 비동기 커넥션 풀은 워커에서 새로 생성
+    database._supabase = None
+    database.db._client = None
+    server.log.info(f"[Worker {worker.pid}] 워커 자원 초기화")
+
+
+def child_exit(server, worker):
+    """종료된 워커의 현재 값 지표(처리 중 요청 수, 대기열 등)를 합산에서 제외 (누적 카운터는 유지)"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -121,8 +121,8 @@ def check_and_create_tables():
             location VARCHAR(100),
             deadline DATE,
             experience_level VARCHAR(50),
-            requirements TEXT,
-            preferred TEXT,
+            requirements JSONB DEFAULT '[]'::jsonb,
+            preferred JSONB DEFAULT '[]'::jsonb,
             is_active BOOLEAN DEFAULT TRUE,
             created_at TIMESTAMP DEFAULT NOW(),
             updated_at TIMESTAMP DEFAULT NOW(),
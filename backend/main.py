@@ -1,11 +1,78 @@
+import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from routers import auth, users, specs, goals, tasks, job_postings, progress, stats, experiences, routines
+from config.database import load_env
 
-app = FastAPI(
-    title="스텝업(Step-Up) API",
-    version="1.0.0",
-    description="""
+
+def create_app() -> FastAPI:
+    """앱 생성
+
+    임포트만으로는 라우터/클라이언트를 만들지 않는다. 환경변수를 먼저 로드한 뒤 라우터를 임포트하고,
+    DB 커넥션 풀과 채용 공고 색인은 lifespan에서 만든다.
+    """
+    load_env()
+    
+    from config.database import db
+    from utils.cache import cache
+    from utils.job_index import job_index
+    from utils.job_recommender import job_recommender
+    from utils.password import password_hasher
+    from utils.request_timing import RequestTimingMiddleware, record_query
+    from utils.metrics import MetricsMiddleware, ProcessMetrics, record_db_query, render_metrics, CONTENT_TYPE_LATEST
+    from routers import auth, users, specs, goals, tasks, job_postings, progress, stats, experiences, routines
+    
+    process_metrics = ProcessMetrics(cache, password_hasher, db)
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # 공유 DB 커넥션 풀 생성/종료
+        await db.connect()
+        
+        # 요청별 DB 호출 수/누적 시간 집계 (Server-Timing 헤더, 요청 로그)
+        db.query_listeners.append(record_query)
+        db.query_listeners.append(record_db_query)
+        
+        if not os.getenv("AUTH_TOKEN_SECRET"):
+            # 여러 워커/인스턴스에서는 반드시 같은 키를 설정해야 다른 프로세스가 발급한 토큰을 검증할 수 있다
+            print("[Auth] AUTH_TOKEN_SECRET 이 없어 임시 키를 사용합니다 (재시작 시 기존 토큰 무효)")
+        
+        # 채용 공고 검색 색인 생성 후 주기적으로 변경분 반영 (실패 시 기존 전체 검색으로 동작)
+        # 추천용 스킬 × 공고 행렬도 같은 변경분으로 갱신 (동기화가 끝날 때 스레드에서 다시 만들어 교체)
+        # 색인 생성은 백그라운드에서 진행해 새 인스턴스가 바로 요청을 받을 수 있게 한다
+        job_index.listeners.append(job_recommender)
+        
+        async def build_job_index():
+            try:
+                await job_index.build(db)
+            except Exception as e:
+                print(f"[JobIndex] 색인 생성 실패: {e}")
+            await job_index.run_refresh_loop(db, float(os.getenv("JOB_INDEX_REFRESH_SECONDS", 60)))
+        
+        index_task = asyncio.create_task(build_job_index())
+        
+        # 캐시/비밀번호 해시 풀/커넥션 풀 상태를 주기적으로 Prometheus 지표에 반영
+        metrics_task = asyncio.create_task(process_metrics.run_sync_loop(float(os.getenv("METRICS_SYNC_SECONDS", 5))))
+        
+        yield
+        
+        index_task.cancel()
+        metrics_task.cancel()
+        job_index.listeners.remove(job_recommender)
+        db.query_listeners.remove(record_query)
+        db.query_listeners.remove(record_db_query)
+        password_hasher.shutdown()
+        await db.disconnect()
+    
+    # 응답 JSON 인코딩은 orjson 사용 (utils/serialization.py 의 검증 생략 경로와 같은 인코더)
+    app = FastAPI(
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        title="스텝업(Step-Up) API",
+        version="1.0.0",
+        description="""
     맞춤형 취업 로드맵 설계 서비스 '스텝업(Step-Up)' REST API
     
     ## 개요
@@ -13,48 +80,96 @@ app = FastAPI(
     달성을 위한 구체적인 로드맵을 제공하는 취업 준비 관리 서비스입니다.
     
     ## 인증
-    간단한 구현을 위해 JWT 토큰 대신 `x-user-id` 헤더를 사용합니다.
-    모든 API 요청 시 `x-user-id` 헤더에 사용자 ID를 포함해야 합니다.
+    `POST /auth/login` 으로 발급받은 토큰을 `Authorization: Bearer <토큰>` 헤더에 포함합니다.
+    전환 기간 동안 기존 `x-user-id` 헤더도 허용됩니다.
     """,
-    contact={
-        "name": "Step-Up API Support",
-        "email": "support@stepup.com"
-    }
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(specs.router)
-app.include_router(goals.router)
-app.include_router(tasks.router)
-app.include_router(job_postings.router)
-app.include_router(progress.router)
-app.include_router(stats.router)
-app.include_router(experiences.router)
-app.include_router(routines.router)
-
-
-@app.get("/")
-async def root():
-    return {
-        "message": "스텝업(Step-Up) API 서버",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+        contact={
+            "name": "Step-Up API Support",
+            "email": "support@stepup.com"
+        }
+    )
+    
+    # 요청별 처리 시간/DB 호출 집계 (나중에 추가한 CORS가 바깥에서 preflight를 처리하므로 라우트 요청만 측정)
+    app.add_middleware(RequestTimingMiddleware)
+    
+    # 라우트/상태 코드별 요청 수, 지연 히스토그램, 처리 중 요청 수 (/metrics)
+    app.add_middleware(MetricsMiddleware)
+    
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # 브라우저 개발자 도구에서 다른 출처 요청의 서버 처리 시간도 볼 수 있게 노출
+        expose_headers=["Server-Timing"],
+    )
+    
+    app.include_router(auth.router)
+    app.include_router(users.router)
+    app.include_router(specs.router)
+    app.include_router(goals.router)
+    app.include_router(tasks.router)
+    app.include_router(job_postings.router)
+    app.include_router(progress.router)
+    app.include_router(stats.router)
+    app.include_router(experiences.router)
+    app.include_router(routines.router)
+    
+    @app.get("/")
+    async def root():
+        return {
+            "message": "스텝업(Step-Up) API 서버",
+            "version": "1.0.0",
+            "docs": "/docs",
+            "redoc": "/redoc"
+        }
+    
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+    
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 지표 (gunicorn 멀티 워커면 모든 워커 합산)"""
+        process_metrics.sync()
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+    
+    @app.get("/health/cache")
+    async def cache_stats():
+        """응답 캐시 hit/miss 지표"""
+        return cache.stats()
+    
+    @app.get("/health/db-pool")
+    async def db_pool_stats():
+        """PostgREST 커넥션 풀 사용 중/유휴 연결, 대기 시간, 재연결 지표"""
+        return db.pool_stats()
+    
+    @app.get("/health/password-hasher")
+    async def password_hasher_stats():
+        """비밀번호 해시 풀 대기열/지연 지표"""
+        return password_hasher.stats()
+    
+    @app.get("/health/job-index")
+    async def job_index_stats():
+        """채용 공고 검색 색인 상태"""
+        return {
+            "ready": job_index.ready,
+            "postings": len(job_index),
+            "recommendable_postings": len(job_recommender),
+            "last_synced_at": job_index.last_synced_at
+        }
+    
+    return app
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+def __getattr__(name: str):
+    # `uvicorn main:app` 호환: main.app 에 처음 접근할 때 앱 생성 (main 임포트만으로는 생성하지 않음)
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # if __name__ == "__main__":
@@ -104,8 +104,8 @@ CREATE TABLE IF NOT EXISTS goals (
     location VARCHAR(100),
     deadline DATE,
     experience_level VARCHAR(50),
-    requirements TEXT,
-    preferred TEXT,
+    requirements JSONB DEFAULT '[]'::jsonb,
+    preferred JSONB DEFAULT '[]'::jsonb,
     is_active BOOLEAN DEFAULT TRUE,
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW(),
@@ -152,6 +152,20 @@ CREATE TABLE IF NOT EXISTS job_postings (
 
 CREATE INDEX IF NOT EXISTS idx_job_postings_is_active ON job_postings(is_active);
 CREATE INDEX IF NOT EXISTS idx_job_postings_company ON job_postings(company);
+-- 크롤러의 url 기준 upsert(on_conflict=url)를 위한 유니크 인덱스
+-- 기존 크롤러가 같은 url 을 여러 번 저장했을 수 있으므로 url 별 최신 행만 남긴 뒤 생성
+DELETE FROM job_postings
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY url ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id DESC
+        ) AS row_rank
+        FROM job_postings
+        WHERE url IS NOT NULL
+    ) ranked
+    WHERE row_rank > 1
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_job_postings_url ON job_postings(url);
 
 -- 초기 채용 공고 데이터
 INSERT INTO job_postings (company, title, description, url, requirements, preferred, location, experience_level, is_active) VALUES
@@ -189,4 +203,449 @@ INSERT INTO job_postings (company, title, description, url, requirements, prefer
   '성남시 분당구',
   '3년 이상',
   true
+)
+-- 마이그레이션을 다시 실행해도 이후 섹션이 적용되도록 이미 있는 공고는 건너뜀
+ON CONFLICT (url) DO NOTHING;
+
+-- 11. 대시보드 통계 집계 함수 (GET /stats/dashboard)
+-- 태스크 전체를 내려받지 않고 DB에서 집계한 요약 1행만 반환
+CREATE OR REPLACE FUNCTION get_dashboard_stats(p_user_id VARCHAR, p_today DATE)
+RETURNS TABLE (
+    total_goals BIGINT,
+    active_goal JSON,
+    total_tasks BIGINT,
+    completed_tasks BIGINT,
+    pending_tasks BIGINT,
+    high_priority BIGINT,
+    medium_priority BIGINT,
+    low_priority BIGINT,
+    today_tasks BIGINT,
+    this_week_tasks BIGINT,
+    overdue_tasks BIGINT,
+    recent_activity JSON
+)
+LANGUAGE sql STABLE
+AS $$
+    WITH task_counts AS (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE is_completed) AS completed,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE) AS pending,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND priority = 'high') AS high,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND priority = 'medium') AS medium,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND priority = 'low') AS low,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND due_date = p_today) AS today,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND due_date <= p_today + 7) AS this_week,
+            COUNT(*) FILTER (WHERE is_completed IS NOT TRUE AND due_date < p_today) AS overdue
+        FROM tasks
+        WHERE user_id = p_user_id
+    ),
+    daily_completed AS (
+        SELECT completed_at::date AS day, COUNT(*) AS completed
+        FROM tasks
+        WHERE user_id = p_user_id
+          AND is_completed
+          AND completed_at >= p_today - 6
+          AND completed_at < p_today + 1
+        GROUP BY completed_at::date
+    )
+    SELECT
+        (SELECT COUNT(*) FROM goals WHERE user_id = p_user_id),
+        (SELECT row_to_json(g) FROM goals g WHERE g.user_id = p_user_id AND g.is_active LIMIT 1),
+        tc.total,
+        tc.completed,
+        tc.pending,
+        tc.high,
+        tc.medium,
+        tc.low,
+        tc.today,
+        tc.this_week,
+        tc.overdue,
+        (
+            SELECT json_agg(
+                json_build_object('date', d.day, 'completed_tasks', COALESCE(dc.completed, 0))
+                ORDER BY d.day DESC
+            )
+            FROM (SELECT p_today - offset_days AS day FROM generate_series(0, 6) AS offset_days) d
+            LEFT JOIN daily_completed dc ON dc.day = d.day
+        )
+    FROM task_counts tc;
+$$;
+
+-- 12. 채용 공고 목록 조회 (GET /job-postings) 키셋 페이지네이션 / 키워드 검색
+-- (created_at, id) 내림차순 키셋 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_job_postings_created_at_id ON job_postings(created_at DESC, id DESC);
+
+-- 키워드 검색 대상(제목, 설명, 회사명, 자격요건, 우대사항)을 소문자 텍스트 한 컬럼으로 유지
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION job_requirement_texts(p_items JSONB)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT COALESCE(string_agg(
+        CASE
+            WHEN jsonb_typeof(item) = 'object' AND item ? 'description' THEN item->>'description'
+            WHEN jsonb_typeof(item) = 'string' THEN item #>> '{}'
+            ELSE item::text
+        END, E'\n'), '')
+    FROM jsonb_array_elements(CASE WHEN jsonb_typeof(p_items) = 'array' THEN p_items ELSE '[]'::jsonb END) AS item;
+$$;
+
+ALTER TABLE job_postings ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (
+    lower(
+        COALESCE(title, '') || E'\n' || COALESCE(description, '') || E'\n' || COALESCE(company, '') || E'\n' ||
+        job_requirement_texts(requirements) || E'\n' || job_requirement_texts(preferred)
+    )
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_job_postings_search_text ON job_postings USING GIN (search_text gin_trgm_ops);
+
+-- 13. 경험 목록 검색 (GET /experiences?search=)
+-- 제목, 배운 점, 어려웠던 점, 해결 과정, 태그를 소문자 텍스트 한 컬럼으로 유지하고 트라이그램 인덱스로 부분 일치 검색
+CREATE OR REPLACE FUNCTION experience_search_text(
+    p_title TEXT, p_learned TEXT, p_challenges TEXT, p_solutions TEXT, p_tags TEXT[]
+)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT lower(
+        COALESCE(p_title, '') || E'\n' || COALESCE(p_learned, '') || E'\n' ||
+        COALESCE(p_challenges, '') || E'\n' || COALESCE(p_solutions, '') || E'\n' ||
+        COALESCE(array_to_string(p_tags, E'\n'), '')
+    );
+$$;
+
+ALTER TABLE experiences ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (
+    experience_search_text(title, learned, challenges, solutions, tags)
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_experiences_search_text ON experiences USING GIN (search_text gin_trgm_ops);
+-- 목록 정렬 + range 페이지네이션용
+CREATE INDEX IF NOT EXISTS idx_experiences_user_completed ON experiences(user_id, completed_date DESC, id DESC);
+
+-- 14. 경험 태그/카테고리 통계 요약 (GET /experiences/tags/list, /experiences/stats/overview)
+-- experiences 변경 시 트리거가 증감분만 반영하므로 조회는 사용자 태그 수만큼만 읽는다
+-- (경험 생성/수정/삭제 API와 태스크 완료 회고 경로 모두 같은 트리거로 갱신)
+CREATE TABLE IF NOT EXISTS experience_tag_stats (
+    user_id VARCHAR(50) NOT NULL,
+    tag TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    last_used TIMESTAMP,
+    PRIMARY KEY (user_id, tag)
+);
+
+CREATE TABLE IF NOT EXISTS experience_category_stats (
+    user_id VARCHAR(50) NOT NULL,
+    category VARCHAR(100) NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, category)
 );
+
+CREATE OR REPLACE FUNCTION apply_experience_stats()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.user_id IS NOT DISTINCT FROM NEW.user_id
+        AND OLD.category IS NOT DISTINCT FROM NEW.category
+        AND OLD.tags IS NOT DISTINCT FROM NEW.tags
+        AND OLD.completed_date IS NOT DISTINCT FROM NEW.completed_date THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE experience_category_stats
+        SET count = count - 1
+        WHERE user_id = OLD.user_id AND category = COALESCE(OLD.category, '기타');
+
+        UPDATE experience_tag_stats s
+        SET count = s.count - t.cnt
+        FROM (SELECT tag, COUNT(*) AS cnt FROM unnest(OLD.tags) AS tag GROUP BY tag) t
+        WHERE s.user_id = OLD.user_id AND s.tag = t.tag;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO experience_category_stats (user_id, category, count)
+        VALUES (NEW.user_id, COALESCE(NEW.category, '기타'), 1)
+        ON CONFLICT (user_id, category) DO UPDATE SET count = experience_category_stats.count + 1;
+
+        INSERT INTO experience_tag_stats (user_id, tag, count, last_used)
+        SELECT NEW.user_id, tag, COUNT(*), NEW.completed_date
+        FROM unnest(NEW.tags) AS tag
+        GROUP BY tag
+        ON CONFLICT (user_id, tag) DO UPDATE SET
+            count = experience_tag_stats.count + EXCLUDED.count,
+            last_used = GREATEST(experience_tag_stats.last_used, EXCLUDED.last_used);
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM experience_category_stats WHERE user_id = OLD.user_id AND count <= 0;
+        DELETE FROM experience_tag_stats WHERE user_id = OLD.user_id AND count <= 0;
+
+        -- 빠진 경험이 마지막 사용일이었던 태그만 최근 사용일 재계산
+        UPDATE experience_tag_stats s
+        SET last_used = (
+            SELECT MAX(e.completed_date) FROM experiences e
+            WHERE e.user_id = s.user_id AND e.tags @> ARRAY[s.tag]
+        )
+        WHERE s.user_id = OLD.user_id AND s.tag = ANY(OLD.tags) AND s.last_used <= OLD.completed_date;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_experience_stats ON experiences;
+CREATE TRIGGER trg_experience_stats
+AFTER INSERT OR UPDATE OR DELETE ON experiences
+FOR EACH ROW EXECUTE FUNCTION apply_experience_stats();
+
+-- 기존 경험으로 요약 테이블 초기화
+INSERT INTO experience_category_stats (user_id, category, count)
+SELECT user_id, COALESCE(category, '기타'), COUNT(*) FROM experiences GROUP BY user_id, COALESCE(category, '기타')
+ON CONFLICT (user_id, category) DO UPDATE SET count = EXCLUDED.count;
+
+INSERT INTO experience_tag_stats (user_id, tag, count, last_used)
+SELECT e.user_id, tag, COUNT(*), MAX(e.completed_date)
+FROM experiences e, unnest(e.tags) AS tag
+GROUP BY e.user_id, tag
+ON CONFLICT (user_id, tag) DO UPDATE SET count = EXCLUDED.count, last_used = EXCLUDED.last_used;
+
+-- 15. 요구사항/우대사항을 jsonb 문자열 배열로 통일 (job_postings, goals)
+-- 이전 형식(JSON 문자열, {"description": ...} 객체 배열)을 문자열 배열로 변환해 읽을 때 다시 파싱하지 않도록 함
+CREATE OR REPLACE FUNCTION normalize_requirement_list(p_items JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    v_items JSONB := p_items;
+BEGIN
+    -- JSON 텍스트가 jsonb 문자열로 저장된 행
+    IF jsonb_typeof(v_items) = 'string' THEN
+        BEGIN
+            v_items := (v_items #>> '{}')::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN jsonb_build_array(p_items #>> '{}');
+        END;
+    END IF;
+
+    IF v_items IS NULL OR jsonb_typeof(v_items) <> 'array' THEN
+        RETURN '[]'::jsonb;
+    END IF;
+
+    RETURN COALESCE((
+        SELECT jsonb_agg(
+            CASE
+                WHEN jsonb_typeof(item) = 'object' AND item ? 'description' THEN to_jsonb(item->>'description')
+                WHEN jsonb_typeof(item) = 'string' THEN item
+                ELSE to_jsonb(item #>> '{}')
+            END ORDER BY ordinality)
+        FROM jsonb_array_elements(v_items) WITH ORDINALITY AS t(item, ordinality)
+    ), '[]'::jsonb);
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION text_to_requirement_list(p_value TEXT)
+RETURNS JSONB
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+BEGIN
+    IF p_value IS NULL OR p_value = '' THEN
+        RETURN '[]'::jsonb;
+    END IF;
+    RETURN normalize_requirement_list(p_value::jsonb);
+EXCEPTION WHEN others THEN
+    RETURN jsonb_build_array(p_value);
+END;
+$$;
+
+-- goals: TEXT(JSON 문자열) → JSONB 문자열 배열
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'goals' AND column_name = 'requirements') = 'text' THEN
+        ALTER TABLE goals
+            ALTER COLUMN requirements TYPE JSONB USING text_to_requirement_list(requirements),
+            ALTER COLUMN preferred TYPE JSONB USING text_to_requirement_list(preferred);
+        ALTER TABLE goals
+            ALTER COLUMN requirements SET DEFAULT '[]'::jsonb,
+            ALTER COLUMN preferred SET DEFAULT '[]'::jsonb;
+    END IF;
+END;
+$$;
+
+-- 이미 JSONB인 컬럼은 값만 정규화 (바뀌는 행만 갱신, 반복 실행 가능)
+UPDATE goals
+SET requirements = normalize_requirement_list(requirements),
+    preferred = normalize_requirement_list(preferred)
+WHERE requirements IS DISTINCT FROM normalize_requirement_list(requirements)
+   OR preferred IS DISTINCT FROM normalize_requirement_list(preferred);
+
+UPDATE job_postings
+SET requirements = normalize_requirement_list(requirements),
+    preferred = normalize_requirement_list(preferred),
+    updated_at = NOW()
+WHERE requirements IS DISTINCT FROM normalize_requirement_list(requirements)
+   OR preferred IS DISTINCT FROM normalize_requirement_list(preferred);
+
+ALTER TABLE job_postings
+    ALTER COLUMN requirements SET DEFAULT '[]'::jsonb,
+    ALTER COLUMN preferred SET DEFAULT '[]'::jsonb;
+
+-- 16. 여러 단계 쓰기를 한 번의 RPC 호출(한 트랜잭션)로 처리
+-- 회원가입: users + user_specs (아이디 중복이면 아무것도 쓰지 않고 created = false)
+CREATE OR REPLACE FUNCTION register_user(p_user_id VARCHAR, p_password VARCHAR)
+RETURNS TABLE (created BOOLEAN)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO users (user_id, password)
+    VALUES (p_user_id, p_password)
+    ON CONFLICT (user_id) DO NOTHING;
+
+    IF NOT FOUND THEN
+        created := FALSE;
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    INSERT INTO user_specs (user_id, onboarding_completed) VALUES (p_user_id, FALSE);
+
+    created := TRUE;
+    RETURN NEXT;
+END;
+$$;
+
+-- 채용 공고에서 목표 생성: 기존 목표 비활성화 + 목표 생성 + 로드맵 태스크 일괄 생성
+-- 서버가 공고를 읽어 요구사항 매칭 엔진(matcher.task_for)으로 만든 태스크(p_tasks)와
+-- 그 기준이 된 요구사항(p_requirements, p_preferred)을 넘기면, 한 트랜잭션으로 저장만 한다.
+-- 그 사이 공고가 삭제되었으면 아무것도 쓰지 않고 result_status = 'not_found'.
+DROP FUNCTION IF EXISTS create_goal_from_job_posting(VARCHAR, BIGINT, JSONB, DATE);
+DROP FUNCTION IF EXISTS create_goal_from_job_posting(VARCHAR, BIGINT, JSONB, JSONB, JSONB);
+CREATE OR REPLACE FUNCTION create_goal_from_job_posting(
+    p_user_id VARCHAR, p_job_posting_id BIGINT, p_requirements JSONB, p_preferred JSONB, p_tasks JSONB
+)
+RETURNS TABLE (result_status TEXT, goal JSON)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_job job_postings%ROWTYPE;
+    v_goal goals%ROWTYPE;
+    v_max_order INTEGER;
+BEGIN
+    SELECT * INTO v_job FROM job_postings WHERE id = p_job_posting_id;
+    IF NOT FOUND THEN
+        result_status := 'not_found';
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    UPDATE goals SET is_active = FALSE WHERE user_id = p_user_id;
+
+    INSERT INTO goals (user_id, job_title, company_name, location, experience_level, requirements, preferred, is_active)
+    VALUES (
+        p_user_id, v_job.title, v_job.company, v_job.location, v_job.experience_level,
+        COALESCE(p_requirements, '[]'::jsonb), COALESCE(p_preferred, '[]'::jsonb), TRUE
+    )
+    RETURNING * INTO v_goal;
+
+    SELECT COALESCE(MAX(order_index), -1) INTO v_max_order FROM tasks WHERE user_id = p_user_id;
+
+    INSERT INTO tasks (user_id, goal_id, title, description, due_date, is_completed, priority, order_index)
+    SELECT
+        p_user_id, v_goal.id, t.item->>'title', t.item->>'description', (t.item->>'due_date')::DATE,
+        FALSE, t.item->>'priority', v_max_order + t.ordinality
+    FROM jsonb_array_elements(COALESCE(p_tasks, '[]'::jsonb)) WITH ORDINALITY AS t(item, ordinality);
+
+    result_status := 'created';
+    goal := row_to_json(v_goal);
+    RETURN NEXT;
+END;
+$$;
+
+-- 태스크 완료 + 회고 경험 생성 (태스크가 없으면 빈 결과)
+-- 경험 생성이 실패해도 태스크 완료는 유지하고 experience_error 에 사유를 담는다
+CREATE OR REPLACE FUNCTION complete_task(
+    p_user_id VARCHAR, p_task_id BIGINT, p_completed_at TIMESTAMP, p_experience JSONB
+)
+RETURNS TABLE (task JSON, experience JSON, experience_error TEXT)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_task tasks%ROWTYPE;
+    v_category TEXT;
+BEGIN
+    UPDATE tasks
+    SET is_completed = TRUE, completed_at = p_completed_at
+    WHERE id = p_task_id AND user_id = p_user_id
+    RETURNING * INTO v_task;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    task := row_to_json(v_task);
+
+    IF p_experience IS NOT NULL THEN
+        -- 카테고리는 태스크가 속한 목표의 직무명
+        SELECT g.job_title INTO v_category FROM goals g WHERE g.id = v_task.goal_id;
+
+        BEGIN
+            INSERT INTO experiences (
+                user_id, task_id, title, category, completed_date,
+                learned, challenges, solutions, improvements, tags, related_resources
+            )
+            SELECT
+                p_user_id, p_task_id, COALESCE(v_task.title, ''), COALESCE(v_category, '기타'), p_completed_at,
+                r.learned, r.challenges, r.solutions, r.improvements, r.tags, r.related_resources
+            FROM jsonb_populate_record(NULL::experiences, p_experience) r
+            RETURNING row_to_json(experiences.*) INTO experience;
+        EXCEPTION WHEN others THEN
+            experience_error := SQLERRM;
+        END;
+    END IF;
+
+    RETURN NEXT;
+END;
+$$;
+
+-- 17. 채용 공고 변경분 동기화 (서버 메모리 검색 색인/추천 행렬)
+-- 서버는 updated_at 이후 바뀐 공고만 다시 읽으므로 모든 수정에서 updated_at 을 갱신
+CREATE OR REPLACE FUNCTION touch_job_posting_updated_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_job_postings_updated_at ON job_postings;
+CREATE TRIGGER trg_job_postings_updated_at
+BEFORE UPDATE ON job_postings
+FOR EACH ROW EXECUTE FUNCTION touch_job_posting_updated_at();
+
+-- 삭제는 변경분으로 알 수 없으므로 공고 삭제는 is_active = false 로 대신한다 (soft delete)
+CREATE OR REPLACE FUNCTION soft_delete_job_posting()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE job_postings SET is_active = FALSE WHERE id = OLD.id AND is_active IS DISTINCT FROM FALSE;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_job_postings_soft_delete ON job_postings;
+CREATE TRIGGER trg_job_postings_soft_delete
+BEFORE DELETE ON job_postings
+FOR EACH ROW EXECUTE FUNCTION soft_delete_job_posting();
+
+CREATE INDEX IF NOT EXISTS idx_job_postings_updated_at ON job_postings(updated_at);
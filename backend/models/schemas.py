@@ -1,30 +1,35 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime, date
 
 
-class Error(BaseModel):
+class Schema(BaseModel):
+    """요청/응답 모델 공통 기반 (검증 스키마는 라우트 등록 등 처음 쓸 때 생성해 앱 시작 시간을 줄임)"""
+    model_config = ConfigDict(defer_build=True)
+
+
+class Error(Schema):
     error: str
     code: str
 
 
-class UserRegister(BaseModel):
+class UserRegister(Schema):
     user_id: str
     password: str
     email: Optional[str] = None  # email은 선택사항으로 변경
 
 
-class UserLogin(BaseModel):
+class UserLogin(Schema):
     user_id: str
     password: str
 
 
-class User(BaseModel):
+class User(Schema):
     user_id: str
     created_at: datetime
 
 
-class UserSpec(BaseModel):
+class UserSpec(Schema):
     id: int
     user_id: str
     job_field: Optional[str] = None
@@ -34,13 +39,13 @@ class UserSpec(BaseModel):
     updated_at: datetime
 
 
-class UserSpecUpdate(BaseModel):
+class UserSpecUpdate(Schema):
     job_field: Optional[str] = None
     introduction: Optional[str] = None
     onboarding_completed: Optional[bool] = None
 
 
-class Education(BaseModel):
+class Education(Schema):
     id: int
     user_id: str
     school: Optional[str] = None
@@ -51,14 +56,14 @@ class Education(BaseModel):
     updated_at: datetime
 
 
-class EducationUpdate(BaseModel):
+class EducationUpdate(Schema):
     school: Optional[str] = None
     major: Optional[str] = None
     gpa: Optional[str] = None
     graduation_status: Optional[str] = None
 
 
-class Language(BaseModel):
+class Language(Schema):
     id: int
     user_id: str
     language_type: str
@@ -68,13 +73,13 @@ class Language(BaseModel):
     updated_at: datetime
 
 
-class LanguageCreate(BaseModel):
+class LanguageCreate(Schema):
     language_type: str
     score: str
     acquisition_date: Optional[date] = None
 
 
-class Certificate(BaseModel):
+class Certificate(Schema):
     id: int
     user_id: str
     certificate_name: str
@@ -83,12 +88,12 @@ class Certificate(BaseModel):
     updated_at: datetime
 
 
-class CertificateCreate(BaseModel):
+class CertificateCreate(Schema):
     certificate_name: str
     acquisition_date: Optional[date] = None
 
 
-class Project(BaseModel):
+class Project(Schema):
     id: int
     user_id: str
     project_name: str
@@ -102,7 +107,7 @@ class Project(BaseModel):
     updated_at: datetime
 
 
-class ProjectCreate(BaseModel):
+class ProjectCreate(Schema):
     project_name: str
     role: Optional[str] = None
     period: Optional[str] = None
@@ -112,7 +117,7 @@ class ProjectCreate(BaseModel):
     portfolio_url: Optional[str] = None
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(Schema):
     project_name: Optional[str] = None
     role: Optional[str] = None
     period: Optional[str] = None
@@ -122,7 +127,7 @@ class ProjectUpdate(BaseModel):
     portfolio_url: Optional[str] = None
 
 
-class Activity(BaseModel):
+class Activity(Schema):
     id: int
     user_id: str
     activity_name: str
@@ -133,21 +138,21 @@ class Activity(BaseModel):
     updated_at: datetime
 
 
-class ActivityCreate(BaseModel):
+class ActivityCreate(Schema):
     activity_name: str
     activity_type: Optional[str] = None
     period: Optional[str] = None
     description: Optional[str] = None
 
 
-class ActivityUpdate(BaseModel):
+class ActivityUpdate(Schema):
     activity_name: Optional[str] = None
     activity_type: Optional[str] = None
     period: Optional[str] = None
     description: Optional[str] = None
 
 
-class Goal(BaseModel):
+class Goal(Schema):
     id: int
     user_id: str
     job_title: str
@@ -162,7 +167,7 @@ class Goal(BaseModel):
     updated_at: datetime
 
 
-class GoalCreate(BaseModel):
+class GoalCreate(Schema):
     job_title: str
     company_name: str
     location: Optional[str] = None
@@ -172,7 +177,7 @@ class GoalCreate(BaseModel):
     preferred: List[str] = []
 
 
-class GoalUpdate(BaseModel):
+class GoalUpdate(Schema):
     job_title: Optional[str] = None
     company_name: Optional[str] = None
     location: Optional[str] = None
@@ -182,7 +187,7 @@ class GoalUpdate(BaseModel):
     preferred: Optional[List[str]] = None
 
 
-class Task(BaseModel):
+class Task(Schema):
     id: int
     user_id: str
     goal_id: Optional[int] = None
@@ -197,7 +202,7 @@ class Task(BaseModel):
     updated_at: datetime
 
 
-class TaskCreate(BaseModel):
+class TaskCreate(Schema):
     goal_id: Optional[int] = None
     title: str
     description: Optional[str] = None
@@ -206,7 +211,7 @@ class TaskCreate(BaseModel):
     order_index: int = 0
 
 
-class TaskUpdate(BaseModel):
+class TaskUpdate(Schema):
     title: Optional[str] = None
     description: Optional[str] = None
     due_date: Optional[date] = None
@@ -214,7 +219,7 @@ class TaskUpdate(BaseModel):
     order_index: Optional[int] = None
 
 
-class DashboardData(BaseModel):
+class DashboardData(Schema):
     user_spec: Optional[UserSpec] = None
     education: Optional[Education] = None
     languages: List[Language] = []
@@ -225,7 +230,7 @@ class DashboardData(BaseModel):
     radar_scores: dict
 
 
-class JobPosting(BaseModel):
+class JobPosting(Schema):
     id: int
     company: str
     title: str
@@ -240,20 +245,47 @@ class JobPosting(BaseModel):
     updated_at: datetime
 
 
-class TaskAutoGenerate(BaseModel):
+class JobPostingPagination(Schema):
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+class JobPostingListResponse(Schema):
+    data: List[JobPosting]
+    pagination: JobPostingPagination
+
+
+class RequirementExplanation(Schema):
+    requirement: str
+    type: str  # required, preferred
+    is_met: bool
+    matched_skills: List[str] = []
+    user_value: Optional[str] = None
+
+
+class RecommendedJobPosting(Schema):
+    job_posting: JobPosting
+    score: float  # 0~100, 공고 요구 스킬 중 충족 비율
+    matched_requirements: int
+    total_requirements: int
+    explanations: List[RequirementExplanation]
+
+
+class TaskAutoGenerate(Schema):
     goal_id: Optional[int] = None
     requirements: List[str] = []
 
 
 # Step-Up 경험 아카이빙 시스템
-class Reflection(BaseModel):
+class Reflection(Schema):
     learned: str = Field(..., min_length=10, description="배운 점 (필수, 최소 10자)")
     challenges: Optional[str] = Field(None, description="어려웠던 점")
     solutions: Optional[str] = Field(None, description="해결 과정")
     improvements: Optional[str] = Field(None, description="개선점 및 다음 목표")
 
 
-class ExperienceCreate(BaseModel):
+class ExperienceCreate(Schema):
     task_id: int
     title: str
     category: str
@@ -263,13 +295,13 @@ class ExperienceCreate(BaseModel):
     related_resources: List[str] = Field(default_factory=list)
 
 
-class ExperienceUpdate(BaseModel):
+class ExperienceUpdate(Schema):
     reflection: Optional[Reflection] = None
     tags: Optional[List[str]] = Field(None, max_items=10)
     related_resources: Optional[List[str]] = None
 
 
-class Experience(BaseModel):
+class Experience(Schema):
     id: str
     user_id: str
     task_id: int
@@ -286,7 +318,7 @@ class Experience(BaseModel):
     updated_at: datetime
 
 
-class ExperienceStats(BaseModel):
+class ExperienceStats(Schema):
     total_experiences: int
     total_tags: int
     monthly_count: int
@@ -295,24 +327,24 @@ class ExperienceStats(BaseModel):
     recent_trends: dict
 
 
-class TagInfo(BaseModel):
+class TagInfo(Schema):
     name: str
     count: int
     last_used: datetime
 
 
-class TagsResponse(BaseModel):
+class TagsResponse(Schema):
     tags: List[TagInfo]
     total_unique_tags: int
 
 
-class CalendarActivity(BaseModel):
+class CalendarActivity(Schema):
     date: str
     count: int
     experiences: List[dict]
 
 
-class CalendarResponse(BaseModel):
+class CalendarResponse(Schema):
     activities: List[CalendarActivity]
     start_date: str
     end_date: str
@@ -320,7 +352,7 @@ class CalendarResponse(BaseModel):
     max_count_per_day: int
 
 
-class TaskCompleteWithReflection(BaseModel):
+class TaskCompleteWithReflection(Schema):
     completed_date: Optional[datetime] = None
     skip_reflection: bool = False
     reflection: Optional[Reflection] = None
@@ -329,27 +361,27 @@ class TaskCompleteWithReflection(BaseModel):
 
 
 # 주간 루틴 시스템
-class WeeklyRoutineCreate(BaseModel):
+class WeeklyRoutineCreate(Schema):
     title: str = Field(..., min_length=1, max_length=200)
     category: Optional[str] = Field(None, max_length=100)
     frequency: int = Field(..., ge=1, le=7, description="주 몇 회 (1-7)")
     color: str = Field("#3B82F6", pattern=r"^#[0-9A-Fa-f]{6}$")
 
 
-class WeeklyRoutineUpdate(BaseModel):
+class WeeklyRoutineUpdate(Schema):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     category: Optional[str] = Field(None, max_length=100)
     frequency: Optional[int] = Field(None, ge=1, le=7)
     color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
 
 
-class RoutineCompletion(BaseModel):
+class RoutineCompletion(Schema):
     id: int
     routine_id: int
     completion_date: date
 
 
-class WeeklyRoutine(BaseModel):
+class WeeklyRoutine(Schema):
     id: int
     user_id: str
     title: str
@@ -361,11 +393,11 @@ class WeeklyRoutine(BaseModel):
     completions: List[RoutineCompletion] = []
 
 
-class RoutineCompleteRequest(BaseModel):
+class RoutineCompleteRequest(Schema):
     completion_date: date
 
 
-class WeeklyStatus(BaseModel):
+class WeeklyStatus(Schema):
     routine_id: int
     week_start: str
     week_end: str
@@ -375,12 +407,12 @@ class WeeklyStatus(BaseModel):
     progress: float
 
 
-class CompletionWithDay(BaseModel):
+class CompletionWithDay(Schema):
     date: str
     day_of_week: int
 
 
-class RoutineStats(BaseModel):
+class RoutineStats(Schema):
     routine_id: int
     title: str
     frequency: int
@@ -391,14 +423,14 @@ class RoutineStats(BaseModel):
     completions: List[CompletionWithDay]
 
 
-class WeeklyStatsSummary(BaseModel):
+class WeeklyStatsSummary(Schema):
     total_routines: int
     success_count: int
     in_progress_count: int
     total_completions: int
 
 
-class WeeklyStatsResponse(BaseModel):
+class WeeklyStatsResponse(Schema):
     week_start: str
     week_end: str
     routines: List[RoutineStats]
@@ -1,35 +1,65 @@
-from fastapi import APIRouter, Header, HTTPException, status
-from passlib.hash import bcrypt
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from postgrest.exceptions import APIError
 from models.schemas import UserRegister, UserLogin
-from config.database import supabase
+from config.database import db
+from utils.password import password_hasher, PasswordHasherBusy
+from utils.tokens import token_signer, current_token_claims
 
 router = APIRouter(prefix="/auth", tags=["인증"])
 
 
+def busy_error(e: PasswordHasherBusy) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={"error": str(e), "code": "SERVICE_UNAVAILABLE"}
+    )
+
+
+def token_response(user_id: str, onboarding_completed: bool) -> dict:
+    """발급한 세션 토큰 (이후 요청은 Authorization: Bearer <access_token>)"""
+    return {
+        "access_token": token_signer.issue(user_id, onboarding_completed),
+        "token_type": "bearer",
+        "expires_in": token_signer.ttl
+    }
+
+
+async def rehash_password(user_id: str, password: str):
+    """설정된 비용으로 비밀번호 재해시 (로그인 응답 후 백그라운드 실행, 실패해도 다음 로그인에 재시도)"""
+    try:
+        hashed_password = await password_hasher.hash(password)
+        await db.table("users").update({"password": hashed_password}).eq("user_id", user_id).execute()
+        password_hasher.rehashed += 1
+    except Exception as e:
+        print(f"[Auth] 비밀번호 재해시 실패 ({user_id}): {e}")
+
+
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserRegister):
     """회원가입"""
     try:
-        existing_user = supabase.table("users").select("*").eq("user_id", user_data.user_id).execute()
-        if existing_user.data:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={"error": "이미 존재하는 아이디입니다", "code": "DUPLICATE_USER_ID"}
-            )
-        
-        # email 중복 체크 제거 (email 컬럼이 없음)
+        duplicate_error = HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "이미 존재하는 아이디입니다", "code": "DUPLICATE_USER_ID"}
+        )
         
-        hashed_password = bcrypt.hash(user_data.password)
+        hashed_password = await password_hasher.hash(user_data.password)
         
-        new_user = supabase.table("users").insert({
-            "user_id": user_data.user_id,
-            "password": hashed_password
-        }).execute()
+        # users + user_specs 생성은 DB 함수 한 번(한 트랜잭션)으로 처리
+        # 아이디 중복 확인도 DB 함수의 INSERT 결과로 판단 (이미 있으면 created = false)
+        try:
+            result = await db.rpc("register_user", {
+                "p_user_id": user_data.user_id,
+                "p_password": hashed_password
+            }).execute()
+        except APIError as e:
+            # 고유 제약 위반(23505)도 중복 아이디로 응답
+            if e.code != "23505":
+                raise
+            raise duplicate_error
         
-        supabase.table("user_specs").insert({
-            "user_id": user_data.user_id,
-            "onboarding_completed": False
-        }).execute()
+        if not result.data or not result.data[0]["created"]:
+            raise duplicate_error
         
         return {
             "message": "회원가입이 완료되었습니다",
@@ -38,6 +68,8 @@ async def register(user_data: UserRegister):
     
     except HTTPException:
         raise
+    except PasswordHasherBusy as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,28 +78,56 @@ async def register(user_data: UserRegister):
 
 
 @router.post("/login")
-async def login(credentials: UserLogin):
+async def login(credentials: UserLogin, background_tasks: BackgroundTasks):
     """로그인"""
     try:
-        user = supabase.table("users").select("*").eq("user_id", credentials.user_id).execute()
+        user = await db.table("users").select("*").eq("user_id", credentials.user_id).execute()
         
-        if not user.data or not bcrypt.verify(credentials.password, user.data[0]["password"]):
+        if not user.data or not await password_hasher.verify(credentials.password, user.data[0]["password"]):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={"error": "아이디 또는 비밀번호가 올바르지 않습니다", "code": "UNAUTHORIZED"}
             )
         
-        user_spec = supabase.table("user_specs").select("onboarding_completed").eq("user_id", credentials.user_id).execute()
+        # BCRYPT_ROUNDS 변경 전에 저장된 해시는 새 비용으로 교체
+        if password_hasher.needs_rehash(user.data[0]["password"]):
+            background_tasks.add_task(rehash_password, credentials.user_id, credentials.password)
+        
+        user_spec = await db.table("user_specs").select("onboarding_completed").eq("user_id", credentials.user_id).execute()
         onboarding_completed = user_spec.data[0]["onboarding_completed"] if user_spec.data else False
         
         return {
             "message": "로그인 성공",
             "user_id": credentials.user_id,
-            "onboarding_completed": onboarding_completed
+            "onboarding_completed": onboarding_completed,
+            **token_response(credentials.user_id, onboarding_completed)
         }
     
     except HTTPException:
         raise
+    except PasswordHasherBusy as e:
+        raise busy_error(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": str(e), "code": "UNAUTHORIZED"}
+        )
+
+
+@router.post("/refresh")
+async def refresh_token(claims: dict = Depends(current_token_claims)):
+    """만료 전 토큰 재발급 (온보딩 완료 여부도 최신 값으로 갱신)"""
+    try:
+        x_user_id = claims["sub"]
+        user_spec = await db.table("user_specs").select("onboarding_completed").eq("user_id", x_user_id).execute()
+        onboarding_completed = user_spec.data[0]["onboarding_completed"] if user_spec.data else False
+        
+        return {
+            "user_id": x_user_id,
+            "onboarding_completed": onboarding_completed,
+            **token_response(x_user_id, onboarding_completed)
+        }
+    
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Header, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional
 from datetime import datetime, timedelta
 from models.schemas import (
@@ -6,17 +6,23 @@ from models.schemas import (
     ExperienceStats, TagsResponse, TagInfo,
     CalendarResponse, CalendarActivity
 )
-from config.database import supabase
+from postgrest.exceptions import APIError
+from config.database import db
+from utils.helpers import contains_filter, quote_filter_value
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/experiences", tags=["경험 아카이빙"])
 
+# 검색용 search_text 컬럼은 응답에 필요 없으므로 제외
+EXPERIENCE_COLUMNS = "id, user_id, task_id, title, category, completed_date, learned, challenges, solutions, improvements, tags, related_resources, created_at, updated_at"
+
 
 @router.post("", response_model=Experience, status_code=status.HTTP_201_CREATED)
-async def create_experience(experience_data: ExperienceCreate, x_user_id: str = Header(...)):
+async def create_experience(experience_data: ExperienceCreate, x_user_id: str = Depends(current_user_id)):
     """경험(회고) 생성"""
     try:
         # 태스크 존재 여부 확인
-        task = supabase.table("tasks").select("id, title, user_id").eq("id", experience_data.task_id).execute()
+        task = await db.table("tasks").select("id, title, user_id").eq("id", experience_data.task_id).execute()
         
         if not task.data:
             raise HTTPException(
@@ -32,7 +38,7 @@ async def create_experience(experience_data: ExperienceCreate, x_user_id: str =
             )
         
         # 중복 경험 확인
-        existing = supabase.table("experiences").select("id").eq("user_id", x_user_id).eq("task_id", experience_data.task_id).execute()
+        existing = await db.table("experiences").select("id").eq("user_id", x_user_id).eq("task_id", experience_data.task_id).execute()
         
         if existing.data:
             raise HTTPException(
@@ -63,7 +69,7 @@ async def create_experience(experience_data: ExperienceCreate, x_user_id: str =
             "related_resources": experience_data.related_resources
         }
         
-        result = supabase.table("experiences").insert(data).execute()
+        result = await db.table("experiences").insert(data).execute()
         
         if not result.data:
             raise HTTPException(
@@ -84,7 +90,7 @@ async def create_experience(experience_data: ExperienceCreate, x_user_id: str =
 
 @router.get("", response_model=dict)
 async def get_experiences(
-    x_user_id: str = Header(...),
+    x_user_id: str = Depends(current_user_id),
     search: Optional[str] = Query(None, description="제목, 내용, 태그 검색"),
     tags: Optional[str] = Query(None, description="태그 필터 (쉼표로 구분)"),
     period: Optional[str] = Query(None, description="기간 필터 (all/week/month/quarter)"),
@@ -95,9 +101,6 @@ async def get_experiences(
 ):
     """경험 목록 조회 (필터링 및 검색 지원)"""
     try:
-        # 기본 쿼리
-        query = supabase.table("experiences").select("*", count="exact").eq("user_id", x_user_id)
-        
         # 기간 필터
         if period:
             now = datetime.utcnow()
@@ -108,37 +111,41 @@ async def get_experiences(
             elif period == "quarter":
                 start_date = now - timedelta(days=90)
         
-        if start_date:
-            query = query.gte("completed_date", start_date.isoformat())
-        
-        if end_date:
-            query = query.lte("completed_date", end_date.isoformat())
-        
-        # 태그 필터
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(",")]
-            query = query.contains("tags", tag_list)
-        
-        # 검색 (클라이언트 사이드 필터링)
-        result = query.order("completed_date", desc=True).execute()
-        
-        experiences = result.data or []
-        
-        # 검색어 필터링
-        if search:
-            search_lower = search.lower()
-            experiences = [
-                exp for exp in experiences
-                if search_lower in exp.get("title", "").lower()
-                or search_lower in exp.get("learned", "").lower()
-                or any(search_lower in tag.lower() for tag in exp.get("tags", []))
-            ]
-        
-        # 페이지네이션
-        total = len(experiences)
+        def build_query(columns: str):
+            """목록/개수 조회에 공통으로 쓰는 필터 적용"""
+            query = db.table("experiences").select(columns, count="exact").eq("user_id", x_user_id)
+            
+            if start_date:
+                query = query.gte("completed_date", start_date.isoformat())
+            
+            if end_date:
+                query = query.lte("completed_date", end_date.isoformat())
+            
+            # 태그 필터
+            if tags:
+                tag_list = [tag.strip() for tag in tags.split(",")]
+                # 배열 리터럴 원소를 따옴표로 감싸 태그 안의 { } " \ 가 구분자로 해석되지 않게 함
+                query = query.contains("tags", "{" + ",".join(quote_filter_value(tag) for tag in tag_list) + "}")
+            
+            # 검색어 필터 (제목, 배운 점, 어려웠던 점, 해결 과정, 태그 — DB 트라이그램 인덱스 사용)
+            if search:
+                query = contains_filter(query, "search_text", search.lower())
+            
+            return query
+        
+        # 페이지네이션 (해당 페이지 행만 조회, 전체 개수는 DB count 사용)
         start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_data = experiences[start_idx:end_idx]
+        try:
+            result = await build_query(EXPERIENCE_COLUMNS).order("completed_date", desc=True).order("id", desc=True).range(start_idx, start_idx + limit - 1).execute()
+            paginated_data = result.data or []
+            total = result.count or 0
+        except APIError as e:
+            # 전체 개수를 넘는 페이지 요청(PGRST103)은 빈 페이지로 응답
+            if e.code != "PGRST103":
+                raise
+            result = await build_query("id").limit(1).execute()
+            paginated_data = []
+            total = result.count or 0
         
         return {
             "data": paginated_data,
@@ -158,10 +165,10 @@ async def get_experiences(
 
 
 @router.get("/{experience_id}", response_model=Experience)
-async def get_experience(experience_id: str, x_user_id: str = Header(...)):
+async def get_experience(experience_id: str, x_user_id: str = Depends(current_user_id)):
     """특정 경험 상세 조회"""
     try:
-        result = supabase.table("experiences").select("*").eq("id", experience_id).eq("user_id", x_user_id).execute()
+        result = await db.table("experiences").select("*").eq("id", experience_id).eq("user_id", x_user_id).execute()
         
         if not result.data:
             raise HTTPException(
@@ -184,12 +191,12 @@ async def get_experience(experience_id: str, x_user_id: str = Header(...)):
 async def update_experience(
     experience_id: str,
     experience_data: ExperienceUpdate,
-    x_user_id: str = Header(...)
+    x_user_id: str = Depends(current_user_id)
 ):
     """경험 수정"""
     try:
         # 경험 존재 여부 및 소유자 확인
-        existing = supabase.table("experiences").select("id").eq("id", experience_id).eq("user_id", x_user_id).execute()
+        existing = await db.table("experiences").select("id").eq("id", experience_id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -225,7 +232,7 @@ async def update_experience(
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        result = supabase.table("experiences").update(update_data).eq("id", experience_id).execute()
+        result = await db.table("experiences").update(update_data).eq("id", experience_id).execute()
         
         return result.data[0]
     
@@ -239,11 +246,11 @@ async def update_experience(
 
 
 @router.delete("/{experience_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_experience(experience_id: str, x_user_id: str = Header(...)):
+async def delete_experience(experience_id: str, x_user_id: str = Depends(current_user_id)):
     """경험 삭제"""
     try:
         # 경험 존재 여부 및 소유자 확인
-        existing = supabase.table("experiences").select("id").eq("id", experience_id).eq("user_id", x_user_id).execute()
+        existing = await db.table("experiences").select("id").eq("id", experience_id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -251,7 +258,7 @@ async def delete_experience(experience_id: str, x_user_id: str = Header(...)):
                 detail={"error": "경험을 찾을 수 없습니다", "code": "EXPERIENCE_NOT_FOUND"}
             )
         
-        supabase.table("experiences").delete().eq("id", experience_id).execute()
+        await db.table("experiences").delete().eq("id", experience_id).execute()
         
         return None
     
@@ -265,53 +272,42 @@ async def delete_experience(experience_id: str, x_user_id: str = Header(...)):
 
 
 @router.get("/stats/overview", response_model=ExperienceStats)
-async def get_experience_stats(x_user_id: str = Header(...)):
-    """경험 통계 조회"""
+async def get_experience_stats(x_user_id: str = Depends(current_user_id)):
+    """경험 통계 조회 (트리거로 유지되는 태그/카테고리 요약 테이블 사용)"""
     try:
-        # 모든 경험 조회
-        result = supabase.table("experiences").select("*").eq("user_id", x_user_id).execute()
-        experiences = result.data or []
-        
-        total_experiences = len(experiences)
-        
-        # 태그 통계
-        all_tags = []
-        for exp in experiences:
-            all_tags.extend(exp.get("tags", []))
-        
-        total_tags = len(set(all_tags))
-        
-        # 이번 달 경험 수
         now = datetime.utcnow()
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        monthly_count = sum(
-            1 for exp in experiences
-            if datetime.fromisoformat(exp["completed_date"].replace("Z", "+00:00")) >= month_start
-        )
+        week_ago = now - timedelta(weeks=1)
+        quarter_ago = now - timedelta(days=90)
         
-        # 평균 태그 수
-        average_tags_per_experience = len(all_tags) / total_experiences if total_experiences > 0 else 0
+        def count_since(since: datetime):
+            return db.table("experiences").select("id", count="exact", head=True).eq("user_id", x_user_id).gte("completed_date", since.isoformat())
+        
+        results, _ = await db.gather({
+            "categories": db.table("experience_category_stats").select("category, count").eq("user_id", x_user_id),
+            "tags": db.table("experience_tag_stats").select("count").eq("user_id", x_user_id),
+            "week": count_since(week_ago),
+            "month": count_since(month_start),
+            "quarter": count_since(quarter_ago)
+        })
         
         # 카테고리별 분포
-        category_breakdown = {}
-        for exp in experiences:
-            category = exp.get("category", "기타")
-            category_breakdown[category] = category_breakdown.get(category, 0) + 1
+        category_breakdown = {row["category"]: row["count"] for row in (results["categories"].data or [])}
+        total_experiences = sum(category_breakdown.values())
         
-        # 최근 동향
-        week_ago = now - timedelta(weeks=1)
-        quarter_ago = now - timedelta(days=90)
+        # 태그 통계
+        tag_counts = [row["count"] for row in (results["tags"].data or [])]
+        total_tags = len(tag_counts)
+        
+        # 평균 태그 수
+        average_tags_per_experience = sum(tag_counts) / total_experiences if total_experiences > 0 else 0
         
+        # 이번 달 경험 수 / 최근 동향
+        monthly_count = results["month"].count or 0
         recent_trends = {
-            "lastWeek": sum(
-                1 for exp in experiences
-                if datetime.fromisoformat(exp["completed_date"].replace("Z", "+00:00")) >= week_ago
-            ),
+            "lastWeek": results["week"].count or 0,
             "lastMonth": monthly_count,
-            "lastQuarter": sum(
-                1 for exp in experiences
-                if datetime.fromisoformat(exp["completed_date"].replace("Z", "+00:00")) >= quarter_ago
-            )
+            "lastQuarter": results["quarter"].count or 0
         }
         
         return {
@@ -331,32 +327,18 @@ async def get_experience_stats(x_user_id: str = Header(...)):
 
 
 @router.get("/tags/list", response_model=TagsResponse)
-async def get_tags(x_user_id: str = Header(...)):
-    """태그 목록 및 빈도수 조회"""
+async def get_tags(x_user_id: str = Depends(current_user_id)):
+    """태그 목록 및 빈도수 조회 (빈도순)"""
     try:
-        result = supabase.table("experiences").select("tags, completed_date").eq("user_id", x_user_id).execute()
-        experiences = result.data or []
+        result = await db.table("experience_tag_stats").select("tag, count, last_used").eq("user_id", x_user_id).order("count", desc=True).order("tag").execute()
         
-        # 태그별 통계
-        tag_stats = {}
-        for exp in experiences:
-            completed_date = datetime.fromisoformat(exp["completed_date"].replace("Z", "+00:00"))
-            for tag in exp.get("tags", []):
-                if tag not in tag_stats:
-                    tag_stats[tag] = {"count": 0, "last_used": completed_date}
-                else:
-                    tag_stats[tag]["count"] += 1
-                    if completed_date > tag_stats[tag]["last_used"]:
-                        tag_stats[tag]["last_used"] = completed_date
-        
-        # 정렬 (빈도순)
         tags = [
             {
-                "name": tag,
-                "count": stats["count"],
-                "last_used": stats["last_used"]
+                "name": row["tag"],
+                "count": row["count"],
+                "last_used": row["last_used"]
             }
-            for tag, stats in sorted(tag_stats.items(), key=lambda x: x[1]["count"], reverse=True)
+            for row in (result.data or [])
         ]
         
         return {
@@ -373,7 +355,7 @@ async def get_tags(x_user_id: str = Header(...)):
 
 @router.get("/calendar/activity", response_model=CalendarResponse)
 async def get_calendar_activity(
-    x_user_id: str = Header(...),
+    x_user_id: str = Depends(current_user_id),
     weeks: int = Query(12, ge=1, le=52, description="조회할 주 수")
 ):
     """활동 캘린더 데이터 (GitHub 잔디 스타일)"""
@@ -383,7 +365,7 @@ async def get_calendar_activity(
         start_date = end_date - timedelta(weeks=weeks)
         
         # 경험 조회
-        result = supabase.table("experiences").select("id, title, completed_date").eq("user_id", x_user_id).gte("completed_date", start_date.isoformat()).execute()
+        result = await db.table("experiences").select("id, title, completed_date").eq("user_id", x_user_id).gte("completed_date", start_date.isoformat()).execute()
         experiences = result.data or []
         
         # 날짜별 그룹화
@@ -1,44 +1,62 @@
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional
-from models.schemas import JobPosting
-from config.database import supabase
+from models.schemas import JobPosting, JobPostingListResponse, RecommendedJobPosting
+from config.database import db
+from utils.helpers import parse_job_requirements, contains_filter, quote_filter_value
+from utils.job_index import job_index
+from utils.job_recommender import job_recommender
+from utils.requirement_matcher import UserSpecs
+from utils.cache import cache
+from utils.serialization import trusted_rows, trusted_response
+from utils.tokens import current_user_id
+import os
 import json
+import base64
 
 router = APIRouter(prefix="/job-postings", tags=["채용공고"])
 
 
-def parse_job_requirements(data):
-    """채용 공고 요구사항을 문자열 배열로 변환"""
-    if isinstance(data, str):
-        # JSON 문자열인 경우 파싱
-        try:
-            parsed = json.loads(data)
-            if isinstance(parsed, list):
-                return [
-                    item['description'] if isinstance(item, dict) and 'description' in item else str(item)
-                    for item in parsed
-                ]
-        except json.JSONDecodeError:
-            return [data]
-    elif isinstance(data, list):
-        # 이미 배열인 경우
-        return [
-            item['description'] if isinstance(item, dict) and 'description' in item else str(item)
-            for item in data
-        ]
-    return []
+# 검색용 search_text 컬럼은 응답에 필요 없으므로 제외
+JOB_POSTING_COLUMNS = "id, company, title, description, url, requirements, preferred, location, experience_level, is_active, created_at, updated_at"
 
+# 색인 후보가 이보다 많으면 id=in 목록 대신 DB의 search_text 검색 사용
+MAX_INDEX_CANDIDATES = int(os.getenv("JOB_INDEX_MAX_CANDIDATES", 500))
 
-@router.get("", response_model=List[JobPosting])
+
+def encode_cursor(job: dict) -> str:
+    """마지막 공고의 (created_at, id)를 커서 문자열로 변환"""
+    raw = json.dumps([job["created_at"], job["id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    created_at, job_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    return str(created_at), int(job_id)
+
+
+@router.get("", response_model=JobPostingListResponse)
 async def get_job_postings(
     is_active: Optional[bool] = Query(None),
     company: Optional[str] = Query(None),
     keyword: Optional[str] = Query(None),
-    experience_level: Optional[str] = Query(None)
+    experience_level: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
-    """채용 공고 목록 조회 (검색 기능 포함)"""
+    """채용 공고 목록 조회 (검색 기능 포함, 최신순 커서 페이지네이션)"""
     try:
-        query = supabase.table("job_postings").select("*")
+        query = db.table("job_postings").select(JOB_POSTING_COLUMNS)
+        
+        if keyword:
+            # 색인 후보가 적으면 해당 ID만 조회하고, 많으면 DB 트라이그램 인덱스로 검색
+            candidate_ids = job_index.search(keyword) if job_index.ready else None
+            if candidate_ids is not None and len(candidate_ids) <= MAX_INDEX_CANDIDATES:
+                if not candidate_ids:
+                    return {"data": [], "pagination": {"limit": limit, "next_cursor": None, "has_more": False}}
+                query = query.in_("id", candidate_ids)
+            else:
+                query = contains_filter(query, "search_text", keyword.lower())
         
         if is_active is not None:
             query = query.eq("is_active", is_active)
@@ -49,30 +67,101 @@ async def get_job_postings(
         if experience_level is not None:
             query = query.eq("experience_level", experience_level)
         
-        result = query.order("created_at", desc=True).execute()
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = decode_cursor(cursor)
+            except Exception:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={"error": "잘못된 커서입니다", "code": "BAD_REQUEST"}
+                )
+            # (created_at, id) < (커서 created_at, 커서 id), 커서 값은 클라이언트가 보낸 문자열이므로 따옴표로 감쌈
+            created_at_value = quote_filter_value(cursor_created_at)
+            query = query.or_(
+                f"created_at.lt.{created_at_value},"
+                f"and(created_at.eq.{created_at_value},id.lt.{cursor_id})"
+            )
+        
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        result = await query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+        
+        rows = result.data or []
+        has_more = len(rows) > limit
+        jobs = rows[:limit]
         
         # 데이터 변환
-        jobs = []
-        for job in (result.data or []):
+        for job in jobs:
+            job['requirements'] = parse_job_requirements(job.get('requirements'))
+            job['preferred'] = parse_job_requirements(job.get('preferred'))
+        
+        return trusted_response({
+            "data": trusted_rows(JobPosting, jobs),
+            "pagination": {
+                "limit": limit,
+                "next_cursor": encode_cursor(jobs[-1]) if has_more else None,
+                "has_more": has_more
+            }
+        })
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": str(e), "code": "INTERNAL_SERVER_ERROR"}
+        )
+
+
+@router.get("/recommended", response_model=List[RecommendedJobPosting])
+async def get_recommended_job_postings(
+    x_user_id: str = Depends(current_user_id),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """내 스펙과 가장 잘 맞는 활성 채용 공고 추천 (요구사항별 매칭 설명 포함)"""
+    try:
+        cached = await cache.get(f"specs:recommended:{limit}", x_user_id)
+        if cached is not None:
+            return cached
+        
+        # 앱 시작 직후 색인을 만드는 동안에는 빈 추천 대신 재시도 안내
+        if not job_index.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={"error": "추천 색인을 준비 중입니다. 잠시 후 다시 시도해주세요", "code": "SERVICE_UNAVAILABLE"}
+            )
+        
+        results, _ = await db.gather({
+            "languages": db.table("languages").select("language_type, score").eq("user_id", x_user_id),
+            "certificates": db.table("certificates").select("certificate_name").eq("user_id", x_user_id),
+            "projects": db.table("projects").select("tech_stack").eq("user_id", x_user_id),
+            "activities": db.table("activities").select("activity_name, activity_type").eq("user_id", x_user_id)
+        })
+        specs = UserSpecs(results["projects"].data, results["languages"].data, results["certificates"].data)
+        
+        # 전체 활성 공고를 한 번에 점수화하고 상위 공고만 조회
+        recommendations = job_recommender.recommend(specs, results["activities"].data, limit=limit)
+        if not recommendations:
+            return []
+        
+        jobs = await db.table("job_postings").select(JOB_POSTING_COLUMNS).in_(
+            "id", [r["job_posting_id"] for r in recommendations]
+        ).execute()
+        jobs_by_id = {job["id"]: job for job in (jobs.data or [])}
+        
+        response_data = []
+        for recommendation in recommendations:
+            job = jobs_by_id.get(recommendation.pop("job_posting_id"))
+            if job is None:
+                continue
             job['requirements'] = parse_job_requirements(job.get('requirements'))
             job['preferred'] = parse_job_requirements(job.get('preferred'))
-            
-            # 키워드 필터링 (제목, 설명, 회사명에서 검색)
-            if keyword:
-                keyword_lower = keyword.lower()
-                if not (
-                    keyword_lower in job.get('title', '').lower() or
-                    keyword_lower in job.get('description', '').lower() or
-                    keyword_lower in job.get('company', '').lower() or
-                    any(keyword_lower in req.lower() for req in job['requirements']) or
-                    any(keyword_lower in pref.lower() for pref in job['preferred'])
-                ):
-                    continue
-            
-            jobs.append(job)
-        
-        return jobs
+            response_data.append({"job_posting": job, **recommendation})
+        
+        await cache.set(f"specs:recommended:{limit}", x_user_id, response_data)
+        return response_data
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -84,7 +173,7 @@ async def get_job_postings(
 async def get_job_posting(id: int):
     """채용 공고 상세 조회"""
     try:
-        result = supabase.table("job_postings").select("*").eq("id", id).execute()
+        result = await db.table("job_postings").select(JOB_POSTING_COLUMNS).eq("id", id).execute()
         
         if not result.data:
             raise HTTPException(
@@ -1,67 +1,56 @@
-from fastapi import APIRouter, Header, HTTPException, status
-from config.database import supabase
-from utils.helpers import parse_json_field
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from config.database import db
+from utils.cache import cache
+from utils.helpers import parse_job_requirements, format_server_timing
+from utils.requirement_matcher import matcher, UserSpecs
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/progress", tags=["진행상황"])
 
 
 @router.get("")
-async def get_progress(x_user_id: str = Header(...)):
+async def get_progress(response: Response, x_user_id: str = Depends(current_user_id)):
     """사용자 진행 상황 조회"""
     try:
-        # 사용자 스펙 데이터 조회
-        user_spec_res = supabase.table("user_specs").select("*").eq("user_id", x_user_id).execute()
-        user_spec = user_spec_res.data[0] if user_spec_res.data else None
+        cached = await cache.get("progress", x_user_id)
+        if cached is not None:
+            return cached
         
-        education_res = supabase.table("educations").select("*").eq("user_id", x_user_id).execute()
-        education = education_res.data[0] if education_res.data else None
+        # 사용자 스펙 데이터와 활성 목표를 동시에 조회
+        results, timings = await db.gather({
+            "user_specs": db.table("user_specs").select("*").eq("user_id", x_user_id),
+            "educations": db.table("educations").select("*").eq("user_id", x_user_id),
+            "languages": db.table("languages").select("*").eq("user_id", x_user_id),
+            "certificates": db.table("certificates").select("*").eq("user_id", x_user_id),
+            "projects": db.table("projects").select("*").eq("user_id", x_user_id),
+            "activities": db.table("activities").select("*").eq("user_id", x_user_id),
+            "goals": db.table("goals").select("*").eq("user_id", x_user_id).eq("is_active", True)
+        })
+        response.headers["Server-Timing"] = format_server_timing(timings)
         
-        languages_res = supabase.table("languages").select("*").eq("user_id", x_user_id).execute()
-        languages = languages_res.data or []
-        
-        certificates_res = supabase.table("certificates").select("*").eq("user_id", x_user_id).execute()
-        certificates = certificates_res.data or []
-        
-        projects_res = supabase.table("projects").select("*").eq("user_id", x_user_id).execute()
-        projects = projects_res.data or []
-        
-        activities_res = supabase.table("activities").select("*").eq("user_id", x_user_id).execute()
-        activities = activities_res.data or []
-        
-        # 활성 목표 조회
-        goal_res = supabase.table("goals").select("*").eq("user_id", x_user_id).eq("is_active", True).execute()
-        goal = goal_res.data[0] if goal_res.data else None
+        user_spec = results["user_specs"].data[0] if results["user_specs"].data else None
+        education = results["educations"].data[0] if results["educations"].data else None
+        languages = results["languages"].data or []
+        certificates = results["certificates"].data or []
+        projects = results["projects"].data or []
+        activities = results["activities"].data or []
+        goal = results["goals"].data[0] if results["goals"].data else None
         
         gap_analysis = []
         
         if goal:
-            goal["requirements"] = parse_json_field(goal.get("requirements"))
-            goal["preferred"] = parse_json_field(goal.get("preferred"))
+            goal["requirements"] = parse_job_requirements(goal.get("requirements"))
+            goal["preferred"] = parse_job_requirements(goal.get("preferred"))
             
-            # 간단한 갭 분석
+            # 요구사항 매칭 엔진으로 갭 분석
+            specs = UserSpecs(projects, languages, certificates)
             requirements_analysis = []
             for req in goal["requirements"]:
-                # 키워드 기반 매칭
-                is_met = False
-                gap_detail = "경험 부족"
-                
-                if "프로젝트" in req:
-                    if len(projects) > 0:
-                        is_met = True
-                        gap_detail = f"프로젝트 경험 {len(projects)}개"
-                elif "React" in req or "Vue" in req or "프론트엔드" in req:
-                    if any(p.get("tech_stack") and ("React" in p.get("tech_stack") or "Vue" in p.get("tech_stack")) for p in projects):
-                        is_met = True
-                        gap_detail = "관련 프로젝트 경험 있음"
-                elif "TypeScript" in req:
-                    if any(p.get("tech_stack") and "TypeScript" in p.get("tech_stack") for p in projects):
-                        is_met = True
-                        gap_detail = "TypeScript 프로젝트 경험 있음"
-                
+                result = matcher.evaluate(req, specs)
                 requirements_analysis.append({
                     "description": req,
-                    "is_met": is_met,
-                    "gap_detail": gap_detail
+                    "is_met": result["is_met"],
+                    "gap_detail": result["user_value"] or "경험 부족"
                 })
             
             gap_analysis.append({
@@ -69,7 +58,7 @@ async def get_progress(x_user_id: str = Header(...)):
                 "requirements": requirements_analysis
             })
         
-        return {
+        response_data = {
             "user_spec": user_spec,
             "education": education,
             "languages": languages,
@@ -78,6 +67,8 @@ async def get_progress(x_user_id: str = Header(...)):
             "activities": activities,
             "gap_analysis": gap_analysis
         }
+        await cache.set("progress", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
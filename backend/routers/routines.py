@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Header, HTTPException, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Dict, List, Optional
 from datetime import datetime, date, timedelta
 from models.schemas import (
     WeeklyRoutine, WeeklyRoutineCreate, WeeklyRoutineUpdate,
     RoutineCompleteRequest, WeeklyStatus, WeeklyStatsResponse,
     RoutineStats, WeeklyStatsSummary, CompletionWithDay, RoutineCompletion
 )
-from config.database import supabase
+from config.database import db
+from utils.cache import cache, INVALIDATE_ON_ROUTINE_CHANGE
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/routines", tags=["주간 루틴"])
 
@@ -27,6 +29,35 @@ def get_week_end(week_start: date) -> date:
     return week_start + timedelta(days=6)
 
 
+async def load_completions(
+    routine_ids: List[int],
+    columns: str = "id, routine_id, completion_date",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    desc: bool = False
+) -> Dict[int, List[dict]]:
+    """여러 루틴의 완료 기록을 한 번의 쿼리로 조회하여 루틴 ID별로 그룹화"""
+    grouped = {routine_id: [] for routine_id in routine_ids}
+    
+    if not routine_ids:
+        return grouped
+    
+    query = db.table("routine_completions").select(columns).in_("routine_id", routine_ids)
+    
+    if start_date is not None:
+        query = query.gte("completion_date", start_date.isoformat())
+    
+    if end_date is not None:
+        query = query.lte("completion_date", end_date.isoformat())
+    
+    result = await query.order("completion_date", desc=desc).execute()
+    
+    for completion in result.data or []:
+        grouped.setdefault(completion["routine_id"], []).append(completion)
+    
+    return grouped
+
+
 def calculate_weekly_status(routine_id: int, frequency: int, completions: List[dict], week_start: date) -> WeeklyStatus:
     """주간 달성 상태 계산"""
     week_end = get_week_end(week_start)
@@ -51,14 +82,105 @@ def calculate_weekly_status(routine_id: int, frequency: int, completions: List[d
     )
 
 
+def build_weekly_stats(routines: List[dict], completions_by_routine: Dict[int, List[dict]], first_week_start: date, weeks: int) -> List[WeeklyStatsResponse]:
+    """완료 기록을 한 번 순회하며 주차별·루틴별로 집계"""
+    # buckets[주차][루틴 ID] = 완료 기록 목록
+    buckets = [{routine["id"]: [] for routine in routines} for _ in range(weeks)]
+    
+    for routine_id, completions in completions_by_routine.items():
+        for c in completions:
+            completion_day = date.fromisoformat(str(c["completion_date"])[:10])
+            week_index = (completion_day - first_week_start).days // 7
+            if 0 <= week_index < weeks and routine_id in buckets[week_index]:
+                buckets[week_index][routine_id].append(c)
+    
+    responses = []
+    for week_index in range(weeks):
+        week_start = first_week_start + timedelta(weeks=week_index)
+        week_end = get_week_end(week_start)
+        
+        routines_stats = []
+        total_completions = 0
+        success_count = 0
+        in_progress_count = 0
+        
+        for routine in routines:
+            completions = buckets[week_index][routine["id"]]
+            completed_count = len(completions)
+            total_completions += completed_count
+            
+            is_success = completed_count >= routine["frequency"]
+            progress = min(100.0, (completed_count / routine["frequency"]) * 100) if routine["frequency"] > 0 else 0.0
+            
+            if is_success:
+                success_count += 1
+            else:
+                in_progress_count += 1
+            
+            # 완료 기록을 날짜와 요일로 변환
+            completion_list = [
+                CompletionWithDay(
+                    date=c["completion_date"],
+                    day_of_week=(datetime.fromisoformat(c["completion_date"]).weekday() + 1) % 7  # 일요일=0
+                )
+                for c in completions
+            ]
+            
+            routines_stats.append(
+                RoutineStats(
+                    routine_id=routine["id"],
+                    title=routine["title"],
+                    frequency=routine["frequency"],
+                    color=routine["color"],
+                    completed_count=completed_count,
+                    is_success=is_success,
+                    progress=round(progress, 2),
+                    completions=completion_list
+                )
+            )
+        
+        responses.append(
+            WeeklyStatsResponse(
+                week_start=week_start.isoformat(),
+                week_end=week_end.isoformat(),
+                routines=routines_stats,
+                summary=WeeklyStatsSummary(
+                    total_routines=len(routines),
+                    success_count=success_count,
+                    in_progress_count=in_progress_count,
+                    total_completions=total_completions
+                )
+            )
+        )
+    
+    return responses
+
+
+async def fetch_weekly_stats(x_user_id: str, last_week_start: date, weeks: int) -> List[WeeklyStatsResponse]:
+    """루틴 조회 1회 + 기간 내 완료 기록 조회 1회로 N주 통계 계산"""
+    first_week_start = last_week_start - timedelta(weeks=weeks - 1)
+    
+    routines_result = await db.table("weekly_routines").select("*").eq("user_id", x_user_id).execute()
+    routines = routines_result.data or []
+    
+    completions_by_routine = await load_completions(
+        [routine["id"] for routine in routines],
+        columns="*",
+        start_date=first_week_start,
+        end_date=get_week_end(last_week_start)
+    )
+    
+    return build_weekly_stats(routines, completions_by_routine, first_week_start, weeks)
+
+
 @router.post("", status_code=status.HTTP_201_CREATED)
-async def create_routine(routine_data: WeeklyRoutineCreate, x_user_id: str = Header(...)):
+async def create_routine(routine_data: WeeklyRoutineCreate, x_user_id: str = Depends(current_user_id)):
     """루틴 생성"""
     try:
         data = routine_data.dict()
         data["user_id"] = x_user_id
         
-        result = supabase.table("weekly_routines").insert(data).execute()
+        result = await db.table("weekly_routines").insert(data).execute()
         
         if not result.data:
             raise HTTPException(
@@ -66,6 +188,8 @@ async def create_routine(routine_data: WeeklyRoutineCreate, x_user_id: str = Hea
                 detail={"error": "루틴 생성에 실패했습니다", "code": "INTERNAL_SERVER_ERROR"}
             )
         
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_ROUTINE_CHANGE)
+        
         return {
             "message": "루틴이 생성되었습니다",
             "data": result.data[0]
@@ -81,27 +205,26 @@ async def create_routine(routine_data: WeeklyRoutineCreate, x_user_id: str = Hea
 
 
 @router.get("", response_model=List[WeeklyRoutine])
-async def get_routines(x_user_id: str = Header(...)):
+async def get_routines(x_user_id: str = Depends(current_user_id)):
     """루틴 목록 조회 (완료 기록 포함)"""
     try:
         # 루틴 조회
-        routines_result = supabase.table("weekly_routines").select("*").eq("user_id", x_user_id).order("created_at", desc=True).execute()
+        routines_result = await db.table("weekly_routines").select("*").eq("user_id", x_user_id).order("created_at", desc=True).execute()
         
-        routines = []
-        for routine in routines_result.data or []:
-            # 각 루틴의 완료 기록 조회
-            completions_result = supabase.table("routine_completions").select("id, routine_id, completion_date").eq("routine_id", routine["id"]).order("completion_date", desc=True).execute()
-            
+        routines = routines_result.data or []
+        
+        # 모든 루틴의 완료 기록을 한 번에 조회
+        completions_by_routine = await load_completions([routine["id"] for routine in routines], desc=True)
+        
+        for routine in routines:
             routine["completions"] = [
                 {
                     "id": c["id"],
                     "routine_id": c["routine_id"],
                     "completion_date": c["completion_date"]
                 }
-                for c in (completions_result.data or [])
+                for c in completions_by_routine[routine["id"]]
             ]
-            
-            routines.append(routine)
         
         return routines
     
@@ -112,11 +235,65 @@ async def get_routines(x_user_id: str = Header(...)):
         )
 
 
+@router.get("/weekly-stats", response_model=WeeklyStatsResponse)
+async def get_weekly_stats(
+    x_user_id: str = Depends(current_user_id),
+    week_start: Optional[date] = Query(None, description="주 시작일 (YYYY-MM-DD)")
+):
+    """주간 통계 조회"""
+    try:
+        # 주 시작일 계산
+        if week_start is None:
+            week_start = get_week_start()
+        
+        cached = await cache.get(f"routines:weekly-stats:{week_start}", x_user_id)
+        if cached is not None:
+            return cached
+        
+        weekly_stats = await fetch_weekly_stats(x_user_id, week_start, weeks=1)
+        response_data = weekly_stats[0].dict()
+        await cache.set(f"routines:weekly-stats:{week_start}", x_user_id, response_data)
+        return response_data
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": str(e), "code": "INTERNAL_SERVER_ERROR"}
+        )
+
+
+@router.get("/weekly-stats/history", response_model=List[WeeklyStatsResponse])
+async def get_weekly_stats_history(
+    x_user_id: str = Depends(current_user_id),
+    week_start: Optional[date] = Query(None, description="마지막 주 시작일 (YYYY-MM-DD)"),
+    weeks: int = Query(4, ge=1, le=52, description="조회할 연속 주 수")
+):
+    """최근 N주 주간 통계 조회 (오래된 주 → 최근 주 순)"""
+    try:
+        if week_start is None:
+            week_start = get_week_start()
+        
+        cached = await cache.get(f"routines:weekly-stats-history:{week_start}:{weeks}", x_user_id)
+        if cached is not None:
+            return cached
+        
+        weekly_stats = await fetch_weekly_stats(x_user_id, week_start, weeks=weeks)
+        response_data = [week.dict() for week in weekly_stats]
+        await cache.set(f"routines:weekly-stats-history:{week_start}:{weeks}", x_user_id, response_data)
+        return response_data
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": str(e), "code": "INTERNAL_SERVER_ERROR"}
+        )
+
+
 @router.get("/{routine_id}")
-async def get_routine(routine_id: int, x_user_id: str = Header(...)):
+async def get_routine(routine_id: int, x_user_id: str = Depends(current_user_id)):
     """특정 루틴 상세 조회"""
     try:
-        result = supabase.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
+        result = await db.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
         
         if not result.data:
             raise HTTPException(
@@ -127,7 +304,7 @@ async def get_routine(routine_id: int, x_user_id: str = Header(...)):
         routine = result.data[0]
         
         # 완료 기록 조회
-        completions_result = supabase.table("routine_completions").select("id, routine_id, completion_date").eq("routine_id", routine_id).execute()
+        completions_result = await db.table("routine_completions").select("id, routine_id, completion_date").eq("routine_id", routine_id).execute()
         
         routine["completions"] = completions_result.data or []
         
@@ -143,11 +320,11 @@ async def get_routine(routine_id: int, x_user_id: str = Header(...)):
 
 
 @router.put("/{routine_id}")
-async def update_routine(routine_id: int, routine_data: WeeklyRoutineUpdate, x_user_id: str = Header(...)):
+async def update_routine(routine_id: int, routine_data: WeeklyRoutineUpdate, x_user_id: str = Depends(current_user_id)):
     """루틴 수정"""
     try:
         # 루틴 존재 여부 및 소유자 확인
-        existing = supabase.table("weekly_routines").select("id").eq("id", routine_id).eq("user_id", x_user_id).execute()
+        existing = await db.table("weekly_routines").select("id").eq("id", routine_id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -164,7 +341,9 @@ async def update_routine(routine_id: int, routine_data: WeeklyRoutineUpdate, x_u
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        result = supabase.table("weekly_routines").update(update_data).eq("id", routine_id).execute()
+        result = await db.table("weekly_routines").update(update_data).eq("id", routine_id).execute()
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_ROUTINE_CHANGE)
         
         return {
             "message": "루틴이 수정되었습니다",
@@ -181,11 +360,11 @@ async def update_routine(routine_id: int, routine_data: WeeklyRoutineUpdate, x_u
 
 
 @router.delete("/{routine_id}")
-async def delete_routine(routine_id: int, x_user_id: str = Header(...)):
+async def delete_routine(routine_id: int, x_user_id: str = Depends(current_user_id)):
     """루틴 삭제 (완료 기록도 자동 삭제)"""
     try:
         # 루틴 존재 여부 및 소유자 확인
-        existing = supabase.table("weekly_routines").select("id").eq("id", routine_id).eq("user_id", x_user_id).execute()
+        existing = await db.table("weekly_routines").select("id").eq("id", routine_id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -193,7 +372,9 @@ async def delete_routine(routine_id: int, x_user_id: str = Header(...)):
                 detail={"error": "루틴을 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("weekly_routines").delete().eq("id", routine_id).execute()
+        await db.table("weekly_routines").delete().eq("id", routine_id).execute()
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_ROUTINE_CHANGE)
         
         return {"message": "루틴이 삭제되었습니다"}
     
@@ -211,12 +392,12 @@ async def complete_routine(
     routine_id: int,
     complete_data: Optional[RoutineCompleteRequest] = None,
     completion_date: Optional[str] = Query(None, description="완료 날짜 (YYYY-MM-DD)"),
-    x_user_id: str = Header(...)
+    x_user_id: str = Depends(current_user_id)
 ):
     """루틴 완료 처리 (드래그 앤 드롭 시 호출)"""
     try:
         # 루틴 존재 여부 및 소유자 확인
-        routine_result = supabase.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
+        routine_result = await db.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
         
         if not routine_result.data:
             raise HTTPException(
@@ -243,7 +424,7 @@ async def complete_routine(
         }
         
         try:
-            completion_result = supabase.table("routine_completions").insert(completion_data_dict).execute()
+            completion_result = await db.table("routine_completions").insert(completion_data_dict).execute()
         except Exception as e:
             # 중복 완료 체크 (UNIQUE 제약 위반)
             if "duplicate" in str(e).lower() or "unique" in str(e).lower():
@@ -257,7 +438,7 @@ async def complete_routine(
         week_start = get_week_start(target_date)
         week_end = get_week_end(week_start)
         
-        completions_result = supabase.table("routine_completions").select("*").eq("routine_id", routine_id).gte("completion_date", week_start.isoformat()).lte("completion_date", week_end.isoformat()).execute()
+        completions_result = await db.table("routine_completions").select("*").eq("routine_id", routine_id).gte("completion_date", week_start.isoformat()).lte("completion_date", week_end.isoformat()).execute()
         
         # 주간 달성 상태 계산
         weekly_status = calculate_weekly_status(
@@ -267,6 +448,8 @@ async def complete_routine(
             week_start=week_start
         )
         
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_ROUTINE_CHANGE)
+        
         return {
             "message": "루틴이 완료 처리되었습니다",
             "data": completion_result.data[0] if completion_result.data else None,
@@ -287,7 +470,7 @@ async def uncomplete_routine(
     routine_id: int,
     date: Optional[date] = Query(None, description="완료 취소할 날짜 (YYYY-MM-DD)"),
     completion_date: Optional[str] = Query(None, description="완료 취소할 날짜 (대체)"),
-    x_user_id: str = Header(...)
+    x_user_id: str = Depends(current_user_id)
 ):
     """루틴 완료 취소 - Query 파라미터로 날짜 전달"""
     try:
@@ -304,7 +487,7 @@ async def uncomplete_routine(
             )
         
         # 루틴 존재 여부 확인
-        routine_result = supabase.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
+        routine_result = await db.table("weekly_routines").select("*").eq("id", routine_id).eq("user_id", x_user_id).execute()
         
         if not routine_result.data:
             raise HTTPException(
@@ -315,7 +498,7 @@ async def uncomplete_routine(
         routine = routine_result.data[0]
         
         # 완료 기록 조회
-        existing_completion = supabase.table("routine_completions").select("*").eq("routine_id", routine_id).eq("user_id", x_user_id).eq("completion_date", target_date.isoformat()).execute()
+        existing_completion = await db.table("routine_completions").select("*").eq("routine_id", routine_id).eq("user_id", x_user_id).eq("completion_date", target_date.isoformat()).execute()
         
         if not existing_completion.data:
             raise HTTPException(
@@ -325,7 +508,7 @@ async def uncomplete_routine(
         
         # ID로 직접 삭제 (더 확실한 방법)
         completion_id = existing_completion.data[0]["id"]
-        delete_result = supabase.table("routine_completions").delete().eq("id", completion_id).execute()
+        delete_result = await db.table("routine_completions").delete().eq("id", completion_id).execute()
         
         if not delete_result.data:
             raise HTTPException(
@@ -337,7 +520,7 @@ async def uncomplete_routine(
         week_start = get_week_start(target_date)
         week_end = get_week_end(week_start)
         
-        completions_result = supabase.table("routine_completions").select("*").eq("routine_id", routine_id).gte("completion_date", week_start.isoformat()).lte("completion_date", week_end.isoformat()).execute()
+        completions_result = await db.table("routine_completions").select("*").eq("routine_id", routine_id).gte("completion_date", week_start.isoformat()).lte("completion_date", week_end.isoformat()).execute()
         
         # 주간 달성 상태 재계산
         weekly_status = calculate_weekly_status(
@@ -347,6 +530,8 @@ async def uncomplete_routine(
             week_start=week_start
         )
         
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_ROUTINE_CHANGE)
+        
         return {
             "message": "루틴 완료가 취소되었습니다",
             "deleted_completion_id": completion_id,
@@ -361,81 +546,3 @@ async def uncomplete_routine(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": str(e), "code": "INTERNAL_SERVER_ERROR"}
         )
-
-
-@router.get("/weekly-stats", response_model=WeeklyStatsResponse)
-async def get_weekly_stats(
-    x_user_id: str = Header(...),
-    week_start: Optional[date] = Query(None, description="주 시작일 (YYYY-MM-DD)")
-):
-    """주간 통계 조회"""
-    try:
-        # 주 시작일 계산
-        if week_start is None:
-            week_start = get_week_start()
-        
-        week_end = get_week_end(week_start)
-        
-        # 사용자의 모든 루틴 조회
-        routines_result = supabase.table("weekly_routines").select("*").eq("user_id", x_user_id).execute()
-        
-        routines_stats = []
-        total_completions = 0
-        success_count = 0
-        in_progress_count = 0
-        
-        for routine in routines_result.data or []:
-            # 이번 주 완료 기록 조회
-            completions_result = supabase.table("routine_completions").select("*").eq("routine_id", routine["id"]).gte("completion_date", week_start.isoformat()).lte("completion_date", week_end.isoformat()).order("completion_date").execute()
-            
-            completions = completions_result.data or []
-            completed_count = len(completions)
-            total_completions += completed_count
-            
-            is_success = completed_count >= routine["frequency"]
-            progress = min(100.0, (completed_count / routine["frequency"]) * 100) if routine["frequency"] > 0 else 0.0
-            
-            if is_success:
-                success_count += 1
-            else:
-                in_progress_count += 1
-            
-            # 완료 기록을 날짜와 요일로 변환
-            completion_list = [
-                CompletionWithDay(
-                    date=c["completion_date"],
-                    day_of_week=(datetime.fromisoformat(c["completion_date"]).weekday() + 1) % 7  # 일요일=0
-                )
-                for c in completions
-            ]
-            
-            routines_stats.append(
-                RoutineStats(
-                    routine_id=routine["id"],
-                    title=routine["title"],
-                    frequency=routine["frequency"],
-                    color=routine["color"],
-                    completed_count=completed_count,
-                    is_success=is_success,
-                    progress=round(progress, 2),
-                    completions=completion_list
-                )
-            )
-        
-        return WeeklyStatsResponse(
-            week_start=week_start.isoformat(),
-            week_end=week_end.isoformat(),
-            routines=routines_stats,
-            summary=WeeklyStatsSummary(
-                total_routines=len(routines_result.data or []),
-                success_count=success_count,
-                in_progress_count=in_progress_count,
-                total_completions=total_completions
-            )
-        )
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": str(e), "code": "INTERNAL_SERVER_ERROR"}
-        )
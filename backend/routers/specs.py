@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List, Optional
 from models.schemas import (
     UserSpec, UserSpecUpdate, Education, EducationUpdate,
@@ -7,17 +7,19 @@ from models.schemas import (
     Activity, ActivityCreate, ActivityUpdate,
     DashboardData
 )
-from config.database import supabase
-from utils.helpers import calculate_radar_scores
+from config.database import db
+from utils.cache import cache, INVALIDATE_ON_SPEC_CHANGE
+from utils.helpers import calculate_radar_scores, format_server_timing
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/specs", tags=["스펙"])
 
 
 @router.get("", response_model=UserSpec)
-async def get_user_spec(x_user_id: str = Header(...)):
+async def get_user_spec(x_user_id: str = Depends(current_user_id)):
     """사용자 스펙 정보 조회"""
     try:
-        spec = supabase.table("user_specs").select("*").eq("user_id", x_user_id).execute()
+        spec = await db.table("user_specs").select("*").eq("user_id", x_user_id).execute()
         
         if not spec.data:
             raise HTTPException(
@@ -37,7 +39,7 @@ async def get_user_spec(x_user_id: str = Header(...)):
 
 
 @router.put("", response_model=UserSpec)
-async def update_user_spec(spec_data: UserSpecUpdate, x_user_id: str = Header(...)):
+async def update_user_spec(spec_data: UserSpecUpdate, x_user_id: str = Depends(current_user_id)):
     """사용자 스펙 정보 수정"""
     try:
         update_data = {k: v for k, v in spec_data.dict().items() if v is not None}
@@ -48,7 +50,7 @@ async def update_user_spec(spec_data: UserSpecUpdate, x_user_id: str = Header(..
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        result = supabase.table("user_specs").update(update_data).eq("user_id", x_user_id).execute()
+        result = await db.table("user_specs").update(update_data).eq("user_id", x_user_id).execute()
         
         if not result.data:
             raise HTTPException(
@@ -57,6 +59,8 @@ async def update_user_spec(spec_data: UserSpecUpdate, x_user_id: str = Header(..
             )
         
         # 요구사항에 맞는 응답 형식
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return {
             "message": "사용자 스펙이 업데이트되었습니다",
             "data": result.data[0]
@@ -72,10 +76,10 @@ async def update_user_spec(spec_data: UserSpecUpdate, x_user_id: str = Header(..
 
 
 @router.get("/education", response_model=Education)
-async def get_education(x_user_id: str = Header(...)):
+async def get_education(x_user_id: str = Depends(current_user_id)):
     """학력 정보 조회"""
     try:
-        education = supabase.table("educations").select("*").eq("user_id", x_user_id).execute()
+        education = await db.table("educations").select("*").eq("user_id", x_user_id).execute()
         
         if not education.data:
             raise HTTPException(
@@ -95,7 +99,7 @@ async def get_education(x_user_id: str = Header(...)):
 
 
 @router.put("/education", response_model=Education)
-async def update_education(edu_data: EducationUpdate, x_user_id: str = Header(...)):
+async def update_education(edu_data: EducationUpdate, x_user_id: str = Depends(current_user_id)):
     """학력 정보 수정"""
     try:
         update_data = {k: v for k, v in edu_data.dict().items() if v is not None}
@@ -106,13 +110,15 @@ async def update_education(edu_data: EducationUpdate, x_user_id: str = Header(..
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        existing = supabase.table("educations").select("id").eq("user_id", x_user_id).execute()
+        existing = await db.table("educations").select("id").eq("user_id", x_user_id).execute()
         
         if existing.data:
-            result = supabase.table("educations").update(update_data).eq("user_id", x_user_id).execute()
+            result = await db.table("educations").update(update_data).eq("user_id", x_user_id).execute()
         else:
             update_data["user_id"] = x_user_id
-            result = supabase.table("educations").insert(update_data).execute()
+            result = await db.table("educations").insert(update_data).execute()
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
         
         return result.data[0]
     
@@ -126,10 +132,10 @@ async def update_education(edu_data: EducationUpdate, x_user_id: str = Header(..
 
 
 @router.get("/languages", response_model=List[Language])
-async def get_languages(x_user_id: str = Header(...)):
+async def get_languages(x_user_id: str = Depends(current_user_id)):
     """어학 성적 목록 조회"""
     try:
-        languages = supabase.table("languages").select("*").eq("user_id", x_user_id).execute()
+        languages = await db.table("languages").select("*").eq("user_id", x_user_id).execute()
         return languages.data or []
     
     except Exception as e:
@@ -140,7 +146,7 @@ async def get_languages(x_user_id: str = Header(...)):
 
 
 @router.post("/languages", response_model=Language, status_code=status.HTTP_201_CREATED)
-async def create_language(lang_data: LanguageCreate, x_user_id: str = Header(...)):
+async def create_language(lang_data: LanguageCreate, x_user_id: str = Depends(current_user_id)):
     """어학 성적 추가"""
     try:
         data = lang_data.dict()
@@ -149,7 +155,9 @@ async def create_language(lang_data: LanguageCreate, x_user_id: str = Header(...
         if data.get("acquisition_date"):
             data["acquisition_date"] = str(data["acquisition_date"])
         
-        result = supabase.table("languages").insert(data).execute()
+        result = await db.table("languages").insert(data).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except Exception as e:
@@ -160,10 +168,10 @@ async def create_language(lang_data: LanguageCreate, x_user_id: str = Header(...
 
 
 @router.delete("/languages/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_language(id: int, x_user_id: str = Header(...)):
+async def delete_language(id: int, x_user_id: str = Depends(current_user_id)):
     """어학 성적 삭제"""
     try:
-        existing = supabase.table("languages").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("languages").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -171,7 +179,9 @@ async def delete_language(id: int, x_user_id: str = Header(...)):
                 detail={"error": "어학 성적을 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("languages").delete().eq("id", id).execute()
+        await db.table("languages").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -184,10 +194,10 @@ async def delete_language(id: int, x_user_id: str = Header(...)):
 
 
 @router.get("/certificates", response_model=List[Certificate])
-async def get_certificates(x_user_id: str = Header(...)):
+async def get_certificates(x_user_id: str = Depends(current_user_id)):
     """자격증 목록 조회"""
     try:
-        certificates = supabase.table("certificates").select("*").eq("user_id", x_user_id).execute()
+        certificates = await db.table("certificates").select("*").eq("user_id", x_user_id).execute()
         return certificates.data or []
     
     except Exception as e:
@@ -198,7 +208,7 @@ async def get_certificates(x_user_id: str = Header(...)):
 
 
 @router.post("/certificates", response_model=Certificate, status_code=status.HTTP_201_CREATED)
-async def create_certificate(cert_data: CertificateCreate, x_user_id: str = Header(...)):
+async def create_certificate(cert_data: CertificateCreate, x_user_id: str = Depends(current_user_id)):
     """자격증 추가"""
     try:
         data = cert_data.dict()
@@ -207,7 +217,9 @@ async def create_certificate(cert_data: CertificateCreate, x_user_id: str = Head
         if data.get("acquisition_date"):
             data["acquisition_date"] = str(data["acquisition_date"])
         
-        result = supabase.table("certificates").insert(data).execute()
+        result = await db.table("certificates").insert(data).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except Exception as e:
@@ -218,10 +230,10 @@ async def create_certificate(cert_data: CertificateCreate, x_user_id: str = Head
 
 
 @router.delete("/certificates/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_certificate(id: int, x_user_id: str = Header(...)):
+async def delete_certificate(id: int, x_user_id: str = Depends(current_user_id)):
     """자격증 삭제"""
     try:
-        existing = supabase.table("certificates").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("certificates").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -229,7 +241,9 @@ async def delete_certificate(id: int, x_user_id: str = Header(...)):
                 detail={"error": "자격증을 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("certificates").delete().eq("id", id).execute()
+        await db.table("certificates").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -242,10 +256,10 @@ async def delete_certificate(id: int, x_user_id: str = Header(...)):
 
 
 @router.get("/projects", response_model=List[Project])
-async def get_projects(x_user_id: str = Header(...)):
+async def get_projects(x_user_id: str = Depends(current_user_id)):
     """프로젝트 목록 조회"""
     try:
-        projects = supabase.table("projects").select("*").eq("user_id", x_user_id).execute()
+        projects = await db.table("projects").select("*").eq("user_id", x_user_id).execute()
         return projects.data or []
     
     except Exception as e:
@@ -256,13 +270,15 @@ async def get_projects(x_user_id: str = Header(...)):
 
 
 @router.post("/projects", response_model=Project, status_code=status.HTTP_201_CREATED)
-async def create_project(proj_data: ProjectCreate, x_user_id: str = Header(...)):
+async def create_project(proj_data: ProjectCreate, x_user_id: str = Depends(current_user_id)):
     """프로젝트 추가"""
     try:
         data = proj_data.dict()
         data["user_id"] = x_user_id
         
-        result = supabase.table("projects").insert(data).execute()
+        result = await db.table("projects").insert(data).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except Exception as e:
@@ -273,7 +289,7 @@ async def create_project(proj_data: ProjectCreate, x_user_id: str = Header(...))
 
 
 @router.put("/projects/{id}", response_model=Project)
-async def update_project(id: int, proj_data: ProjectUpdate, x_user_id: str = Header(...)):
+async def update_project(id: int, proj_data: ProjectUpdate, x_user_id: str = Depends(current_user_id)):
     """프로젝트 수정"""
     try:
         update_data = {k: v for k, v in proj_data.dict().items() if v is not None}
@@ -284,7 +300,7 @@ async def update_project(id: int, proj_data: ProjectUpdate, x_user_id: str = Hea
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        existing = supabase.table("projects").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("projects").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -292,7 +308,9 @@ async def update_project(id: int, proj_data: ProjectUpdate, x_user_id: str = Hea
                 detail={"error": "프로젝트를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        result = supabase.table("projects").update(update_data).eq("id", id).execute()
+        result = await db.table("projects").update(update_data).eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except HTTPException:
@@ -305,10 +323,10 @@ async def update_project(id: int, proj_data: ProjectUpdate, x_user_id: str = Hea
 
 
 @router.delete("/projects/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(id: int, x_user_id: str = Header(...)):
+async def delete_project(id: int, x_user_id: str = Depends(current_user_id)):
     """프로젝트 삭제"""
     try:
-        existing = supabase.table("projects").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("projects").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -316,7 +334,9 @@ async def delete_project(id: int, x_user_id: str = Header(...)):
                 detail={"error": "프로젝트를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("projects").delete().eq("id", id).execute()
+        await db.table("projects").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -329,10 +349,10 @@ async def delete_project(id: int, x_user_id: str = Header(...)):
 
 
 @router.get("/activities", response_model=List[Activity])
-async def get_activities(x_user_id: str = Header(...)):
+async def get_activities(x_user_id: str = Depends(current_user_id)):
     """대외활동 목록 조회"""
     try:
-        activities = supabase.table("activities").select("*").eq("user_id", x_user_id).execute()
+        activities = await db.table("activities").select("*").eq("user_id", x_user_id).execute()
         return activities.data or []
     
     except Exception as e:
@@ -343,13 +363,15 @@ async def get_activities(x_user_id: str = Header(...)):
 
 
 @router.post("/activities", response_model=Activity, status_code=status.HTTP_201_CREATED)
-async def create_activity(act_data: ActivityCreate, x_user_id: str = Header(...)):
+async def create_activity(act_data: ActivityCreate, x_user_id: str = Depends(current_user_id)):
     """대외활동 추가"""
     try:
         data = act_data.dict()
         data["user_id"] = x_user_id
         
-        result = supabase.table("activities").insert(data).execute()
+        result = await db.table("activities").insert(data).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except Exception as e:
@@ -360,7 +382,7 @@ async def create_activity(act_data: ActivityCreate, x_user_id: str = Header(...)
 
 
 @router.put("/activities/{id}", response_model=Activity)
-async def update_activity(id: int, act_data: ActivityUpdate, x_user_id: str = Header(...)):
+async def update_activity(id: int, act_data: ActivityUpdate, x_user_id: str = Depends(current_user_id)):
     """대외활동 수정"""
     try:
         update_data = {k: v for k, v in act_data.dict().items() if v is not None}
@@ -371,7 +393,7 @@ async def update_activity(id: int, act_data: ActivityUpdate, x_user_id: str = He
                 detail={"error": "수정할 데이터가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        existing = supabase.table("activities").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("activities").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -379,7 +401,9 @@ async def update_activity(id: int, act_data: ActivityUpdate, x_user_id: str = He
                 detail={"error": "대외활동을 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        result = supabase.table("activities").update(update_data).eq("id", id).execute()
+        result = await db.table("activities").update(update_data).eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return result.data[0]
     
     except HTTPException:
@@ -392,10 +416,10 @@ async def update_activity(id: int, act_data: ActivityUpdate, x_user_id: str = He
 
 
 @router.delete("/activities/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_activity(id: int, x_user_id: str = Header(...)):
+async def delete_activity(id: int, x_user_id: str = Depends(current_user_id)):
     """대외활동 삭제"""
     try:
-        existing = supabase.table("activities").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("activities").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -403,7 +427,9 @@ async def delete_activity(id: int, x_user_id: str = Header(...)):
                 detail={"error": "대외활동을 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("activities").delete().eq("id", id).execute()
+        await db.table("activities").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_SPEC_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -416,26 +442,30 @@ async def delete_activity(id: int, x_user_id: str = Header(...)):
 
 
 @router.get("/dashboard", response_model=DashboardData)
-async def get_dashboard(x_user_id: str = Header(...)):
+async def get_dashboard(response: Response, x_user_id: str = Depends(current_user_id)):
     """스펙 대시보드 데이터 조회"""
     try:
-        user_spec_res = supabase.table("user_specs").select("*").eq("user_id", x_user_id).execute()
-        user_spec = user_spec_res.data[0] if user_spec_res.data else None
-        
-        education_res = supabase.table("educations").select("*").eq("user_id", x_user_id).execute()
-        education = education_res.data[0] if education_res.data else None
-        
-        languages_res = supabase.table("languages").select("*").eq("user_id", x_user_id).execute()
-        languages = languages_res.data or []
-        
-        certificates_res = supabase.table("certificates").select("*").eq("user_id", x_user_id).execute()
-        certificates = certificates_res.data or []
-        
-        projects_res = supabase.table("projects").select("*").eq("user_id", x_user_id).execute()
-        projects = projects_res.data or []
-        
-        activities_res = supabase.table("activities").select("*").eq("user_id", x_user_id).execute()
-        activities = activities_res.data or []
+        cached = await cache.get("specs:dashboard", x_user_id)
+        if cached is not None:
+            return cached
+        
+        # 독립적인 테이블 조회를 동시에 실행
+        results, timings = await db.gather({
+            "user_specs": db.table("user_specs").select("*").eq("user_id", x_user_id),
+            "educations": db.table("educations").select("*").eq("user_id", x_user_id),
+            "languages": db.table("languages").select("*").eq("user_id", x_user_id),
+            "certificates": db.table("certificates").select("*").eq("user_id", x_user_id),
+            "projects": db.table("projects").select("*").eq("user_id", x_user_id),
+            "activities": db.table("activities").select("*").eq("user_id", x_user_id)
+        })
+        response.headers["Server-Timing"] = format_server_timing(timings)
+        
+        user_spec = results["user_specs"].data[0] if results["user_specs"].data else None
+        education = results["educations"].data[0] if results["educations"].data else None
+        languages = results["languages"].data or []
+        certificates = results["certificates"].data or []
+        projects = results["projects"].data or []
+        activities = results["activities"].data or []
         
         stats = {
             "language_count": len(languages),
@@ -446,7 +476,7 @@ async def get_dashboard(x_user_id: str = Header(...)):
         
         radar_scores = calculate_radar_scores(education, languages, certificates, projects, activities)
         
-        return {
+        response_data = {
             "user_spec": user_spec,
             "education": education,
             "languages": languages,
@@ -456,6 +486,8 @@ async def get_dashboard(x_user_id: str = Header(...)):
             "stats": stats,
             "radar_scores": radar_scores
         }
+        await cache.set("specs:dashboard", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
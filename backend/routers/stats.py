@@ -1,89 +1,57 @@
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Dict, List
 from datetime import datetime, date, timedelta
-from config.database import supabase
-from utils.helpers import parse_json_field
+from config.database import db
+from utils.cache import cache
+from utils.helpers import parse_job_requirements
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/stats", tags=["통계"])
 
 
 @router.get("/dashboard")
-async def get_dashboard_stats(x_user_id: str = Header(...)):
+async def get_dashboard_stats(x_user_id: str = Depends(current_user_id)):
     """대시보드용 전체 통계"""
     try:
-        # 목표 통계
-        all_goals = supabase.table("goals").select("*").eq("user_id", x_user_id).execute()
-        goals = all_goals.data or []
-        active_goal = next((g for g in goals if g.get("is_active")), None)
+        cached = await cache.get("stats:dashboard", x_user_id)
+        if cached is not None:
+            return cached
         
-        # 태스크 통계
-        all_tasks = supabase.table("tasks").select("*").eq("user_id", x_user_id).execute()
-        tasks = all_tasks.data or []
-        
-        # 완료된 태스크 통계
-        completed_tasks = [t for t in tasks if t.get("is_completed")]
-        pending_tasks = [t for t in tasks if not t.get("is_completed")]
-        
-        # 우선순위별 통계
-        high_priority_tasks = [t for t in pending_tasks if t.get("priority") == "high"]
-        medium_priority_tasks = [t for t in pending_tasks if t.get("priority") == "medium"]
-        low_priority_tasks = [t for t in pending_tasks if t.get("priority") == "low"]
-        
-        # 오늘 할 일
-        today = str(date.today())
-        today_tasks = [t for t in pending_tasks if t.get("due_date") == today]
-        
-        # 이번 주 할 일
-        week_end = date.today() + timedelta(days=7)
-        this_week_tasks = [
-            t for t in pending_tasks 
-            if t.get("due_date") and date.fromisoformat(t["due_date"]) <= week_end
-        ]
-        
-        # 지연된 태스크
-        overdue_tasks = [
-            t for t in pending_tasks 
-            if t.get("due_date") and date.fromisoformat(t["due_date"]) < date.today()
-        ]
+        # 목표/태스크 집계는 DB 함수(get_dashboard_stats)에서 수행하고 요약 1행만 받음
+        result = await db.rpc("get_dashboard_stats", {
+            "p_user_id": x_user_id,
+            "p_today": str(date.today())
+        }).execute()
+        stats = result.data[0]
         
         # 완료율
-        completion_rate = (len(completed_tasks) / len(tasks) * 100) if tasks else 0
+        total_tasks = stats["total_tasks"]
+        completion_rate = (stats["completed_tasks"] / total_tasks * 100) if total_tasks else 0
         
-        # 최근 7일간 활동
-        recent_activities = []
-        for i in range(7):
-            day = date.today() - timedelta(days=i)
-            day_completed = len([
-                t for t in completed_tasks 
-                if t.get("completed_at") and t["completed_at"].startswith(str(day))
-            ])
-            recent_activities.append({
-                "date": str(day),
-                "completed_tasks": day_completed
-            })
-        
-        return {
+        response_data = {
             "user_id": x_user_id,
             "summary": {
-                "total_goals": len(goals),
-                "active_goal": active_goal,
-                "total_tasks": len(tasks),
-                "completed_tasks": len(completed_tasks),
-                "pending_tasks": len(pending_tasks),
+                "total_goals": stats["total_goals"],
+                "active_goal": stats["active_goal"],
+                "total_tasks": total_tasks,
+                "completed_tasks": stats["completed_tasks"],
+                "pending_tasks": stats["pending_tasks"],
                 "completion_rate": round(completion_rate, 2)
             },
             "tasks_by_priority": {
-                "high": len(high_priority_tasks),
-                "medium": len(medium_priority_tasks),
-                "low": len(low_priority_tasks)
+                "high": stats["high_priority"],
+                "medium": stats["medium_priority"],
+                "low": stats["low_priority"]
             },
             "upcoming": {
-                "today": len(today_tasks),
-                "this_week": len(this_week_tasks),
-                "overdue": len(overdue_tasks)
+                "today": stats["today_tasks"],
+                "this_week": stats["this_week_tasks"],
+                "overdue": stats["overdue_tasks"]
             },
-            "recent_activity": recent_activities
+            "recent_activity": stats["recent_activity"] or []
         }
+        await cache.set("stats:dashboard", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
@@ -93,16 +61,20 @@ async def get_dashboard_stats(x_user_id: str = Header(...)):
 
 
 @router.get("/weekly")
-async def get_weekly_stats(x_user_id: str = Header(...)):
+async def get_weekly_stats(x_user_id: str = Depends(current_user_id)):
     """주간 통계"""
     try:
+        cached = await cache.get("stats:weekly", x_user_id)
+        if cached is not None:
+            return cached
+        
         # 이번 주의 시작과 끝
         today = date.today()
         week_start = today - timedelta(days=today.weekday())
         week_end = week_start + timedelta(days=6)
         
         # 이번 주의 태스크
-        all_tasks = supabase.table("tasks").select("*").eq("user_id", x_user_id).execute()
+        all_tasks = await db.table("tasks").select("*").eq("user_id", x_user_id).execute()
         tasks = all_tasks.data or []
         
         week_tasks = [
@@ -132,7 +104,7 @@ async def get_weekly_stats(x_user_id: str = Header(...)):
         week_completed = [t for t in week_tasks if t.get("is_completed")]
         week_completion_rate = (len(week_completed) / len(week_tasks) * 100) if week_tasks else 0
         
-        return {
+        response_data = {
             "week_start": str(week_start),
             "week_end": str(week_end),
             "summary": {
@@ -142,6 +114,8 @@ async def get_weekly_stats(x_user_id: str = Header(...)):
             },
             "daily_breakdown": daily_stats
         }
+        await cache.set("stats:weekly", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
@@ -151,9 +125,13 @@ async def get_weekly_stats(x_user_id: str = Header(...)):
 
 
 @router.get("/monthly")
-async def get_monthly_stats(x_user_id: str = Header(...)):
+async def get_monthly_stats(x_user_id: str = Depends(current_user_id)):
     """월간 통계"""
     try:
+        cached = await cache.get("stats:monthly", x_user_id)
+        if cached is not None:
+            return cached
+        
         # 이번 달의 시작과 끝
         today = date.today()
         month_start = today.replace(day=1)
@@ -165,7 +143,7 @@ async def get_monthly_stats(x_user_id: str = Header(...)):
             month_end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
         
         # 이번 달의 태스크
-        all_tasks = supabase.table("tasks").select("*").eq("user_id", x_user_id).execute()
+        all_tasks = await db.table("tasks").select("*").eq("user_id", x_user_id).execute()
         tasks = all_tasks.data or []
         
         month_tasks = [
@@ -206,7 +184,7 @@ async def get_monthly_stats(x_user_id: str = Header(...)):
         month_completed = [t for t in month_tasks if t.get("is_completed")]
         month_completion_rate = (len(month_completed) / len(month_tasks) * 100) if month_tasks else 0
         
-        return {
+        response_data = {
             "month": f"{today.year}-{today.month:02d}",
             "month_start": str(month_start),
             "month_end": str(month_end),
@@ -217,6 +195,8 @@ async def get_monthly_stats(x_user_id: str = Header(...)):
             },
             "weekly_breakdown": weekly_stats
         }
+        await cache.set("stats:monthly", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
@@ -226,11 +206,15 @@ async def get_monthly_stats(x_user_id: str = Header(...)):
 
 
 @router.get("/goal/{goal_id}")
-async def get_goal_stats(goal_id: int, x_user_id: str = Header(...)):
+async def get_goal_stats(goal_id: int, x_user_id: str = Depends(current_user_id)):
     """특정 목표의 상세 통계"""
     try:
+        cached = await cache.get(f"stats:goal:{goal_id}", x_user_id)
+        if cached is not None:
+            return cached
+        
         # 목표 정보
-        goal_result = supabase.table("goals").select("*").eq("id", goal_id).eq("user_id", x_user_id).execute()
+        goal_result = await db.table("goals").select("*").eq("id", goal_id).eq("user_id", x_user_id).execute()
         
         if not goal_result.data:
             raise HTTPException(
@@ -239,11 +223,11 @@ async def get_goal_stats(goal_id: int, x_user_id: str = Header(...)):
             )
         
         goal = goal_result.data[0]
-        goal["requirements"] = parse_json_field(goal.get("requirements"))
-        goal["preferred"] = parse_json_field(goal.get("preferred"))
+        goal["requirements"] = parse_job_requirements(goal.get("requirements"))
+        goal["preferred"] = parse_job_requirements(goal.get("preferred"))
         
         # 목표에 연결된 태스크
-        tasks_result = supabase.table("tasks").select("*").eq("goal_id", goal_id).execute()
+        tasks_result = await db.table("tasks").select("*").eq("goal_id", goal_id).execute()
         tasks = tasks_result.data or []
         
         # 태스크 통계
@@ -265,7 +249,7 @@ async def get_goal_stats(goal_id: int, x_user_id: str = Header(...)):
             deadline_date = date.fromisoformat(goal["deadline"])
             days_remaining = (deadline_date - date.today()).days
         
-        return {
+        response_data = {
             "goal": goal,
             "statistics": {
                 "total_tasks": total_tasks,
@@ -293,6 +277,8 @@ async def get_goal_stats(goal_id: int, x_user_id: str = Header(...)):
                 "total_preferred": len(goal.get("preferred", []))
             }
         }
+        await cache.set(f"stats:goal:{goal_id}", x_user_id, response_data)
+        return response_data
     
     except HTTPException:
         raise
@@ -1,20 +1,30 @@
-from fastapi import APIRouter, Header, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 from models.schemas import Task, TaskCreate, TaskUpdate, TaskAutoGenerate
-from config.database import supabase
+from config.database import db
+from utils.cache import cache, INVALIDATE_ON_TASK_CHANGE
 from utils.helpers import days_until
+from utils.requirement_matcher import matcher
+from utils.serialization import trusted_rows, trusted_response
+from utils.tokens import current_user_id
 
 router = APIRouter(tags=["로드맵"])
 
 
+def get_skipped_ids(task_ids: List[int], affected_tasks: List[dict]) -> List[int]:
+    """요청한 ID 중 업데이트되지 않은(존재하지 않거나 권한 없는) 태스크 ID 목록"""
+    affected_ids = {task["id"] for task in affected_tasks}
+    return [task_id for task_id in dict.fromkeys(task_ids) if task_id not in affected_ids]
+
+
 @router.get("/tasks/today", response_model=List[Task])
-async def get_today_tasks(x_user_id: str = Header(...)):
+async def get_today_tasks(x_user_id: str = Depends(current_user_id)):
     """오늘의 할 일 조회"""
     try:
         from datetime import date
         today = date.today()
-        tasks = supabase.table("tasks").select("*").eq("user_id", x_user_id).eq("due_date", str(today)).eq("is_completed", False).execute()
+        tasks = await db.table("tasks").select("*").eq("user_id", x_user_id).eq("due_date", str(today)).eq("is_completed", False).execute()
         result = tasks.data or []
         
         # 중복 ID 제거 (같은 ID는 첫 번째만 유지)
@@ -25,7 +35,8 @@ async def get_today_tasks(x_user_id: str = Header(...)):
                 seen_ids.add(task.get("id"))
                 unique_tasks.append(task)
         
-        return unique_tasks
+        # DB 행을 그대로 응답 (response_model 재검증 생략)
+        return trusted_response(trusted_rows(Task, unique_tasks))
     
     except Exception as e:
         raise HTTPException(
@@ -36,14 +47,14 @@ async def get_today_tasks(x_user_id: str = Header(...)):
 
 @router.get("/tasks", response_model=List[Task])
 async def get_tasks(
-    x_user_id: str = Header(...),
+    x_user_id: str = Depends(current_user_id),
     is_completed: Optional[bool] = Query(None),
     due_date: Optional[date] = Query(None),
     priority: Optional[str] = Query(None)
 ):
     """업무 목록 조회"""
     try:
-        query = supabase.table("tasks").select("*").eq("user_id", x_user_id)
+        query = db.table("tasks").select("*").eq("user_id", x_user_id)
         
         if is_completed is not None:
             query = query.eq("is_completed", is_completed)
@@ -54,7 +65,7 @@ async def get_tasks(
         if priority is not None:
             query = query.eq("priority", priority)
         
-        result = query.order("order_index").execute()
+        result = await query.order("order_index").execute()
         tasks = result.data or []
         
         # 중복 ID 제거 (같은 ID는 첫 번째만 유지)
@@ -65,7 +76,8 @@ async def get_tasks(
                 seen_ids.add(task.get("id"))
                 unique_tasks.append(task)
         
-        return unique_tasks
+        # DB 행을 그대로 응답 (response_model 재검증 생략)
+        return trusted_response(trusted_rows(Task, unique_tasks))
     
     except Exception as e:
         raise HTTPException(
@@ -75,7 +87,7 @@ async def get_tasks(
 
 
 @router.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
-async def create_task(task_data: TaskCreate, x_user_id: str = Header(...)):
+async def create_task(task_data: TaskCreate, x_user_id: str = Depends(current_user_id)):
     """업무 추가"""
     try:
         data = task_data.dict()
@@ -85,7 +97,9 @@ async def create_task(task_data: TaskCreate, x_user_id: str = Header(...)):
         if data.get("due_date"):
             data["due_date"] = str(data["due_date"])
         
-        result = supabase.table("tasks").insert(data).execute()
+        result = await db.table("tasks").insert(data).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+        
         return result.data[0]
     
     except Exception as e:
@@ -96,10 +110,10 @@ async def create_task(task_data: TaskCreate, x_user_id: str = Header(...)):
 
 
 @router.get("/tasks/{id}", response_model=Task)
-async def get_task(id: int, x_user_id: str = Header(...)):
+async def get_task(id: int, x_user_id: str = Depends(current_user_id)):
     """업무 상세 조회"""
     try:
-        task = supabase.table("tasks").select("*").eq("id", id).eq("user_id", x_user_id).execute()
+        task = await db.table("tasks").select("*").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not task.data:
             raise HTTPException(
@@ -119,7 +133,7 @@ async def get_task(id: int, x_user_id: str = Header(...)):
 
 
 @router.put("/tasks/{id}", response_model=Task)
-async def update_task(id: int, task_data: TaskUpdate, x_user_id: str = Header(...)):
+async def update_task(id: int, task_data: TaskUpdate, x_user_id: str = Depends(current_user_id)):
     """업무 수정"""
     try:
         update_data = {k: v for k, v in task_data.dict().items() if v is not None}
@@ -133,7 +147,7 @@ async def update_task(id: int, task_data: TaskUpdate, x_user_id: str = Header(..
         if "due_date" in update_data and update_data["due_date"]:
             update_data["due_date"] = str(update_data["due_date"])
         
-        existing = supabase.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -141,7 +155,9 @@ async def update_task(id: int, task_data: TaskUpdate, x_user_id: str = Header(..
                 detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        result = supabase.table("tasks").update(update_data).eq("id", id).execute()
+        result = await db.table("tasks").update(update_data).eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+        
         return result.data[0]
     
     except HTTPException:
@@ -154,10 +170,10 @@ async def update_task(id: int, task_data: TaskUpdate, x_user_id: str = Header(..
 
 
 @router.delete("/tasks/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(id: int, x_user_id: str = Header(...)):
+async def delete_task(id: int, x_user_id: str = Depends(current_user_id)):
     """업무 삭제"""
     try:
-        existing = supabase.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -165,7 +181,9 @@ async def delete_task(id: int, x_user_id: str = Header(...)):
                 detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("tasks").delete().eq("id", id).execute()
+        await db.table("tasks").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -178,10 +196,10 @@ async def delete_task(id: int, x_user_id: str = Header(...)):
 
 
 @router.post("/tasks/{id}/delete", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task_post(id: int, x_user_id: str = Header(...)):
+async def delete_task_post(id: int, x_user_id: str = Depends(current_user_id)):
     """업무 삭제 (POST 방식 - 프론트엔드 호환)"""
     try:
-        existing = supabase.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -189,7 +207,9 @@ async def delete_task_post(id: int, x_user_id: str = Header(...)):
                 detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        supabase.table("tasks").delete().eq("id", id).execute()
+        await db.table("tasks").delete().eq("id", id).execute()
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+        
         return None
     
     except HTTPException:
@@ -201,80 +221,72 @@ async def delete_task_post(id: int, x_user_id: str = Header(...)):
         )
 
 
+def reflection_experience(reflection_data: Optional[dict]) -> Optional[dict]:
+    """회고 요청 본문 → 경험 필드 (회고를 건너뛰거나 배운 점이 없으면 None)"""
+    if not reflection_data or reflection_data.get("skip_reflection", False):
+        return None
+    
+    reflection = reflection_data.get("reflection")
+    if not reflection or not reflection.get("learned"):
+        return None
+    
+    # URL 형식 검증
+    related_resources = reflection_data.get("related_resources", [])
+    for url in related_resources:
+        if url and not url.startswith(("http://", "https://")):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": f"잘못된 URL 형식: {url}", "code": "INVALID_URL"}
+            )
+    
+    return {
+        "learned": reflection["learned"],
+        "challenges": reflection.get("challenges"),
+        "solutions": reflection.get("solutions"),
+        "improvements": reflection.get("improvements"),
+        "tags": reflection_data.get("tags", []),
+        "related_resources": related_resources
+    }
+
+
+async def complete_with_reflection(id: int, reflection_data: Optional[dict], x_user_id: str) -> dict:
+    """태스크 완료 + 회고 경험 생성을 DB 함수 한 번(한 트랜잭션)으로 처리"""
+    experience_data = reflection_experience(reflection_data)
+    
+    # 경험 카테고리(목표 직무명)와 제목은 DB 함수가 태스크/목표에서 채움
+    result = await db.rpc("complete_task", {
+        "p_user_id": x_user_id,
+        "p_task_id": id,
+        "p_completed_at": datetime.utcnow().isoformat(),
+        "p_experience": experience_data
+    }).execute()
+    
+    if not result.data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
+        )
+    
+    row = result.data[0]
+    experience = row["experience"]
+    if row["experience_error"]:
+        # 경험 생성 실패해도 태스크 완료는 유지
+        print(f"Experience creation failed: {row['experience_error']}")
+    
+    await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+    
+    return {
+        "task": row["task"],
+        "experience": experience,
+        "message": "태스크가 완료되었습니다." + (" 회고가 저장되었습니다." if experience else " 회고는 나중에 작성할 수 있습니다.")
+    }
+
+
 @router.patch("/tasks/{id}/complete")
-async def complete_task_patch(id: int, reflection_data: Optional[dict] = None, x_user_id: str = Header(...)):
+async def complete_task_patch(id: int, reflection_data: Optional[dict] = None, x_user_id: str = Depends(current_user_id)):
     """업무 완료 처리 (PATCH) - 회고 연동 지원"""
     try:
-        from models.schemas import TaskCompleteWithReflection, Reflection
-        
-        # 태스크 조회
-        existing = supabase.table("tasks").select("*").eq("id", id).eq("user_id", x_user_id).execute()
-        
-        if not existing.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
-            )
-        
-        task = existing.data[0]
-        completed_date = datetime.utcnow()
-        
-        # 태스크 완료 처리
-        result = supabase.table("tasks").update({
-            "is_completed": True,
-            "completed_at": completed_date.isoformat()
-        }).eq("id", id).execute()
-        
-        experience = None
-        
-        # 회고 데이터가 있으면 경험 생성
-        if reflection_data and not reflection_data.get("skip_reflection", False):
-            reflection = reflection_data.get("reflection")
-            
-            if reflection and reflection.get("learned"):
-                # URL 형식 검증
-                related_resources = reflection_data.get("related_resources", [])
-                for url in related_resources:
-                    if url and not url.startswith(("http://", "https://")):
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail={"error": f"잘못된 URL 형식: {url}", "code": "INVALID_URL"}
-                        )
-                
-                # 목표 ID로부터 카테고리 추론
-                category = "기타"
-                if task.get("goal_id"):
-                    goal = supabase.table("goals").select("job_title").eq("id", task["goal_id"]).execute()
-                    if goal.data:
-                        category = goal.data[0].get("job_title", "기타")
-                
-                experience_data = {
-                    "user_id": x_user_id,
-                    "task_id": id,
-                    "title": task.get("title", ""),
-                    "category": category,
-                    "completed_date": reflection_data.get("completed_date", completed_date).isoformat() if isinstance(reflection_data.get("completed_date"), datetime) else completed_date.isoformat(),
-                    "learned": reflection["learned"],
-                    "challenges": reflection.get("challenges"),
-                    "solutions": reflection.get("solutions"),
-                    "improvements": reflection.get("improvements"),
-                    "tags": reflection_data.get("tags", []),
-                    "related_resources": related_resources
-                }
-                
-                try:
-                    exp_result = supabase.table("experiences").insert(experience_data).execute()
-                    if exp_result.data:
-                        experience = exp_result.data[0]
-                except Exception as exp_error:
-                    # 경험 생성 실패해도 태스크 완료는 유지
-                    print(f"Experience creation failed: {exp_error}")
-        
-        return {
-            "task": result.data[0],
-            "experience": experience,
-            "message": "태스크가 완료되었습니다." + (" 회고가 저장되었습니다." if experience else " 회고는 나중에 작성할 수 있습니다.")
-        }
+        return await complete_with_reflection(id, reflection_data, x_user_id)
     
     except HTTPException:
         raise
@@ -286,79 +298,10 @@ async def complete_task_patch(id: int, reflection_data: Optional[dict] = None, x
 
 
 @router.post("/tasks/{id}/complete")
-async def complete_task_post(id: int, reflection_data: Optional[dict] = None, x_user_id: str = Header(...)):
+async def complete_task_post(id: int, reflection_data: Optional[dict] = None, x_user_id: str = Depends(current_user_id)):
     """업무 완료 처리 (POST - 프론트엔드 호환, 회고 연동)"""
     try:
-        from models.schemas import TaskCompleteWithReflection, Reflection
-        
-        # 태스크 조회
-        existing = supabase.table("tasks").select("*").eq("id", id).eq("user_id", x_user_id).execute()
-        
-        if not existing.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
-            )
-        
-        task = existing.data[0]
-        completed_date = datetime.utcnow()
-        
-        # 태스크 완료 처리
-        task_result = supabase.table("tasks").update({
-            "is_completed": True,
-            "completed_at": completed_date.isoformat()
-        }).eq("id", id).execute()
-        
-        experience = None
-        
-        # 회고 데이터가 있으면 경험 생성
-        if reflection_data and not reflection_data.get("skip_reflection", False):
-            reflection = reflection_data.get("reflection")
-            
-            if reflection and reflection.get("learned"):
-                # URL 형식 검증
-                related_resources = reflection_data.get("related_resources", [])
-                for url in related_resources:
-                    if url and not url.startswith(("http://", "https://")):
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail={"error": f"잘못된 URL 형식: {url}", "code": "INVALID_URL"}
-                        )
-                
-                # 목표 ID로부터 카테고리 추론
-                category = "기타"
-                if task.get("goal_id"):
-                    goal = supabase.table("goals").select("job_title").eq("id", task["goal_id"]).execute()
-                    if goal.data:
-                        category = goal.data[0].get("job_title", "기타")
-                
-                experience_data = {
-                    "user_id": x_user_id,
-                    "task_id": id,
-                    "title": task.get("title", ""),
-                    "category": category,
-                    "completed_date": reflection_data.get("completed_date", completed_date).isoformat() if isinstance(reflection_data.get("completed_date"), datetime) else completed_date.isoformat(),
-                    "learned": reflection["learned"],
-                    "challenges": reflection.get("challenges"),
-                    "solutions": reflection.get("solutions"),
-                    "improvements": reflection.get("improvements"),
-                    "tags": reflection_data.get("tags", []),
-                    "related_resources": related_resources
-                }
-                
-                try:
-                    exp_result = supabase.table("experiences").insert(experience_data).execute()
-                    if exp_result.data:
-                        experience = exp_result.data[0]
-                except Exception as exp_error:
-                    # 경험 생성 실패해도 태스크 완료는 유지
-                    print(f"Experience creation failed: {exp_error}")
-        
-        return {
-            "task": task_result.data[0],
-            "experience": experience,
-            "message": "태스크가 완료되었습니다." + (" 회고가 저장되었습니다." if experience else " 회고는 나중에 작성할 수 있습니다.")
-        }
+        return await complete_with_reflection(id, reflection_data, x_user_id)
     
     except HTTPException:
         raise
@@ -370,10 +313,10 @@ async def complete_task_post(id: int, reflection_data: Optional[dict] = None, x_
 
 
 @router.patch("/tasks/{id}/incomplete", response_model=Task)
-async def incomplete_task(id: int, x_user_id: str = Header(...)):
+async def incomplete_task(id: int, x_user_id: str = Depends(current_user_id)):
     """업무 미완료 처리"""
     try:
-        existing = supabase.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
+        existing = await db.table("tasks").select("id").eq("id", id).eq("user_id", x_user_id).execute()
         
         if not existing.data:
             raise HTTPException(
@@ -381,11 +324,13 @@ async def incomplete_task(id: int, x_user_id: str = Header(...)):
                 detail={"error": "업무를 찾을 수 없습니다", "code": "NOT_FOUND"}
             )
         
-        result = supabase.table("tasks").update({
+        result = await db.table("tasks").update({
             "is_completed": False,
             "completed_at": None
         }).eq("id", id).execute()
         
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
+        
         return result.data[0]
     
     except HTTPException:
@@ -398,18 +343,22 @@ async def incomplete_task(id: int, x_user_id: str = Header(...)):
 
 
 @router.get("/roadmap/progress")
-async def get_roadmap_progress(x_user_id: str = Header(...)):
+async def get_roadmap_progress(x_user_id: str = Depends(current_user_id)):
     """로드맵 진행도 조회"""
     try:
-        goal = supabase.table("goals").select("*").eq("user_id", x_user_id).eq("is_active", True).execute()
+        cached = await cache.get("roadmap:progress", x_user_id)
+        if cached is not None:
+            return cached
+        
+        goal = await db.table("goals").select("*").eq("user_id", x_user_id).eq("is_active", True).execute()
         goal_data = goal.data[0] if goal.data else None
         
         if goal_data:
-            from utils.helpers import parse_json_field
-            goal_data["requirements"] = parse_json_field(goal_data.get("requirements"))
-            goal_data["preferred"] = parse_json_field(goal_data.get("preferred"))
+            from utils.helpers import parse_job_requirements
+            goal_data["requirements"] = parse_job_requirements(goal_data.get("requirements"))
+            goal_data["preferred"] = parse_job_requirements(goal_data.get("preferred"))
         
-        all_tasks = supabase.table("tasks").select("*").eq("user_id", x_user_id).execute()
+        all_tasks = await db.table("tasks").select("*").eq("user_id", x_user_id).execute()
         tasks = all_tasks.data or []
         
         total_tasks = len(tasks)
@@ -424,7 +373,7 @@ async def get_roadmap_progress(x_user_id: str = Header(...)):
         today = date.today()
         today_tasks = [t for t in tasks if t.get("due_date") == str(today) and not t.get("is_completed")]
         
-        return {
+        response_data = {
             "goal": goal_data,
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
@@ -432,6 +381,8 @@ async def get_roadmap_progress(x_user_id: str = Header(...)):
             "days_remaining": days_remaining,
             "today_tasks": today_tasks
         }
+        await cache.set("roadmap:progress", x_user_id, response_data)
+        return response_data
     
     except Exception as e:
         raise HTTPException(
@@ -441,14 +392,14 @@ async def get_roadmap_progress(x_user_id: str = Header(...)):
 
 
 @router.post("/tasks/auto-generate", status_code=status.HTTP_201_CREATED)
-async def auto_generate_tasks(data: TaskAutoGenerate, x_user_id: str = Header(...)):
+async def auto_generate_tasks(data: TaskAutoGenerate, x_user_id: str = Depends(current_user_id)):
     """태스크 자동 생성 (AI 기반)"""
     try:
         # 기존 태스크 order_index 최대값 확인
-        existing_tasks = supabase.table("tasks").select("order_index").eq("user_id", x_user_id).order("order_index", desc=True).limit(1).execute()
+        existing_tasks = await db.table("tasks").select("order_index").eq("user_id", x_user_id).order("order_index", desc=True).limit(1).execute()
         max_order = existing_tasks.data[0]["order_index"] if existing_tasks.data else -1
         
-        generated_tasks = []
+        task_rows = []
         today = date.today()
         
         # requirements 배열을 기반으로 태스크 생성
@@ -458,39 +409,26 @@ async def auto_generate_tasks(data: TaskAutoGenerate, x_user_id: str = Header(..
             # 2주 간격으로 due_date 설정
             due_date = today + timedelta(weeks=2 * (idx + 1))
             
-            # 요구사항에 따라 태스크 제목 및 설명 생성
-            task_title = f"{requirement} 준비"
-            task_description = f"{requirement}를 달성하기 위한 학습 및 실습"
-            
-            # 특정 키워드에 따라 더 구체적인 태스크 생성
-            if "React" in requirement:
-                task_title = "React 공식 문서 학습 및 프로젝트 개발"
-                task_description = "React 공식 문서를 학습하고 개인 프로젝트를 진행합니다"
-            elif "TypeScript" in requirement:
-                task_title = "TypeScript 강의 수강 및 실습"
-                task_description = "TypeScript 기초부터 고급 기능까지 학습합니다"
-            elif "프로젝트" in requirement:
-                task_title = "포트폴리오 프로젝트 개발"
-                task_description = "실무 수준의 프로젝트를 기획하고 개발합니다"
-            elif "TOEIC" in requirement or "토익" in requirement:
-                task_title = "TOEIC 목표 점수 달성"
-                task_description = "TOEIC 학습 및 모의고사 준비"
-                priority = "medium"
+            # 요구사항에 맞는 태스크 제목 및 설명 생성
+            task = matcher.task_for(requirement)
             
             task_data = {
                 "user_id": x_user_id,
                 "goal_id": data.goal_id,
-                "title": task_title,
-                "description": task_description,
+                "title": task["title"],
+                "description": task["description"],
                 "due_date": str(due_date),
                 "is_completed": False,
-                "priority": priority,
+                "priority": task.get("priority", priority),
                 "order_index": max_order + idx + 1
             }
             
-            result = supabase.table("tasks").insert(task_data).execute()
-            if result.data:
-                generated_tasks.append(result.data[0])
+            task_rows.append(task_data)
+        
+        # 모든 태스크를 한 번에 저장
+        generated_tasks = await db.insert_many("tasks", task_rows)
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
         
         return {
             "message": f"{len(generated_tasks)}개의 태스크가 자동 생성되었습니다",
@@ -508,7 +446,7 @@ async def auto_generate_tasks(data: TaskAutoGenerate, x_user_id: str = Header(..
 async def batch_update_tasks(
     task_ids: List[int],
     update_data: TaskUpdate,
-    x_user_id: str = Header(...)
+    x_user_id: str = Depends(current_user_id)
 ):
     """여러 태스크를 한번에 업데이트"""
     try:
@@ -529,22 +467,17 @@ async def batch_update_tasks(
         if "due_date" in update_dict and update_dict["due_date"]:
             update_dict["due_date"] = str(update_dict["due_date"])
         
-        # 각 태스크를 개별적으로 업데이트 (사용자 권한 확인)
-        updated_tasks = []
-        for task_id in task_ids:
-            # 태스크 소유권 확인
-            task = supabase.table("tasks").select("id").eq("id", task_id).eq("user_id", x_user_id).execute()
-            
-            if not task.data:
-                continue  # 권한 없는 태스크는 스킵
-            
-            result = supabase.table("tasks").update(update_dict).eq("id", task_id).execute()
-            if result.data:
-                updated_tasks.extend(result.data)
+        # 소유한 태스크만 한 번의 쿼리로 업데이트 (권한 없는 태스크는 스킵)
+        result = await db.table("tasks").update(update_dict).in_("id", task_ids).eq("user_id", x_user_id).execute()
+        updated_tasks = result.data or []
+        skipped_ids = get_skipped_ids(task_ids, updated_tasks)
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
         
         return {
             "message": f"{len(updated_tasks)}개의 태스크가 업데이트되었습니다",
             "updated_count": len(updated_tasks),
+            "skipped_ids": skipped_ids,
             "tasks": updated_tasks
         }
     
@@ -560,7 +493,7 @@ async def batch_update_tasks(
 @router.patch("/tasks/batch-complete", status_code=status.HTTP_200_OK)
 async def batch_complete_tasks(
     task_ids: List[int],
-    x_user_id: str = Header(...)
+    x_user_id: str = Depends(current_user_id)
 ):
     """여러 태스크를 한번에 완료 처리"""
     try:
@@ -570,25 +503,20 @@ async def batch_complete_tasks(
                 detail={"error": "완료 처리할 태스크 ID가 없습니다", "code": "BAD_REQUEST"}
             )
         
-        completed_tasks = []
-        for task_id in task_ids:
-            # 태스크 소유권 확인
-            task = supabase.table("tasks").select("id").eq("id", task_id).eq("user_id", x_user_id).execute()
-            
-            if not task.data:
-                continue
-            
-            result = supabase.table("tasks").update({
-                "is_completed": True,
-                "completed_at": datetime.utcnow().isoformat()
-            }).eq("id", task_id).execute()
-            
-            if result.data:
-                completed_tasks.extend(result.data)
+        # 소유한 태스크만 한 번의 쿼리로 완료 처리 (권한 없는 태스크는 스킵)
+        result = await db.table("tasks").update({
+            "is_completed": True,
+            "completed_at": datetime.utcnow().isoformat()
+        }).in_("id", task_ids).eq("user_id", x_user_id).execute()
+        completed_tasks = result.data or []
+        skipped_ids = get_skipped_ids(task_ids, completed_tasks)
+        
+        await cache.invalidate(x_user_id, *INVALIDATE_ON_TASK_CHANGE)
         
         return {
             "message": f"{len(completed_tasks)}개의 태스크가 완료되었습니다",
             "completed_count": len(completed_tasks),
+            "skipped_ids": skipped_ids,
             "tasks": completed_tasks
         }
     
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from models.schemas import User
-from config.database import supabase
+from config.database import db
+from utils.cache import cache
+from utils.tokens import current_user_id
 
 router = APIRouter(prefix="/users", tags=["사용자"])
 
 
 @router.get("/me", response_model=User)
-async def get_current_user(x_user_id: str = Header(...)):
+async def get_current_user(x_user_id: str = Depends(current_user_id)):
     """내 정보 조회"""
     try:
-        user = supabase.table("users").select("*").eq("user_id", x_user_id).execute()
+        user = await db.table("users").select("*").eq("user_id", x_user_id).execute()
         
         if not user.data:
             raise HTTPException(
@@ -29,11 +31,11 @@ async def get_current_user(x_user_id: str = Header(...)):
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(x_user_id: str = Header(...)):
+async def delete_user(x_user_id: str = Depends(current_user_id)):
     """회원 탈퇴 (사용자 삭제)"""
     try:
         # 사용자 존재 여부 확인
-        user = supabase.table("users").select("user_id").eq("user_id", x_user_id).execute()
+        user = await db.table("users").select("user_id").eq("user_id", x_user_id).execute()
         
         if not user.data:
             raise HTTPException(
@@ -43,13 +45,15 @@ async def delete_user(x_user_id: str = Header(...)):
         
         # 관련 데이터 삭제는 데이터베이스의 CASCADE 설정에 의해 자동 처리됨
         # 또는 명시적으로 삭제할 수도 있음:
-        # supabase.table("tasks").delete().eq("user_id", x_user_id).execute()
-        # supabase.table("goals").delete().eq("user_id", x_user_id).execute()
-        # supabase.table("user_specs").delete().eq("user_id", x_user_id).execute()
+        # await db.table("tasks").delete().eq("user_id", x_user_id).execute()
+        # await db.table("goals").delete().eq("user_id", x_user_id).execute()
+        # await db.table("user_specs").delete().eq("user_id", x_user_id).execute()
         # ... (기타 관련 테이블)
         
         # 사용자 삭제
-        supabase.table("users").delete().eq("user_id", x_user_id).execute()
+        await db.table("users").delete().eq("user_id", x_user_id).execute()
+        
+        await cache.invalidate(x_user_id)
         
         return None
     
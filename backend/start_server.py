@@ -1,20 +1,36 @@
 import uvicorn
 import os
+import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load .env from backend directory before starting server
-env_path = Path(__file__).resolve().parent / '.env'
+backend_dir = Path(__file__).resolve().parent
+env_path = backend_dir / '.env'
 if env_path.exists():
     load_dotenv(dotenv_path=str(env_path), override=True)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스텝업 API 서버 실행")
+    parser.add_argument("--prod", action="store_true", help="gunicorn 멀티 워커로 실행 (gunicorn.conf.py, Linux/macOS)")
+    parser.add_argument("--workers", type=int, default=1, help="개발 모드 uvicorn 워커 수")
+    args = parser.parse_args()
+
     # Verify env vars are loaded
     if os.getenv("SUPABASE_URL") and os.getenv("SUPABASE_KEY"):
         print("✅ Environment variables loaded successfully")
     else:
         print("⚠️ WARNING: Environment variables not found")
-    
+
+    if args.prod:
+        # 워커 수/preload/max-requests 등은 gunicorn.conf.py 와 환경변수로 설정
+        print(f"🚀 Starting production server on 0.0.0.0:{os.getenv('PORT', 8000)}")
+        os.chdir(backend_dir)
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn.conf.py", "main:create_app()"])
+
+    # 워커 수에 따라 메모리 캐시 사용 여부가 정해짐 (utils/cache.py)
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+
     # Run without reload to avoid multiprocessing environment issues
     print("🚀 Starting FastAPI server on http://127.0.0.1:8000")
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=False, access_log=True)
+    uvicorn.run("main:create_app", factory=True, host="127.0.0.1", port=8000, reload=False, access_log=True, workers=args.workers)
@@ -3,11 +3,22 @@ import json
 
 # 채용 공고 목록 조회
 print("=== 채용 공고 목록 조회 ===")
-response = requests.get("http://127.0.0.1:8000/job-postings?is_active=true")
+response = requests.get("http://127.0.0.1:8000/job-postings?is_active=true&limit=100")
 print(f"상태 코드: {response.status_code}")
 
 if response.status_code == 200:
-    jobs = response.json()
+    jobs = response.json()["data"]
+    next_cursor = response.json()["pagination"]["next_cursor"]
+    
+    # next_cursor 로 마지막 페이지까지 조회
+    while next_cursor:
+        page = requests.get(
+            "http://127.0.0.1:8000/job-postings",
+            params={"is_active": "true", "limit": 100, "cursor": next_cursor}
+        ).json()
+        jobs.extend(page["data"])
+        next_cursor = page["pagination"]["next_cursor"]
+    
     print(f"\n총 {len(jobs)}개의 채용 공고가 저장되어 있습니다.\n")
     
     # 처음 5개만 출력
@@ -13,7 +13,7 @@ print("\n1️⃣ 채용 공고 키워드 검색 (React)")
 print("-" * 60)
 response = requests.get(f"{BASE_URL}/job-postings?keyword=React&is_active=true")
 if response.status_code == 200:
-    jobs = response.json()
+    jobs = response.json()["data"]
     print(f"✅ 검색 결과: {len(jobs)}개")
     for i, job in enumerate(jobs[:3], 1):
         print(f"   {i}. {job['company']} - {job['title']}")
@@ -81,7 +81,7 @@ print("\n5️⃣ 경력 수준으로 채용 공고 필터링 (신입)")
 print("-" * 60)
 response = requests.get(f"{BASE_URL}/job-postings?experience_level=신입&is_active=true")
 if response.status_code == 200:
-    jobs = response.json()
+    jobs = response.json()["data"]
     print(f"✅ 신입 채용 공고: {len(jobs)}개")
     for i, job in enumerate(jobs[:3], 1):
         print(f"   {i}. {job['company']} - {job['title']}")
@@ -0,0 +1,43 @@
+"""
+공통 fixture
+"""
+import httpx
+import pytest
+from postgrest import AsyncPostgrestClient
+
+from config.database import Database
+
+
+class FakePostgREST:
+    """PostgREST 대신 응답하는 httpx 전송 계층 (경로별 응답을 정하고 받은 요청을 기록)"""
+
+    def __init__(self):
+        self.requests = []
+        # "job_postings", "rpc/register_user" 같은 경로 → 응답 본문 (또는 요청을 받아 본문을 돌려주는 함수)
+        self.responses = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.split("/rest/v1/", 1)[-1]
+        body = self.responses.get(path, [])
+        if callable(body):
+            body = body(request)
+        return httpx.Response(200, json=body)
+
+    @property
+    def last_params(self) -> httpx.QueryParams:
+        return self.requests[-1].url.params
+
+
+@pytest.fixture
+def postgrest():
+    """FakePostgREST 로 요청을 보내는 Database (fake.db)"""
+    fake = FakePostgREST()
+    db = Database(url="http://postgrest.test", key="test-key")
+    client = AsyncPostgrestClient(db._rest_url, headers=db._headers)
+    client.session = httpx.AsyncClient(
+        base_url=db._rest_url, headers=client.session.headers, transport=httpx.MockTransport(fake)
+    )
+    db._client = client
+    fake.db = db
+    return fake
@@ -0,0 +1,174 @@
+"""
+응답 캐시 무효화 (utils/cache.py)
+"""
+import asyncio
+import fnmatch
+from types import SimpleNamespace
+
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import (
+    INVALIDATE_ON_GOAL_CHANGE, MemoryCacheBackend, NullCacheBackend, RedisCacheBackend, ResponseCache, create_cache
+)
+
+
+NAMESPACES = ["stats:dashboard", "stats:weekly:2025-01-06", "statsx", "goals", "roadmap:progress", "specs"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def cache(clock):
+    return ResponseCache(MemoryCacheBackend(max_entries=100), default_ttl=30)
+
+
+def fill(cache: ResponseCache, user_id: str, namespaces=NAMESPACES):
+    async def run():
+        for namespace in namespaces:
+            await cache.set(namespace, user_id, {"namespace": namespace})
+    asyncio.run(run())
+
+
+def cached(cache: ResponseCache, user_id: str, namespaces=NAMESPACES) -> list:
+    async def run():
+        return [namespace for namespace in namespaces if await cache.get(namespace, user_id) is not None]
+    return asyncio.run(run())
+
+
+def test_invalidate_removes_prefix_and_children_only(cache):
+    fill(cache, "alice")
+
+    asyncio.run(cache.invalidate("alice", "stats"))
+
+    assert cached(cache, "alice") == ["statsx", "goals", "roadmap:progress", "specs"]
+
+
+def test_invalidate_with_several_prefixes(cache):
+    fill(cache, "alice")
+
+    asyncio.run(cache.invalidate("alice", *INVALIDATE_ON_GOAL_CHANGE))
+
+    assert cached(cache, "alice") == ["statsx", "specs"]
+
+
+def test_invalidate_without_prefix_removes_all_of_user(cache):
+    fill(cache, "alice")
+    fill(cache, "bob")
+
+    asyncio.run(cache.invalidate("alice"))
+
+    assert cached(cache, "alice") == []
+    assert cached(cache, "bob") == NAMESPACES
+    assert cache.backend.size() == len(NAMESPACES)
+
+
+def test_invalidate_does_not_touch_other_users(cache):
+    fill(cache, "alice")
+    fill(cache, "bob")
+
+    asyncio.run(cache.invalidate("alice", "stats", "goals"))
+
+    assert cached(cache, "bob") == NAMESPACES
+
+
+def test_invalidate_unknown_user_is_noop(cache):
+    asyncio.run(cache.invalidate("nobody", "stats"))
+
+    assert cache.backend.size() == 0
+
+
+def test_entries_expire(cache, clock):
+    fill(cache, "alice", ["goals"])
+
+    clock.now += 31
+
+    assert cached(cache, "alice", ["goals"]) == []
+    assert cache.backend.size() == 0
+
+
+def test_lru_eviction_keeps_user_index_consistent(clock):
+    cache = ResponseCache(MemoryCacheBackend(max_entries=2))
+    fill(cache, "alice", ["goals", "specs"])
+    cached(cache, "alice", ["goals"])
+
+    fill(cache, "bob", ["stats:dashboard"])
+
+    assert cached(cache, "alice", ["goals", "specs"]) == ["goals"]
+    assert cache.backend.evictions == 1
+    assert cache.backend._keys_by_user["alice"] == {"goals"}
+
+    asyncio.run(cache.invalidate("alice"))
+    assert "alice" not in cache.backend._keys_by_user
+
+
+def test_hit_and_miss_metrics_group_namespace_parameters(cache):
+    fill(cache, "alice", ["stats:weekly:2025-01-06"])
+
+    cached(cache, "alice", ["stats:weekly:2025-01-06", "stats:weekly:2025-01-13"])
+
+    assert cache.stats()["namespaces"] == {"stats:weekly": {"hits": 1, "misses": 1}}
+
+
+class FakeRedis:
+    """RedisCacheBackend 가 쓰는 get/set/scan_iter/delete 만 흉내"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis_cache():
+    backend = RedisCacheBackend.__new__(RedisCacheBackend)
+    backend._redis = FakeRedis()
+    backend._key_prefix = "stepup:cache"
+    backend.evictions = 0
+    return ResponseCache(backend)
+
+
+def test_redis_invalidate_matches_memory_backend(redis_cache):
+    fill(redis_cache, "alice")
+    fill(redis_cache, "bob")
+
+    asyncio.run(redis_cache.invalidate("alice", "stats", "roadmap"))
+
+    assert cached(redis_cache, "alice") == ["statsx", "goals", "specs"]
+    assert cached(redis_cache, "bob") == NAMESPACES
+
+
+def test_redis_invalidate_without_prefix(redis_cache):
+    fill(redis_cache, "alice")
+    fill(redis_cache, "bob")
+
+    asyncio.run(redis_cache.invalidate("alice"))
+
+    assert cached(redis_cache, "alice") == []
+    assert cached(redis_cache, "bob") == NAMESPACES
+
+
+@pytest.mark.parametrize("workers, backend", [("1", MemoryCacheBackend), ("4", NullCacheBackend)])
+def test_create_cache_skips_memory_cache_with_several_workers(monkeypatch, workers, backend):
+    monkeypatch.delenv("CACHE_BACKEND", raising=False)
+    monkeypatch.setenv("WEB_CONCURRENCY", workers)
+
+    assert isinstance(create_cache().backend, backend)
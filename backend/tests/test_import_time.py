@@ -0,0 +1,34 @@
+"""
+앱 시작(임포트) 시간 예산
+
+check_import_time.py 와 같은 측정(`python -X importtime` 으로 `import main` + `create_app()`)을 새 프로세스에서 실행한다.
+"""
+import os
+
+from check_import_time import measure_import_time
+
+
+BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", 2000))
+# 측정값 편차가 커서 가장 빠른 측정으로 판단
+ATTEMPTS = 3
+
+
+def test_import_time_within_budget():
+    totals = []
+    for _ in range(ATTEMPTS):
+        _, total_ms, modules = measure_import_time()
+        totals.append(total_ms)
+        if total_ms <= BUDGET_MS:
+            return
+
+    slowest = ", ".join(f"{name} {ms:.0f} ms" for ms, name in modules[:5])
+    assert min(totals) <= BUDGET_MS, f"임포트 시간 {min(totals):,.0f} ms > 예산 {BUDGET_MS:,.0f} ms ({slowest})"
+
+
+def test_import_main_is_lazy():
+    probe, _, _ = measure_import_time()
+
+    assert probe["routers_on_import"] == []
+    assert not probe["sync_client_created"]
+    assert not probe["supabase_imported"]
+    assert not probe["async_client_created"]
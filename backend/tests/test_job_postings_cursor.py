@@ -0,0 +1,96 @@
+"""
+GET /job-postings 커서 페이지네이션과 검색 필터 (routers/job_postings.py)
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import job_postings
+from routers.job_postings import decode_cursor, encode_cursor
+
+
+def posting(job_id: int, created_at: str) -> dict:
+    return {
+        "id": job_id, "company": "c", "title": f"공고 {job_id}", "description": None, "url": None,
+        "requirements": ["Python"], "preferred": [], "location": None, "experience_level": None,
+        "is_active": True, "created_at": created_at, "updated_at": created_at
+    }
+
+
+@pytest.fixture
+def client(postgrest, monkeypatch):
+    monkeypatch.setattr(job_postings, "db", postgrest.db)
+    monkeypatch.setattr(job_postings.job_index, "ready", False)
+    app = FastAPI()
+    app.include_router(job_postings.router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("created_at", ["2025-01-02T03:04:05.123456", "2025-01-02T03:04:05+00:00", "x"])
+def test_cursor_round_trip(created_at):
+    cursor = encode_cursor({"created_at": created_at, "id": 42})
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "WzFd"])
+def test_invalid_cursor_is_rejected(client, postgrest, cursor):
+    response = client.get("/job-postings", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "BAD_REQUEST"
+    assert postgrest.requests == []
+
+
+def test_next_cursor_points_at_last_row(client, postgrest):
+    postgrest.responses["job_postings"] = [
+        posting(3, "2025-01-03T00:00:00"), posting(2, "2025-01-02T00:00:00"), posting(1, "2025-01-01T00:00:00")
+    ]
+
+    body = client.get("/job-postings", params={"limit": 2}).json()
+
+    assert [job["id"] for job in body["data"]] == [3, 2]
+    assert body["pagination"]["has_more"] is True
+    assert decode_cursor(body["pagination"]["next_cursor"]) == ("2025-01-02T00:00:00", 2)
+    assert postgrest.last_params["limit"] == "3"
+    assert postgrest.last_params["order"] == "created_at.desc,id.desc"
+
+
+def test_last_page_has_no_cursor(client, postgrest):
+    postgrest.responses["job_postings"] = [posting(1, "2025-01-01T00:00:00")]
+
+    body = client.get("/job-postings", params={"limit": 2}).json()
+
+    assert body["pagination"] == {"limit": 2, "next_cursor": None, "has_more": False}
+
+
+def test_cursor_builds_keyset_or_filter(client, postgrest):
+    cursor = encode_cursor({"created_at": "2025-01-02T00:00:00", "id": 2})
+
+    client.get("/job-postings", params={"cursor": cursor})
+
+    assert postgrest.last_params["or"] == (
+        '(created_at.lt."2025-01-02T00:00:00",and(created_at.eq."2025-01-02T00:00:00",id.lt.2))'
+    )
+
+
+def test_cursor_value_cannot_break_out_of_or_filter(client, postgrest):
+    cursor = encode_cursor({"created_at": '2025",id.gt.0),or(is_active.eq.false', "id": 2})
+
+    client.get("/job-postings", params={"cursor": cursor})
+
+    value = '"2025\\",id.gt.0),or(is_active.eq.false"'
+    assert postgrest.last_params["or"] == f"(created_at.lt.{value},and(created_at.eq.{value},id.lt.2))"
+
+
+def test_keyword_uses_escaped_ilike(client, postgrest):
+    client.get("/job-postings", params={"keyword": "100%_Java"})
+
+    assert postgrest.last_params["search_text"] == "ilike.*100\\%\\_java*"
+
+
+def test_keyword_with_star_is_matched_literally(client, postgrest):
+    client.get("/job-postings", params={"keyword": "C*"})
+
+    assert postgrest.last_params["search_text"] == "imatch.c\\*"
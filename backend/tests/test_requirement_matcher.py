@@ -0,0 +1,105 @@
+"""
+요구사항 매칭 엔진 (utils/requirement_matcher.py)
+"""
+import pytest
+
+from utils import requirement_matcher
+from utils.requirement_matcher import RULES, RequirementMatcher, UserSpecs, matcher
+
+
+def specs(tech_stack=None, languages=None, certificates=None) -> UserSpecs:
+    projects = [{"tech_stack": tech_stack}] if tech_stack is not None else []
+    return UserSpecs(projects, languages or [], certificates or [])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Java, Spring 경험 3년 이상", {"backend": "Java"}),
+    ("react 또는 VUE 사용 경험", {"frontend": "React"}),
+    ("JavaScript 능숙자", {}),
+    ("Swift/Kotlin 앱 출시 경험", {"mobile": "Swift"}),
+    ("토익 800점 이상, 정보처리기사 자격증", {"language_test": "토익", "certificate": "자격증"}),
+    ("프론트엔드개발 경험", {"frontend": "프론트엔드"}),
+    ("", {}),
+])
+def test_scan(text, expected):
+    assert matcher.scan(text) == expected
+
+
+def test_match_uses_rule_priority():
+    rule, keyword = matcher.match("TypeScript 기반 React 프로젝트 경험")
+
+    assert (rule["category"], keyword) == ("frontend", "React")
+    assert matcher.categories("TypeScript 기반 React 프로젝트 경험") == ["frontend", "typescript", "project"]
+
+
+def test_python_automaton_matches_pyahocorasick(monkeypatch):
+    texts = ["JavaScript, Java", "vue.js 와 React", "토익/TOEIC 자격증", "Kotlin프로젝트", "SpringBoot Spring"]
+    expected = [matcher.scan_all(text) for text in texts]
+
+    monkeypatch.setattr(requirement_matcher, "_new_automaton", requirement_matcher._PythonAutomaton)
+    fallback = RequirementMatcher(RULES)
+
+    assert [fallback.scan_all(text) for text in texts] == expected
+
+
+def test_task_for_uses_rule_template():
+    assert matcher.task_for("Vue 기반 개발 경험") == {
+        "title": "Vue 학습 및 프로젝트 개발",
+        "description": "Vue 기반 개발 경험를 충족하기 위한 실무 프로젝트 진행"
+    }
+
+
+def test_task_for_includes_rule_priority():
+    assert matcher.task_for("TOEIC 850 이상")["priority"] == "medium"
+    assert "priority" not in matcher.task_for("Spring 경험")
+
+
+def test_task_for_without_matching_rule():
+    assert matcher.task_for("Go 언어 경험") == {
+        "title": "Go 언어 경험 준비",
+        "description": "Go 언어 경험를 달성하기 위한 학습 및 실습"
+    }
+
+
+def test_evaluate_without_matching_rule():
+    assert matcher.evaluate("Go 언어 경험", specs("Go")) == {
+        "category": None, "is_met": False, "user_value": None, "suggestion": None
+    }
+
+
+def test_evaluate_tech_stack_reports_required_skill():
+    evaluation = matcher.evaluate("React 경험", specs("React, TypeScript"))
+
+    assert evaluation["is_met"] is True
+    assert evaluation["user_value"] == "React 프로젝트 경험 있음"
+
+
+def test_evaluate_tech_stack_reports_users_own_skill():
+    # 같은 카테고리의 다른 기술로 충족하면 사용자가 가진 기술을 표시
+    evaluation = matcher.evaluate("React 경험", specs("Vue, Figma"))
+
+    assert evaluation["category"] == "frontend"
+    assert evaluation["is_met"] is True
+    assert evaluation["user_value"] == "Vue 프로젝트 경험 있음"
+
+
+def test_evaluate_tech_stack_not_met():
+    evaluation = matcher.evaluate("Kotlin 경험", specs("React"))
+
+    assert evaluation["is_met"] is False
+    assert evaluation["user_value"] is None
+
+
+@pytest.mark.parametrize("requirement, user_specs, user_value, suggestion", [
+    ("팀 프로젝트 경험", specs("Figma"), "프로젝트 경험 1개", "팀 프로젝트 경험 준비하기"),
+    ("팀 프로젝트 경험", specs(), None, "팀 프로젝트 경험 준비하기"),
+    ("TOEIC 800 이상", specs(languages=[{"language_type": "TOEIC", "score": "850"}]), "TOEIC 850점", "TOEIC 800 이상 준비하기"),
+    ("관련 자격증 우대", specs(certificates=[{"certificate_name": "정보처리기사"}]), "정보처리기사 보유", "관련 자격증 우대 취득하기"),
+    ("관련 자격증 우대", specs(), None, "관련 자격증 우대 취득하기"),
+])
+def test_evaluate_spec_rules(requirement, user_specs, user_value, suggestion):
+    evaluation = matcher.evaluate(requirement, user_specs)
+
+    assert evaluation["is_met"] is (user_value is not None)
+    assert evaluation["user_value"] == user_value
+    assert evaluation["suggestion"] == suggestion
@@ -0,0 +1,146 @@
+"""
+세션 토큰 발급/검증 (utils/tokens.py)
+"""
+import json
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from utils import tokens
+from utils.tokens import InvalidToken, TokenSigner, _b64decode, _b64encode
+
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """utils.tokens 가 보는 현재 시각 (now 값을 바꿔 시간 경과를 흉내냄)"""
+    fake = SimpleNamespace(now=NOW)
+    monkeypatch.setattr(tokens, "time", SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def signer(clock):
+    return TokenSigner(b"test-secret", ttl=3600, max_cached=2)
+
+
+def replace_part(token: str, index: int, part: bytes) -> str:
+    parts = token.encode().split(b".")
+    parts[index] = part
+    return b".".join(parts).decode()
+
+
+def test_issue_and_verify(signer):
+    claims = signer.verify(signer.issue("alice", True))
+
+    assert claims == {"sub": "alice", "onboarding_completed": True, "iat": NOW, "exp": NOW + 3600}
+
+
+def test_verified_token_is_cached(signer):
+    token = signer.issue("alice", False)
+
+    signer.verify(token)
+    signer.verify(token)
+
+    assert (signer.cache_misses, signer.cache_hits) == (1, 1)
+
+
+def test_cache_is_bounded(signer):
+    for user_id in ("a", "b", "c"):
+        signer.verify(signer.issue(user_id, False))
+
+    assert len(signer._verified) == signer.max_cached
+
+
+def test_expired_token_is_rejected(signer, clock):
+    token = signer.issue("alice", False)
+
+    clock.now = NOW + 3600
+    with pytest.raises(InvalidToken, match="만료"):
+        signer.verify(token)
+
+
+def test_cached_token_expires(signer, clock):
+    token = signer.issue("alice", False)
+    signer.verify(token)
+
+    clock.now = NOW + 3600
+    with pytest.raises(InvalidToken, match="만료"):
+        signer.verify(token)
+    assert token not in signer._verified
+
+
+def test_tampered_payload_is_rejected(signer):
+    token = signer.issue("alice", False)
+    claims = json.loads(_b64decode(token.split(".")[1].encode()))
+    claims["sub"] = "mallory"
+
+    forged = replace_part(token, 1, _b64encode(json.dumps(claims).encode()))
+
+    with pytest.raises(InvalidToken, match="서명"):
+        signer.verify(forged)
+
+
+def test_tampered_signature_is_rejected(signer):
+    token = signer.issue("alice", False)
+    signature = token.split(".")[2]
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+
+    with pytest.raises(InvalidToken, match="서명"):
+        signer.verify(replace_part(token, 2, flipped.encode()))
+
+
+def test_other_algorithm_header_is_rejected(signer):
+    token = signer.issue("alice", False)
+    none_header = _b64encode(json.dumps({"alg": "none", "typ": "JWT"}).encode())
+
+    with pytest.raises(InvalidToken, match="서명"):
+        signer.verify(replace_part(token, 0, none_header))
+
+
+def test_token_from_other_secret_is_rejected(signer, clock):
+    other = TokenSigner(b"other-secret")
+
+    with pytest.raises(InvalidToken, match="서명"):
+        signer.verify(other.issue("alice", False))
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d"])
+def test_malformed_token_is_rejected(signer, token):
+    with pytest.raises(InvalidToken):
+        signer.verify(token)
+
+
+def test_current_user_id_from_bearer_token(monkeypatch, signer):
+    monkeypatch.setattr(tokens, "token_signer", signer)
+
+    user_id = asyncio.run(tokens.current_user_id(f"Bearer {signer.issue('alice', True)}", "mallory"))
+
+    assert user_id == "alice"
+
+
+def test_current_user_id_falls_back_to_header(monkeypatch):
+    monkeypatch.setattr(tokens, "REQUIRE_TOKEN", False)
+
+    assert asyncio.run(tokens.current_user_id(None, "alice")) == "alice"
+
+
+def test_current_user_id_requires_token_when_configured(monkeypatch):
+    monkeypatch.setattr(tokens, "REQUIRE_TOKEN", True)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(tokens.current_user_id(None, "alice"))
+    assert error.value.status_code == 401
+
+
+@pytest.mark.parametrize("authorization", ["Basic YWxpY2U6cHc=", "Bearer", "Bearer not-a-token"])
+def test_current_user_id_rejects_bad_authorization(monkeypatch, signer, authorization):
+    monkeypatch.setattr(tokens, "token_signer", signer)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(tokens.current_user_id(authorization, "alice"))
+    assert error.value.status_code == 401
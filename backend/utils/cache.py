@@ -0,0 +1,208 @@
+"""
+사용자별 읽기 API 응답 캐시
+
+- 키: (user_id, namespace) — namespace는 "stats:dashboard"처럼 ':'로 계층을 나눈다
+- 쓰기 API에서 invalidate(user_id, "stats")를 호출하면 "stats:*" 키가 모두 삭제된다
+- 기본 백엔드는 프로세스 내 TTL + LRU 캐시이며, CACHE_BACKEND=redis 로 Redis를 사용할 수 있다
+- 메모리 캐시는 쓰기를 처리한 워커에서만 무효화되므로, 워커가 여럿(WEB_CONCURRENCY > 1)이면
+  다른 워커가 TTL 동안 오래된 응답을 주지 않도록 캐시하지 않는다 (여러 워커에서는 Redis 사용)
+"""
+import os
+import json
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Optional
+
+
+# 데이터 변경 종류별로 무효화할 네임스페이스
+INVALIDATE_ON_TASK_CHANGE = ("stats", "roadmap")
+INVALIDATE_ON_GOAL_CHANGE = ("goals", "progress", "stats", "roadmap")
+INVALIDATE_ON_SPEC_CHANGE = ("specs", "progress")
+INVALIDATE_ON_ROUTINE_CHANGE = ("routines",)
+
+
+def _matches(namespace: str, prefix: str) -> bool:
+    return namespace == prefix or namespace.startswith(prefix + ":")
+
+
+class MemoryCacheBackend:
+    """프로세스 내 TTL + LRU 캐시"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._keys_by_user: Dict[str, set] = defaultdict(set)
+        self.evictions = 0
+
+    async def get(self, user_id: str, namespace: str) -> Optional[Any]:
+        key = (user_id, namespace)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, user_id: str, namespace: str, value: Any, ttl: float):
+        key = (user_id, namespace)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        self._keys_by_user[user_id].add(namespace)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def invalidate(self, user_id: str, prefixes: tuple):
+        namespaces = self._keys_by_user.get(user_id)
+        if not namespaces:
+            return
+
+        for namespace in list(namespaces):
+            if not prefixes or any(_matches(namespace, prefix) for prefix in prefixes):
+                self._remove((user_id, namespace))
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: tuple):
+        self._entries.pop(key, None)
+        user_id, namespace = key
+        namespaces = self._keys_by_user.get(user_id)
+        if namespaces is not None:
+            namespaces.discard(namespace)
+            if not namespaces:
+                del self._keys_by_user[user_id]
+
+
+class RedisCacheBackend:
+    """Redis 호환 캐시 (redis 패키지 필요, LRU는 Redis maxmemory-policy로 설정)"""
+
+    def __init__(self, url: str, key_prefix: str = "stepup:cache"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis 를 사용하려면 redis 패키지를 설치해야 합니다") from e
+
+        self._redis = redis.from_url(url)
+        self._key_prefix = key_prefix
+        self.evictions = 0
+
+    def _key(self, user_id: str, namespace: str) -> str:
+        return f"{self._key_prefix}:{user_id}:{namespace}"
+
+    async def get(self, user_id: str, namespace: str) -> Optional[Any]:
+        raw = await self._redis.get(self._key(user_id, namespace))
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, user_id: str, namespace: str, value: Any, ttl: float):
+        await self._redis.set(self._key(user_id, namespace), json.dumps(value, default=str), ex=max(1, int(ttl)))
+
+    async def invalidate(self, user_id: str, prefixes: tuple):
+        patterns = [self._key(user_id, "*")] if not prefixes else [
+            pattern
+            for prefix in prefixes
+            for pattern in (self._key(user_id, prefix), self._key(user_id, f"{prefix}:*"))
+        ]
+
+        keys = []
+        for pattern in patterns:
+            async for key in self._redis.scan_iter(match=pattern):
+                keys.append(key)
+
+        if keys:
+            await self._redis.delete(*keys)
+
+    def size(self) -> int:
+        return -1
+
+
+class NullCacheBackend:
+    """캐시하지 않는 백엔드 (여러 워커에서 메모리 캐시를 쓸 수 없을 때)"""
+
+    def __init__(self):
+        self.evictions = 0
+
+    async def get(self, user_id: str, namespace: str) -> Optional[Any]:
+        return None
+
+    async def set(self, user_id: str, namespace: str, value: Any, ttl: float):
+        pass
+
+    async def invalidate(self, user_id: str, prefixes: tuple):
+        pass
+
+    def size(self) -> int:
+        return 0
+
+
+class ResponseCache:
+    """백엔드를 감싸고 네임스페이스별 hit/miss 지표를 기록"""
+
+    def __init__(self, backend, default_ttl: float = 30):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    async def get(self, namespace: str, user_id: str) -> Optional[Any]:
+        value = await self.backend.get(user_id, namespace)
+
+        # 지표는 "stats:dashboard"처럼 앞 두 단계까지만 집계 (날짜 등 파라미터 제외)
+        metric_key = ":".join(namespace.split(":")[:2])
+        if value is None:
+            self.misses[metric_key] += 1
+        else:
+            self.hits[metric_key] += 1
+        return value
+
+    async def set(self, namespace: str, user_id: str, value: Any, ttl: Optional[float] = None):
+        await self.backend.set(user_id, namespace, value, ttl if ttl is not None else self.default_ttl)
+
+    async def invalidate(self, user_id: str, *prefixes: str):
+        """사용자의 캐시 무효화 (prefix를 지정하지 않으면 해당 사용자의 모든 키)"""
+        await self.backend.invalidate(user_id, prefixes)
+
+    def stats(self) -> dict:
+        namespaces = sorted(set(self.hits) | set(self.misses))
+        total_hits = sum(self.hits.values())
+        total_misses = sum(self.misses.values())
+        total = total_hits + total_misses
+
+        return {
+            "backend": type(self.backend).__name__,
+            "size": self.backend.size(),
+            "evictions": self.backend.evictions,
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_ratio": round(total_hits / total, 4) if total else 0.0,
+            "namespaces": {
+                namespace: {"hits": self.hits[namespace], "misses": self.misses[namespace]}
+                for namespace in namespaces
+            }
+        }
+
+
+def create_cache() -> ResponseCache:
+    """환경변수로 캐시 백엔드 선택 (CACHE_BACKEND=memory|redis)"""
+    ttl = float(os.getenv("CACHE_TTL_SECONDS", 30))
+
+    if os.getenv("CACHE_BACKEND", "memory").lower() == "redis":
+        backend = RedisCacheBackend(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    elif int(os.getenv("WEB_CONCURRENCY", 1)) > 1:
+        # 워커별 메모리 캐시는 다른 워커의 쓰기로 무효화되지 않아 쓰기 직후 오래된 응답을 줄 수 있음
+        print("[Cache] 여러 워커에서는 메모리 캐시를 쓰지 않습니다 (워커 간 캐시는 CACHE_BACKEND=redis)")
+        backend = NullCacheBackend()
+    else:
+        backend = MemoryCacheBackend(max_entries=int(os.getenv("CACHE_MAX_ENTRIES", 10000)))
+
+    return ResponseCache(backend, default_ttl=ttl)
+
+
+cache = create_cache()
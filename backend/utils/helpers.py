@@ -1,28 +1,55 @@
+import re
 import json
 from datetime import datetime, date
 
 
-def parse_json_field(value):
-    """JSON 필드를 파싱하는 헬퍼 함수"""
-    if value is None:
-        return []
-    if isinstance(value, str):
+def parse_job_requirements(data):
+    """채용 공고/목표 요구사항을 문자열 배열로 변환
+
+    jsonb 문자열 배열로 저장된 행은 그대로 반환하고, 이전 형식의 행
+    (JSON 문자열, {"description": ...} 객체 배열)만 변환한다.
+    """
+    if isinstance(data, list):
+        if all(isinstance(item, str) for item in data):
+            return data
+        return [
+            item['description'] if isinstance(item, dict) and 'description' in item else str(item)
+            for item in data
+        ]
+    if isinstance(data, str):
+        # 이전 형식: JSON 문자열로 저장된 경우 파싱
         try:
-            return json.loads(value)
-        except:
-            return []
-    if isinstance(value, list):
-        return value
+            parsed = json.loads(data)
+        except json.JSONDecodeError:
+            return [data]
+        return parse_job_requirements(parsed) if isinstance(parsed, list) else [data]
     return []
 
 
-def serialize_json_field(value):
-    """JSON 필드를 직렬화하는 헬퍼 함수"""
-    if value is None:
-        return json.dumps([])
-    if isinstance(value, list):
-        return json.dumps(value)
-    return value
+def escape_like(value: str) -> str:
+    """LIKE/ILIKE 패턴에서 검색어의 \\, %, _ 를 문자 그대로 매칭하도록 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains_filter(query, column: str, text: str):
+    """column 에 text 가 (대소문자 무시) 포함된 행만 남기는 PostgREST 필터
+
+    PostgREST 는 like/ilike 값의 * 를 모두 % 로 바꾸므로 이스케이프로는 문자 * 를 표현할 수 없다.
+    * 가 들어간 검색어는 정규식(imatch, ~*)으로 모든 특수문자를 이스케이프해 찾는다 (트라이그램 인덱스 사용 가능).
+    """
+    if "*" in text:
+        return query.filter(column, "imatch", re.escape(text))
+    return query.ilike(column, f"*{escape_like(text)}*")
+
+
+def quote_filter_value(value: str) -> str:
+    """or_/and 필터나 배열 리터럴({...})에 넣는 값을 큰따옴표로 감쌈 (값 안의 , ( ) { } . : 는 구분자로 해석되지 않고, \\ 와 " 는 이스케이프)"""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def format_server_timing(timings):
+    """쿼리별 소요 시간(ms)을 Server-Timing 헤더 값으로 변환"""
+    return ", ".join(f"{name};dur={elapsed:.1f}" for name, elapsed in timings.items())
 
 
 def calculate_radar_scores(education, languages, certificates, projects, activities):
@@ -0,0 +1,220 @@
+"""
+채용 공고 키워드 검색용 메모리 역색인
+
+- 토큰 색인: 정규화된 토큰 → 공고 ID 집합
+- n-gram 색인: 토큰의 문자 1-gram/2-gram → 토큰 집합 (한국어처럼 띄어쓰기 단위가 검색 단위와
+  다른 경우에도 "백엔드" 로 "백엔드개발자" 토큰을 찾을 수 있도록 부분 문자열 검색에 사용)
+- 시작 시 전체 색인을 만들고, 이후에는 updated_at 이후 변경분만 반영한다
+  (updated_at 은 DB 트리거가 갱신하고, 삭제는 is_active = false 로 처리되어 변경분에 포함된다)
+- PostgREST 는 한 번에 돌려주는 행 수에 상한(max-rows, Supabase 기본 1000)이 있으므로
+  공고 목록은 항상 id 순 keyset 페이지로 끝까지 읽는다
+"""
+import os
+import re
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from utils.helpers import parse_job_requirements
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# 서버 간 시계 오차를 고려해 이전 동기화 시점보다 조금 앞부터 변경분을 다시 읽는다 (재반영은 멱등)
+SYNC_OVERLAP = timedelta(seconds=60)
+
+POSTING_COLUMNS = "id, title, description, company, requirements, preferred, is_active"
+PAGE_SIZE = int(os.getenv("JOB_INDEX_PAGE_SIZE", 1000))
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def char_ngrams(token: str) -> Set[str]:
+    """토큰의 문자 1-gram, 2-gram"""
+    grams = set(token)
+    grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+def posting_search_text(job: dict) -> str:
+    """기존 키워드 필터와 같은 검색 대상 필드(제목, 설명, 회사명, 자격요건, 우대사항)"""
+    fields = [job.get("title") or "", job.get("description") or "", job.get("company") or ""]
+    fields.extend(parse_job_requirements(job.get("requirements")))
+    fields.extend(parse_job_requirements(job.get("preferred")))
+    return "\n".join(fields).lower()
+
+
+class JobPostingIndex:
+    """채용 공고 역색인 (검색 결과는 후보 공고 ID 목록)"""
+
+    def __init__(self):
+        self._texts: Dict[int, str] = {}
+        self._tokens_by_doc: Dict[int, Set[str]] = {}
+        self._docs_by_token: Dict[str, Set[int]] = defaultdict(set)
+        self._tokens_by_gram: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = asyncio.Lock()
+        # 공고 변경을 함께 반영할 객체 (upsert/remove/clear 와 동기화 완료 시 호출되는 async synced 보유, 예: 추천 행렬)
+        self.listeners = []
+        self.ready = False
+        self.last_synced_at: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def upsert(self, job: dict):
+        job_id = job["id"]
+        self.remove(job_id)
+
+        text = posting_search_text(job)
+        tokens = set(tokenize(text))
+        self._texts[job_id] = text
+        self._tokens_by_doc[job_id] = tokens
+
+        for token in tokens:
+            if token not in self._docs_by_token:
+                for gram in char_ngrams(token):
+                    self._tokens_by_gram[gram].add(token)
+            self._docs_by_token[token].add(job_id)
+
+        for listener in self.listeners:
+            listener.upsert(job)
+
+    def remove(self, job_id: int):
+        for listener in self.listeners:
+            listener.remove(job_id)
+
+        tokens = self._tokens_by_doc.pop(job_id, None)
+        if tokens is None:
+            return
+
+        self._texts.pop(job_id, None)
+        for token in tokens:
+            docs = self._docs_by_token.get(token)
+            if docs is None:
+                continue
+            docs.discard(job_id)
+            if not docs:
+                # 더 이상 쓰이지 않는 토큰은 n-gram 색인에서도 제거
+                del self._docs_by_token[token]
+                for gram in char_ngrams(token):
+                    grams = self._tokens_by_gram.get(gram)
+                    if grams is not None:
+                        grams.discard(token)
+                        if not grams:
+                            del self._tokens_by_gram[gram]
+
+    def _docs_containing(self, query_token: str) -> Set[int]:
+        """query_token 을 부분 문자열로 포함하는 토큰이 있는 공고 ID"""
+        grams = [query_token] if len(query_token) == 1 else [
+            query_token[i:i + 2] for i in range(len(query_token) - 1)
+        ]
+
+        candidate_tokens = None
+        for gram in sorted(grams, key=lambda g: len(self._tokens_by_gram.get(g, ()))):
+            tokens = self._tokens_by_gram.get(gram)
+            if not tokens:
+                return set()
+            candidate_tokens = set(tokens) if candidate_tokens is None else candidate_tokens & tokens
+            if not candidate_tokens:
+                return set()
+
+        docs = set()
+        for token in candidate_tokens:
+            if query_token in token:
+                docs |= self._docs_by_token[token]
+        return docs
+
+    def search(self, keyword: str) -> List[int]:
+        """키워드를 포함하는 공고 ID (기존 부분 문자열 검색과 같은 결과)"""
+        keyword_lower = keyword.lower()
+        query_tokens = sorted(set(tokenize(keyword_lower)), key=len, reverse=True)
+
+        if query_tokens:
+            candidates = None
+            for query_token in query_tokens:
+                docs = self._docs_containing(query_token)
+                candidates = docs if candidates is None else candidates & docs
+                if not candidates:
+                    return []
+        else:
+            # 기호로만 된 키워드는 토큰이 없으므로 전체를 후보로 확인
+            candidates = self._texts.keys()
+
+        # 여러 토큰/기호를 포함한 키워드는 후보 공고 원문에서 최종 확인
+        return [job_id for job_id in candidates if keyword_lower in self._texts[job_id]]
+
+    @staticmethod
+    async def _select_all(db, columns: str, updated_since: Optional[str] = None) -> List[dict]:
+        """job_postings 를 id 순 keyset 페이지로 모두 읽음
+
+        빈 페이지가 나올 때까지 읽으므로 서버의 max-rows 가 PAGE_SIZE 보다 작아도 행이 누락되지 않는다.
+        """
+        rows: List[dict] = []
+        last_id = 0
+        while True:
+            query = db.table("job_postings").select(columns).gt("id", last_id)
+            if updated_since is not None:
+                query = query.gte("updated_at", updated_since)
+            result = await query.order("id").limit(PAGE_SIZE).execute()
+            page = result.data or []
+            if not page:
+                return rows
+            rows.extend(page)
+            last_id = page[-1]["id"]
+
+    async def _notify_synced(self):
+        for listener in self.listeners:
+            await listener.synced()
+
+    async def build(self, db):
+        """전체 공고로 색인 생성"""
+        async with self._lock:
+            synced_at = (datetime.utcnow() - SYNC_OVERLAP).isoformat()
+            jobs = await self._select_all(db, POSTING_COLUMNS)
+
+            self._texts.clear()
+            self._tokens_by_doc.clear()
+            self._docs_by_token.clear()
+            self._tokens_by_gram.clear()
+            for listener in self.listeners:
+                listener.clear()
+            for job in jobs:
+                self.upsert(job)
+            await self._notify_synced()
+
+            self.last_synced_at = synced_at
+            self.ready = True
+
+    async def refresh(self, db):
+        """마지막 동기화 이후 변경된 공고만 반영
+
+        공고 삭제는 DB 트리거가 is_active = false 수정으로 바꾸므로(migration.sql 17) 변경분에 함께 들어온다.
+        """
+        if not self.ready:
+            await self.build(db)
+            return
+
+        async with self._lock:
+            synced_at = (datetime.utcnow() - SYNC_OVERLAP).isoformat()
+            changed = await self._select_all(db, POSTING_COLUMNS, updated_since=self.last_synced_at)
+
+            for job in changed:
+                self.upsert(job)
+            await self._notify_synced()
+
+            self.last_synced_at = synced_at
+
+    async def run_refresh_loop(self, db, interval: float):
+        """주기적으로 변경분 반영 (lifespan에서 백그라운드 작업으로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh(db)
+            except Exception as e:
+                print(f"[JobIndex] 색인 갱신 실패: {e}")
+
+
+job_index = JobPostingIndex()
@@ -0,0 +1,280 @@
+"""
+사용자 스펙 기반 채용 공고 추천
+
+- 활성 공고의 자격요건/우대사항을 스킬 특징(토큰 + 요구사항 매칭 카테고리)으로 바꿔
+  스킬 × 공고 희소 행렬(CSC: 스킬별 공고 목록)로 미리 만들어 둔다
+- 사용자 스펙(어학, 자격증, 프로젝트 기술 스택, 대외활동)을 같은 특징 공간의 벡터로 만들고,
+  사용자가 가진 스킬 열만 모아 한 번의 벡터 연산으로 모든 공고 점수를 계산한다
+- 행렬은 색인 동기화 작업에서 스레드로 새로 만들어 통째로 교체하므로 추천 요청은 행렬을 만들지 않는다
+- 점수 = 공고 요구 스킬 가중치(IDF, 우대사항은 절반) 중 사용자가 충족한 비율
+- "경험", "개발", "이상" 같은 일반 단어는 불용어로 빼고, 불용어 목록에 없더라도 너무 많은 공고에 나오는 토큰은
+  스킬로 보지 않는다 (문서 빈도 상한)
+"""
+import re
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+# numpy 는 첫 행렬 생성(색인 동기화 작업) 때 임포트해 앱 시작(임포트) 시간에서 뺀다
+if TYPE_CHECKING:
+    import numpy as np
+
+from utils.helpers import parse_job_requirements
+from utils.requirement_matcher import matcher, UserSpecs
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+# "3년", "2개" 처럼 숫자(+ 단위)만 있는 토큰
+NUMERIC_TOKEN_PATTERN = re.compile(r"^\d+[가-힣]*$")
+
+# 요구사항 문장에 흔히 나오지만 스킬이 아닌 단어
+STOPWORDS = {
+    "경험", "개발", "이상", "이하", "경력", "신입", "년", "년차", "및", "등", "또는", "관련", "관한", "대한", "위한",
+    "능력", "역량", "가능", "가능자", "가능하신", "이해", "이해도", "사용", "활용", "업무", "우대", "필수", "보유",
+    "보유자", "있는", "있으신", "분", "자", "기반", "지식", "기술", "스킬", "학력", "무관", "전공", "전공자",
+    "서비스", "동아리", "공유", "활동", "수준", "기본", "기초", "원활한", "실무", "협업", "커뮤니케이션",
+    "and", "or", "the", "of", "in", "with", "for", "to", "a", "an", "experience", "years", "year", "skills"
+}
+
+# 전체 공고 중 이 비율보다 많은 공고에 나오는 토큰은 스킬로 보지 않음 (공고가 충분히 많을 때만 적용)
+MAX_DOCUMENT_FREQUENCY = 0.3
+MIN_POSTINGS_FOR_DF_CUTOFF = 20
+
+REQUIRED_WEIGHT = 1.0
+PREFERRED_WEIGHT = 0.5
+
+
+def _is_skill_token(token: str) -> bool:
+    return len(token) > 1 and token not in STOPWORDS and not NUMERIC_TOKEN_PATTERN.match(token)
+
+
+def skill_features(text: str) -> Set[str]:
+    """문장의 스킬 특징: 불용어를 뺀 소문자 토큰 + 요구사항 매칭 카테고리("cat:frontend" 등)"""
+    if not text:
+        return set()
+    features = {token for token in TOKEN_PATTERN.findall(text.lower()) if _is_skill_token(token)}
+    features.update(f"cat:{category}" for category in matcher.scan(text))
+    return features
+
+
+def user_features(specs: UserSpecs, activities: List[dict]) -> Set[str]:
+    """사용자 스펙을 공고와 같은 특징 공간으로 변환"""
+    features = set()
+    for project in specs.projects:
+        features |= skill_features(project.get("tech_stack") or "")
+    for language in specs.languages:
+        features |= skill_features(language.get("language_type") or "")
+    for certificate in specs.certificates:
+        features |= skill_features(certificate.get("certificate_name") or "")
+    for activity in activities or []:
+        features |= skill_features(f"{activity.get('activity_name') or ''} {activity.get('activity_type') or ''}")
+
+    # 스펙 종류 자체로 충족되는 카테고리 (예: 자격증 보유 → "자격증 우대")
+    features.update(f"cat:{category}" for category in specs.tech_skills)
+    if specs.projects:
+        features.add("cat:project")
+    if specs.languages:
+        features.add("cat:language_test")
+    if specs.certificates:
+        features.add("cat:certificate")
+    return features
+
+
+def build_matrix(postings: Dict[int, dict]) -> dict:
+    """공고별 특징으로 CSC 행렬 생성 (이벤트 루프 밖 스레드에서 실행하므로 넘겨받은 스냅샷만 읽는다)"""
+    import numpy as np
+
+    posting_ids = list(postings)
+    feature_index: Dict[str, int] = {}
+    columns: List[List[int]] = []
+    weights: List[List[float]] = []
+
+    # 공고 안에서 같은 스킬은 가장 큰 가중치 한 번만 반영
+    posting_weights: List[Dict[str, float]] = []
+    document_frequency: Dict[str, int] = {}
+    for job_id in posting_ids:
+        weights_by_feature: Dict[str, float] = {}
+        for item in postings[job_id]["items"]:
+            weight = REQUIRED_WEIGHT if item["type"] == "required" else PREFERRED_WEIGHT
+            for feature in item["features"]:
+                if weights_by_feature.get(feature, 0.0) < weight:
+                    weights_by_feature[feature] = weight
+        posting_weights.append(weights_by_feature)
+        for feature in weights_by_feature:
+            document_frequency[feature] = document_frequency.get(feature, 0) + 1
+
+    # 너무 흔한 토큰(IDF 하한 미만)은 점수와 충족 판단에서 제외 (카테고리 특징은 유지)
+    common_tokens = set()
+    if len(posting_ids) >= MIN_POSTINGS_FOR_DF_CUTOFF:
+        max_postings = MAX_DOCUMENT_FREQUENCY * len(posting_ids)
+        common_tokens = {
+            feature for feature, count in document_frequency.items()
+            if count > max_postings and not feature.startswith("cat:")
+        }
+
+    for col, weights_by_feature in enumerate(posting_weights):
+        for feature, weight in weights_by_feature.items():
+            if feature in common_tokens:
+                continue
+            row = feature_index.get(feature)
+            if row is None:
+                row = feature_index[feature] = len(columns)
+                columns.append([])
+                weights.append([])
+            columns[row].append(col)
+            weights[row].append(weight)
+
+    counts = np.array([len(c) for c in columns], dtype=np.int64)
+    indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.fromiter((c for cols in columns for c in cols), dtype=np.int32, count=int(indptr[-1]))
+    data = np.fromiter((w for ws in weights for w in ws), dtype=np.float32, count=int(indptr[-1]))
+
+    # 남은 토큰도 여러 공고에 나올수록 IDF로 가중치를 낮춤
+    if len(posting_ids):
+        idf = np.log1p(len(posting_ids) / np.maximum(counts, 1)).astype(np.float32)
+        data *= np.repeat(idf, counts)
+
+    return {
+        "postings": postings,
+        "posting_ids": np.array(posting_ids, dtype=np.int64),
+        "feature_index": feature_index,
+        "indptr": indptr,
+        "indices": indices,
+        "data": data,
+        "norms": np.bincount(indices, weights=data, minlength=len(posting_ids)).astype(np.float32),
+        # 문서 빈도 상한을 넘어 스킬에서 제외된 토큰
+        "common_tokens": common_tokens
+    }
+
+
+class JobRecommender:
+    """스킬 × 공고 희소 행렬로 전체 활성 공고를 한 번에 점수화
+
+    공고 변경(upsert/remove/clear)은 특징만 갱신하고, 행렬은 색인 동기화가 끝날 때(synced)
+    스레드에서 새로 만들어 한 번에 교체한다. 추천 요청은 항상 마지막으로 만든 행렬을 읽기만 한다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[int, dict] = {}
+        self._dirty = False
+        # 첫 동기화 전에는 행렬이 없음 (추천 결과 없음)
+        self._matrix: Optional[dict] = None
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    # 채용 공고 색인(job_index)의 변경 알림
+    def upsert(self, job: dict):
+        if job.get("is_active") is False:
+            self.remove(job["id"])
+            return
+
+        items = []
+        for text in parse_job_requirements(job.get("requirements")):
+            items.append({"requirement": text, "type": "required", "features": skill_features(text)})
+        for text in parse_job_requirements(job.get("preferred")):
+            items.append({"requirement": text, "type": "preferred", "features": skill_features(text)})
+
+        # 변경분 동기화는 요구사항과 무관한 수정(제목 등)도 다시 보내므로 특징이 같으면 행렬을 다시 만들지 않음
+        previous = self._postings.get(job["id"])
+        if previous is not None and previous["items"] == items:
+            return
+
+        self._postings[job["id"]] = {"id": job["id"], "items": items}
+        self._dirty = True
+
+    def remove(self, job_id: int):
+        if self._postings.pop(job_id, None) is not None:
+            self._dirty = True
+
+    def clear(self):
+        if self._postings:
+            self._postings.clear()
+            self._dirty = True
+
+    async def synced(self):
+        """색인 동기화 후 호출: 공고 특징이 바뀌었으면 행렬을 스레드에서 다시 만들어 교체"""
+        if not self._dirty:
+            return
+
+        # 만드는 동안 들어온 변경은 다음 동기화에서 반영되도록 먼저 표시를 지움
+        self._dirty = False
+        try:
+            self._matrix = await asyncio.to_thread(build_matrix, dict(self._postings))
+        except BaseException:
+            self._dirty = True
+            raise
+
+    def scores(self, features: Set[str]) -> "np.ndarray":
+        """모든 공고의 점수 (0~1, 요구 스킬 가중치 중 충족 비율)"""
+        return self._scores(self._matrix, features)
+
+    @staticmethod
+    def _scores(matrix: Optional[dict], features: Set[str]) -> "np.ndarray":
+        import numpy as np
+
+        if matrix is None:
+            return np.zeros(0, dtype=np.float32)
+        posting_ids, feature_index, indptr = matrix["posting_ids"], matrix["feature_index"], matrix["indptr"]
+        rows = [feature_index[f] for f in features if f in feature_index]
+        if not rows or not len(posting_ids):
+            return np.zeros(len(posting_ids), dtype=np.float32)
+
+        # 사용자 스킬 열만 이어 붙여 공고별로 합산
+        selected = np.concatenate([np.arange(indptr[r], indptr[r + 1]) for r in rows])
+        matched = np.bincount(matrix["indices"][selected], weights=matrix["data"][selected], minlength=len(posting_ids))
+        norms = matrix["norms"]
+        return np.divide(matched, norms, out=np.zeros_like(matched), where=norms > 0)
+
+    def recommend(self, specs: UserSpecs, activities: List[dict], limit: int = 10) -> List[dict]:
+        """점수 상위 공고와 요구사항별 매칭 설명"""
+        # 요청 도중 행렬이 교체되어도 같은 스냅샷으로 점수와 설명을 만든다
+        matrix = self._matrix
+        features = user_features(specs, activities)
+        scores = self._scores(matrix, features)
+        if not len(scores):
+            return []
+
+        import numpy as np
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        recommendations = []
+        for col in top:
+            if scores[col] <= 0:
+                break
+            job_id = int(matrix["posting_ids"][col])
+            explanations = [
+                self._explain(item, features, specs, matrix["common_tokens"])
+                for item in matrix["postings"][job_id]["items"]
+            ]
+            recommendations.append({
+                "job_posting_id": job_id,
+                "score": round(float(scores[col]) * 100, 1),
+                "matched_requirements": sum(1 for e in explanations if e["is_met"]),
+                "total_requirements": len(explanations),
+                "explanations": explanations
+            })
+        return recommendations
+
+    @staticmethod
+    def _explain(item: dict, features: Set[str], specs: UserSpecs, common_tokens: Set[str]) -> dict:
+        """요구사항 충족 여부: 매칭 규칙(카테고리)이 있으면 그 판단을, 없으면 공통 스킬 토큰 일치 여부를 사용"""
+        matched_skills = sorted(
+            f for f in item["features"] & features
+            if not f.startswith("cat:") and f not in common_tokens
+        )
+        evaluation = matcher.evaluate(item["requirement"], specs)
+        is_met = evaluation["is_met"] if evaluation["category"] is not None else bool(matched_skills)
+        return {
+            "requirement": item["requirement"],
+            "type": item["type"],
+            "is_met": is_met,
+            "matched_skills": matched_skills,
+            "user_value": evaluation["user_value"]
+        }
+
+
+job_recommender = JobRecommender()
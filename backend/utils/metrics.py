@@ -0,0 +1,220 @@
+"""
+Prometheus 지표 (/metrics)
+
+- 요청: 라우트 템플릿/메서드/상태 코드별 요청 수와 지연 히스토그램, 처리 중인 요청 수
+- DB: PostgREST 호출의 테이블/작업별 지연 히스토그램과 오류 수 (Database.query_listeners 로 수집)
+- 캐시 hit/miss, 비밀번호 해시 풀 대기열, DB 커넥션 풀 상태는 각 모듈의 stats()를 주기적으로 옮겨 담는다
+  (요청 경로에는 지표 코드를 넣지 않음)
+
+gunicorn 멀티 워커에서는 PROMETHEUS_MULTIPROC_DIR(gunicorn.conf.py 에서 설정)에 워커별 파일로 기록하고,
+어느 워커가 /metrics 요청을 받든 모든 워커의 값을 합쳐 응답한다.
+이 환경변수는 prometheus_client 를 처음 임포트하기 전에 설정되어 있어야 한다.
+"""
+import os
+import time
+import asyncio
+from typing import Dict
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from utils.request_timing import route_template
+
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# 목표 응답 시간(SLO) 판단에 쓰는 구간 (초)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+REQUESTS = Counter(
+    "stepup_http_requests_total", "HTTP 요청 수",
+    ["method", "route", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "stepup_http_request_duration_seconds", "HTTP 요청 처리 시간",
+    ["method", "route", "status"], buckets=REQUEST_BUCKETS
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "stepup_http_requests_in_progress", "처리 중인 HTTP 요청 수",
+    ["method"], multiprocess_mode="livesum"
+)
+
+DB_QUERY_LATENCY = Histogram(
+    "stepup_db_query_duration_seconds", "PostgREST 호출 시간 (응답 본문 수신까지)",
+    ["table", "operation"], buckets=DB_BUCKETS
+)
+DB_QUERY_ERRORS = Counter(
+    "stepup_db_query_errors_total", "실패한 PostgREST 호출 수 (연결 실패 또는 4xx/5xx)",
+    ["table", "operation"]
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "stepup_db_pool_connections", "PostgREST 커넥션 풀 연결 수",
+    ["state"], multiprocess_mode="livesum"
+)
+DB_POOL_RECONNECTS = Counter(
+    "stepup_db_pool_new_connections_total", "새로 연결한 PostgREST 연결 수 (재연결 포함)",
+    ["kind"]
+)
+
+CACHE_HITS = Counter("stepup_cache_hits_total", "응답 캐시 hit 수", ["namespace"])
+CACHE_MISSES = Counter("stepup_cache_misses_total", "응답 캐시 miss 수", ["namespace"])
+CACHE_ENTRIES = Gauge(
+    "stepup_cache_entries", "메모리 캐시 항목 수",
+    ["backend"], multiprocess_mode="livesum"
+)
+
+PASSWORD_QUEUE_DEPTH = Gauge(
+    "stepup_password_hash_queue_depth", "스레드를 기다리는 비밀번호 해시 작업 수",
+    ["pool"], multiprocess_mode="livesum"
+)
+PASSWORD_RUNNING = Gauge(
+    "stepup_password_hash_running", "실행 중인 비밀번호 해시 작업 수",
+    ["pool"], multiprocess_mode="livesum"
+)
+PASSWORD_REJECTED = Counter(
+    "stepup_password_hash_rejected_total", "대기열이 가득 차 거절한 비밀번호 해시 작업 수",
+    ["pool"]
+)
+
+
+def record_db_query(table: str, operation: str, seconds: float, status_code: int):
+    """Database.query_listeners 에 등록하는 DB 호출 지표 기록 함수"""
+    DB_QUERY_LATENCY.labels(table, operation).observe(seconds)
+    if status_code == 0 or status_code >= 400:
+        DB_QUERY_ERRORS.labels(table, operation).inc()
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수/지연/처리 중 요청 수를 기록하는 ASGI 미들웨어
+
+    매칭되지 않은 경로(404 등)는 라벨 수가 늘지 않도록 route="unmatched" 로 묶는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            elapsed = time.perf_counter() - started
+            route = route_template(scope) or "unmatched"
+            status = str(status_code)
+            REQUESTS.labels(method, route, status).inc()
+            REQUEST_LATENCY.labels(method, route, status).observe(elapsed)
+
+
+class ProcessMetrics:
+    """프로세스 안의 stats() 값(캐시, 비밀번호 해시 풀, DB 커넥션 풀)을 Prometheus 지표로 옮겨 담음
+
+    누적 값은 지난번 값과의 차이만큼 Counter 를 늘리므로 워커가 교체되어도 합계가 줄지 않는다.
+    """
+
+    def __init__(self, cache, password_hasher, db):
+        self.cache = cache
+        self.password_hasher = password_hasher
+        self.db = db
+        self._last_seen: Dict[tuple, int] = {}
+
+    def _inc_counter(self, counter: Counter, labels: tuple, total: int):
+        key = (counter, labels)
+        delta = total - self._last_seen.get(key, 0)
+        if delta > 0:
+            counter.labels(*labels).inc(delta)
+        self._last_seen[key] = total
+
+    def sync(self):
+        cache_stats = self.cache.stats()
+        for namespace, counts in cache_stats["namespaces"].items():
+            self._inc_counter(CACHE_HITS, (namespace,), counts["hits"])
+            self._inc_counter(CACHE_MISSES, (namespace,), counts["misses"])
+        if cache_stats["size"] >= 0:
+            CACHE_ENTRIES.labels(cache_stats["backend"]).set(cache_stats["size"])
+
+        hasher_stats = self.password_hasher.stats()
+        PASSWORD_QUEUE_DEPTH.labels("bcrypt").set(hasher_stats["queue_depth"])
+        PASSWORD_RUNNING.labels("bcrypt").set(hasher_stats["pending"] - hasher_stats["queue_depth"])
+        self._inc_counter(PASSWORD_REJECTED, ("bcrypt",), hasher_stats["rejected"])
+
+        pool_stats = self.db.pool_stats()
+        if pool_stats.get("connected"):
+            DB_POOL_CONNECTIONS.labels("in_use").set(pool_stats["in_use_connections"])
+            DB_POOL_CONNECTIONS.labels("idle").set(pool_stats["idle_connections"])
+            self._inc_counter(DB_POOL_RECONNECTS, ("tcp",), pool_stats["new_connections"])
+            self._inc_counter(DB_POOL_RECONNECTS, ("tls",), pool_stats["tls_handshakes"])
+
+    async def run_sync_loop(self, interval: float):
+        """주기적으로 sync (lifespan에서 백그라운드 작업으로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"[Metrics] 지표 갱신 실패: {e}")
+
+
+class _CollectedMetrics:
+    """이미 수집한 지표 묶음을 generate_latest 에 넘기기 위한 레지스트리 대용"""
+
+    def __init__(self, families: list):
+        self.families = families
+
+    def collect(self):
+        return self.families
+
+
+def _cache_hit_ratio(families: list) -> GaugeMetricFamily:
+    """(모든 워커 합산) 캐시 hit/miss 누적 값으로 네임스페이스별 hit 비율 계산"""
+    totals: Dict[str, list] = {}
+    for family in families:
+        if family.name not in ("stepup_cache_hits", "stepup_cache_misses"):
+            continue
+        index = 0 if family.name == "stepup_cache_hits" else 1
+        for sample in family.samples:
+            if sample.name.endswith("_total"):
+                totals.setdefault(sample.labels["namespace"], [0.0, 0.0])[index] += sample.value
+
+    ratio = GaugeMetricFamily(
+        "stepup_cache_hit_ratio", "응답 캐시 누적 hit 비율 (구간 비율은 hits/misses 의 rate 로 계산)",
+        labels=["namespace"]
+    )
+    for namespace, (hits, misses) in sorted(totals.items()):
+        if hits + misses:
+            ratio.add_metric([namespace], hits / (hits + misses))
+    return ratio
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식 (멀티 워커면 모든 워커 합산)"""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    families = list(registry.collect())
+    families.append(_cache_hit_ratio(families))
+    return generate_latest(_CollectedMetrics(families))
+
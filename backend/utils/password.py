@@ -0,0 +1,133 @@
+"""
+비밀번호 해시 전용 스레드 풀
+
+- bcrypt 해시/검증은 요청당 100~300ms CPU를 쓰므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행한다
+  (bcrypt 는 해시 계산 중 GIL을 놓으므로 스레드 수만큼 병렬로 처리된다)
+- 대기 중인 작업이 PASSWORD_HASH_MAX_PENDING 을 넘으면 즉시 거절해 로그인 폭주 시 대기열이 무한히 쌓이지 않게 한다
+- 비용(rounds)은 BCRYPT_ROUNDS 로 설정하며, 다른 비용으로 저장된 해시는 로그인 성공 시 다시 해시한다
+"""
+import os
+import time
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from passlib.hash import bcrypt
+
+
+class PasswordHasherBusy(Exception):
+    """대기열이 가득 차 해시 작업을 받을 수 없음"""
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 크기 제한이 있는 스레드 풀에서 실행하고 대기열/지연 지표를 기록"""
+
+    def __init__(self, rounds: int = 12, workers: int = 2, max_pending: int = 64):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._hasher = bcrypt.using(rounds=rounds)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 해시 스레드에서 갱신하는 지표(running, wait/run 시간) 보호
+        self._stats_lock = threading.Lock()
+
+        self.pending = 0
+        self.running = 0
+        self.max_queue_depth = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.count: Dict[str, int] = defaultdict(int)
+        self.wait_seconds: Dict[str, float] = defaultdict(float)
+        self.run_seconds: Dict[str, float] = defaultdict(float)
+        self.max_run_seconds: Dict[str, float] = defaultdict(float)
+
+    @property
+    def queue_depth(self) -> int:
+        """스레드를 기다리는 작업 수"""
+        return self.pending - self.running
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self._hasher.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run("verify", self._hasher.verify, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """설정된 비용과 다른 해시인지 (비용 변경 후 첫 로그인 시 재해시 대상)"""
+        return self._hasher.needs_update(hashed)
+
+    async def _run(self, op: str, func, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy(f"비밀번호 처리 대기열이 가득 찼습니다 ({self.max_pending})")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+        submitted = time.perf_counter()
+        self.pending += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+        def timed():
+            started = time.perf_counter()
+            with self._stats_lock:
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._stats_lock:
+                    self.running -= 1
+                    self.wait_seconds[op] += started - submitted
+                    self.run_seconds[op] += elapsed
+                    self.max_run_seconds[op] = max(self.max_run_seconds[op], elapsed)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self.pending -= 1
+            self.count[op] += 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return self._stats()
+
+    def _stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "operations": {
+                op: {
+                    "count": count,
+                    "avg_wait_ms": round(self.wait_seconds[op] / count * 1000, 2),
+                    "avg_run_ms": round(self.run_seconds[op] / count * 1000, 2),
+                    "max_run_ms": round(self.max_run_seconds[op] * 1000, 2)
+                }
+                for op, count in sorted(self.count.items())
+            }
+        }
+
+
+def create_password_hasher() -> PasswordHasher:
+    """환경변수로 비용과 풀 크기 설정 (BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)"""
+    return PasswordHasher(
+        rounds=int(os.getenv("BCRYPT_ROUNDS", 12)),
+        workers=int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1))),
+        max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+    )
+
+
+password_hasher = create_password_hasher()
@@ -0,0 +1,119 @@
+"""
+요청별 처리 시간과 DB 호출 집계
+
+- RequestTimingMiddleware: 요청마다 전체 처리 시간(라우트 템플릿 기준)을 재고,
+  응답에 `Server-Timing: total;dur=..., db;dur=...;desc="N queries"` 헤더를 붙이고 JSON 한 줄 로그를 남긴다
+- record_query: 데이터 접근 계층(config/http_pool.py 의 전송 계층)이 PostgREST 호출이 끝날 때마다 호출하며,
+  현재 요청의 쿼리 수와 누적 시간(응답 본문 수신까지)을 더한다
+- 요청 상태는 contextvar 로 전달되므로 db.gather 등으로 동시에 실행된 쿼리도 같은 요청에 집계된다
+  (동시 실행 쿼리는 시간이 겹치므로 db 누적 시간이 전체 시간보다 클 수 있다)
+"""
+import os
+import sys
+import json
+import time
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+
+
+_current: ContextVar[Optional[dict]] = ContextVar("request_timing", default=None)
+
+
+def _create_logger() -> logging.Logger:
+    logger = logging.getLogger("stepup.request")
+    if not logger.handlers:
+        # 메시지(JSON)만 그대로 stdout 으로 (gunicorn/uvicorn 로그 설정과 무관하게 한 줄씩)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+logger = _create_logger()
+
+
+def current_timing() -> Optional[dict]:
+    """현재 요청의 집계 ({"db_queries", "db_seconds", "queries"}), 요청 밖이면 None"""
+    return _current.get()
+
+
+def record_query(table: str, operation: str, seconds: float, status_code: int):
+    """PostgREST 호출 1건을 현재 요청에 집계 (요청 밖의 호출, 예: 색인 갱신은 무시)"""
+    timing = _current.get()
+    if timing is None:
+        return
+    timing["db_queries"] += 1
+    timing["db_seconds"] += seconds
+    key = f"{operation} {table}"
+    timing["queries"][key] = timing["queries"].get(key, 0) + 1
+
+
+def route_template(scope: dict) -> Optional[str]:
+    """매칭된 라우트의 경로 템플릿 (예: /tasks/{id}), 매칭되지 않았으면 None"""
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+def format_request_timing(total_seconds: float, timing: dict) -> str:
+    return (
+        f"total;dur={total_seconds * 1000:.1f}, "
+        f"db;dur={timing['db_seconds'] * 1000:.1f};desc=\"{timing['db_queries']} queries\""
+    )
+
+
+class RequestTimingMiddleware:
+    """요청별 처리 시간/DB 호출 수를 Server-Timing 헤더와 구조화 로그로 기록하는 ASGI 미들웨어
+
+    REQUEST_LOG=false 이면 로그를 남기지 않고(헤더는 유지),
+    REQUEST_LOG_SLOW_MS 를 주면 그보다 오래 걸린 요청만 로그로 남긴다.
+    """
+
+    def __init__(self, app, log_enabled: Optional[bool] = None, slow_ms: Optional[float] = None):
+        self.app = app
+        self.log_enabled = (
+            log_enabled if log_enabled is not None
+            else os.getenv("REQUEST_LOG", "true").lower() == "true"
+        )
+        self.slow_ms = slow_ms if slow_ms is not None else float(os.getenv("REQUEST_LOG_SLOW_MS", 0))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = {"db_queries": 0, "db_seconds": 0.0, "queries": {}}
+        token = _current.set(timing)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                # 엔드포인트가 남긴 쿼리별 Server-Timing(db.gather)은 그대로 두고 별도 항목으로 추가
+                headers.append("Server-Timing", format_request_timing(time.perf_counter() - started, timing))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if self.log_enabled and elapsed_ms >= self.slow_ms:
+                logger.info(json.dumps({
+                    "event": "request",
+                    "method": scope["method"],
+                    "route": route_template(scope),
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(elapsed_ms, 2),
+                    "db_queries": timing["db_queries"],
+                    "db_ms": round(timing["db_seconds"] * 1000, 2),
+                    "queries": timing["queries"]
+                }, ensure_ascii=False))
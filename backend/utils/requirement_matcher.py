@@ -0,0 +1,268 @@
+"""
+채용 요구사항 ↔ 스킬 카테고리 매칭 엔진
+
+- RULES 에 카테고리별 키워드, 스펙 충족 기준, 태스크 템플릿을 한 곳에 정의한다
+- 모든 키워드는 시작 시 Aho-Corasick 오토마톤 하나로 컴파일되어, 요구사항 문장을 한 번만 훑고
+  포함된 카테고리를 모두 찾는다 (pyahocorasick 이 없으면 같은 알고리즘의 순수 파이썬 구현 사용)
+- 갭 분석(goals), 진행 상황(progress), 로드맵 생성(goals, tasks)이 같은 엔진을 사용한다
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 카테고리 우선순위는 목록 순서 (한 문장에 여러 카테고리가 있으면 앞의 규칙을 사용)
+# spec: 충족 여부를 판단할 사용자 스펙 ("tech_stack" 은 프로젝트 기술 스택에 같은 카테고리가 있는지 확인)
+RULES = [
+    {
+        "category": "frontend",
+        "keywords": ["React", "Vue", "프론트엔드"],
+        "spec": "tech_stack",
+        "task_title": "{keyword} 학습 및 프로젝트 개발",
+        "task_description": "{requirement}를 충족하기 위한 실무 프로젝트 진행"
+    },
+    {
+        "category": "backend",
+        "keywords": ["Java", "Spring"],
+        "spec": "tech_stack",
+        "task_title": "{keyword} 프레임워크 학습",
+        "task_description": "{requirement} 기반 백엔드 애플리케이션 개발"
+    },
+    {
+        "category": "typescript",
+        "keywords": ["TypeScript"],
+        "spec": "tech_stack",
+        "task_title": "TypeScript 강의 수강 및 실습",
+        "task_description": "TypeScript 기초부터 고급 기능까지 학습"
+    },
+    {
+        "category": "mobile",
+        "keywords": ["Kotlin", "Swift"],
+        "spec": "tech_stack",
+        "task_title": "{keyword} 모바일 앱 개발",
+        "task_description": "{requirement}를 활용한 개인 프로젝트 개발"
+    },
+    {
+        "category": "project",
+        "keywords": ["프로젝트"],
+        "spec": "projects",
+        "task_title": "포트폴리오 프로젝트 개발",
+        "task_description": "실무 수준의 프로젝트를 기획하고 개발",
+        "suggestion": "{requirement} 준비하기"
+    },
+    {
+        "category": "language_test",
+        "keywords": ["TOEIC", "토익"],
+        "spec": "languages",
+        "task_title": "TOEIC 목표 점수 달성",
+        "task_description": "TOEIC 학습 및 모의고사 준비",
+        "task_priority": "medium",
+        "suggestion": "{requirement} 준비하기"
+    },
+    {
+        "category": "certificate",
+        "keywords": ["자격증"],
+        "spec": "certificates",
+        "suggestion": "{requirement} 취득하기"
+    }
+]
+
+DEFAULT_TASK_TITLE = "{requirement} 준비"
+DEFAULT_TASK_DESCRIPTION = "{requirement}를 달성하기 위한 학습 및 실습"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class _PythonAutomaton:
+    """pyahocorasick 이 없을 때 사용하는 순수 파이썬 Aho-Corasick (같은 add_word/make_automaton/iter 인터페이스)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[list] = [[]]
+
+    def add_word(self, word: str, value):
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(value)
+
+    def make_automaton(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def iter(self, text: str):
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for value in out[state]:
+                yield end, value
+
+
+def _new_automaton():
+    try:
+        import ahocorasick
+        return ahocorasick.Automaton()
+    except ImportError:
+        return _PythonAutomaton()
+
+
+class RequirementMatcher:
+    """키워드 규칙을 Aho-Corasick 오토마톤 하나로 컴파일한 다중 패턴 매처
+
+    키워드 수와 관계없이 요구사항 문장을 한 번 훑어 모든 키워드를 찾는다.
+    """
+
+    def __init__(self, rules: List[dict]):
+        self.rules = rules
+        self._rank = {rule["category"]: rank for rank, rule in enumerate(rules)}
+        self._rule_by_category = {rule["category"]: rule for rule in rules}
+
+        self._automaton = _new_automaton()
+        keywords = {}
+        for rule in rules:
+            for keyword in rule["keywords"]:
+                keywords.setdefault(keyword.lower(), (rule["category"], keyword, len(keyword)))
+        for lowered, value in keywords.items():
+            self._automaton.add_word(lowered, value)
+        self._automaton.make_automaton()
+
+    def _matches(self, text: str):
+        """문장의 (카테고리, 키워드) 매칭을 끝 위치 순으로 (대소문자 무시)
+
+        영문/숫자로 시작·끝나는 키워드는 단어 경계에서만 매칭한다 (예: "JavaScript" 안의 "Java" 는 제외).
+        """
+        lowered = text.lower()
+        for end, (category, keyword, length) in self._automaton.iter(lowered):
+            start = end - length + 1
+            if _is_word_char(keyword[0]) and start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if _is_word_char(keyword[-1]) and end + 1 < len(lowered) and _is_word_char(lowered[end + 1]):
+                continue
+            yield category, keyword
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """문장을 한 번 훑어 포함된 카테고리 → 처음 매칭된 키워드"""
+        found: Dict[str, str] = {}
+        if not text:
+            return found
+
+        for category, keyword in self._matches(text):
+            found.setdefault(category, keyword)
+        return found
+
+    def scan_all(self, text: str) -> Dict[str, List[str]]:
+        """포함된 카테고리 → 매칭된 키워드 전체 (중복 제외, 나온 순서)"""
+        found: Dict[str, List[str]] = {}
+        if not text:
+            return found
+
+        for category, keyword in self._matches(text):
+            keywords = found.setdefault(category, [])
+            if keyword not in keywords:
+                keywords.append(keyword)
+        return found
+
+    def categories(self, text: str) -> List[str]:
+        """포함된 카테고리 (규칙 우선순위 순)"""
+        return sorted(self.scan(text), key=self._rank.__getitem__)
+
+    def match(self, text: str) -> Optional[Tuple[dict, str]]:
+        """우선순위가 가장 높은 (규칙, 매칭된 키워드), 없으면 None"""
+        found = self.scan(text)
+        if not found:
+            return None
+        category = min(found, key=self._rank.__getitem__)
+        return self._rule_by_category[category], found[category]
+
+    def match_many(self, texts: Iterable[str]) -> List[Optional[Tuple[dict, str]]]:
+        """여러 요구사항을 한 번에 매칭 (여러 공고 일괄 갭 분석용)"""
+        return [self.match(text) for text in texts]
+
+    def task_for(self, requirement: str) -> dict:
+        """요구사항에 맞는 태스크 제목/설명 (우선순위 지정 규칙이면 priority 포함)"""
+        matched = self.match(requirement)
+        rule, keyword = matched if matched else ({}, "")
+
+        task = {
+            "title": rule.get("task_title", DEFAULT_TASK_TITLE).format(requirement=requirement, keyword=keyword),
+            "description": rule.get("task_description", DEFAULT_TASK_DESCRIPTION).format(requirement=requirement, keyword=keyword)
+        }
+        if rule.get("task_priority"):
+            task["priority"] = rule["task_priority"]
+        return task
+
+    def evaluate(self, requirement: str, specs: "UserSpecs") -> dict:
+        """요구사항 충족 여부와 근거가 되는 사용자 스펙
+
+        Returns:
+            {"category", "is_met", "user_value", "suggestion"} (매칭되는 규칙이 없으면 category 는 None)
+        """
+        matched = self.match(requirement)
+        if matched is None:
+            return {"category": None, "is_met": False, "user_value": None, "suggestion": None}
+
+        rule, keyword = matched
+        user_value = specs.user_value(rule, keyword)
+        suggestion = rule.get("suggestion")
+        return {
+            "category": rule["category"],
+            "is_met": user_value is not None,
+            "user_value": user_value,
+            "suggestion": suggestion.format(requirement=requirement) if suggestion else None
+        }
+
+
+class UserSpecs:
+    """매칭에 필요한 사용자 스펙 (프로젝트 기술 스택은 한 번만 카테고리로 변환)"""
+
+    def __init__(self, projects: List[dict], languages: List[dict], certificates: List[dict]):
+        self.projects = projects or []
+        self.languages = languages or []
+        self.certificates = certificates or []
+        # 카테고리 → 사용자 기술 스택에서 찾은 키워드 (예: {"frontend": ["Vue"]})
+        self.tech_skills: Dict[str, List[str]] = {}
+        for project in self.projects:
+            for category, keywords in matcher.scan_all(project.get("tech_stack") or "").items():
+                skills = self.tech_skills.setdefault(category, [])
+                skills.extend(keyword for keyword in keywords if keyword not in skills)
+
+    def user_value(self, rule: dict, keyword: str) -> Optional[str]:
+        """규칙의 스펙을 충족하면 근거 문자열, 아니면 None
+
+        기술 스택은 사용자가 가진 기술로 표시한다 (요구 키워드가 있으면 그 키워드, 없으면 같은 카테고리의 다른 기술).
+        """
+        spec = rule.get("spec")
+        if spec == "projects" and self.projects:
+            return f"프로젝트 경험 {len(self.projects)}개"
+        if spec == "tech_stack" and rule["category"] in self.tech_skills:
+            skills = self.tech_skills[rule["category"]]
+            return f"{keyword if keyword in skills else skills[0]} 프로젝트 경험 있음"
+        if spec == "languages" and self.languages:
+            return f"{self.languages[0].get('language_type')} {self.languages[0].get('score')}점"
+        if spec == "certificates" and self.certificates:
+            return f"{self.certificates[0].get('certificate_name')} 보유"
+        return None
+
+
+# 모듈 임포트(서버 시작) 시 한 번만 컴파일
+matcher = RequirementMatcher(RULES)
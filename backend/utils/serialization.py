@@ -0,0 +1,32 @@
+"""
+DB 행 응답용 빠른 직렬화 경로
+
+우리 DB(PostgREST)에서 바로 온 행은 이미 JSON 타입이므로 response_model 재검증 없이
+모델 필드만 골라 orjson 으로 바로 인코딩한다. 엔드포인트가 Response 를 직접 반환하면
+FastAPI는 response_model 검증/직렬화를 건너뛴다 (response_model 은 문서화용으로 유지).
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, Tuple, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def _model_fields(model: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """모델별 (필드명, 기본값) 목록을 한 번만 계산"""
+    return tuple(
+        (name, None if field.is_required() else field.get_default(call_default_factory=True))
+        for name, field in model.model_fields.items()
+    )
+
+
+def trusted_rows(model: Type[BaseModel], rows: Iterable[dict]) -> List[dict]:
+    """검증 없이 모델 필드만 남긴 행들 (응답에 없어야 할 DB 컬럼 제외)"""
+    fields = _model_fields(model)
+    return [{name: row.get(name, default) for name, default in fields} for row in rows]
+
+
+def trusted_response(content: Any, status_code: int = 200) -> ORJSONResponse:
+    """trusted_rows 로 만든 내용을 검증 없이 orjson 으로 응답"""
+    return ORJSONResponse(content, status_code=status_code)
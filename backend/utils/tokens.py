@@ -0,0 +1,164 @@
+"""
+서명된 세션 토큰 (HS256 JWT)
+
+- 로그인 시 user_id, onboarding_completed 를 담은 짧은 수명의 토큰을 발급한다
+- 검증은 HMAC 서명과 만료 시각만 확인하므로 DB 조회가 없고, 한 번 검증한 토큰은 LRU에 보관해
+  만료 전까지 서명 계산도 생략한다
+- 모든 라우터는 current_user_id 의존성으로 사용자를 확인한다
+  (Authorization: Bearer 토큰 우선, AUTH_REQUIRE_TOKEN 이 꺼져 있으면 기존 x-user-id 헤더도 허용)
+"""
+import os
+import hmac
+import json
+import time
+import base64
+import hashlib
+import secrets
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_HEADER = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+
+class InvalidToken(Exception):
+    """서명이 맞지 않거나 만료된 토큰"""
+
+
+class TokenSigner:
+    """HS256 토큰 발급/검증 + 검증된 토큰 LRU"""
+
+    def __init__(self, secret: bytes, ttl: int = 3600, max_cached: int = 10000):
+        self._secret = secret
+        self.ttl = ttl
+        self.max_cached = max_cached
+        self._verified: "OrderedDict[str, dict]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        return _b64encode(hmac.new(self._secret, signing_input, hashlib.sha256).digest())
+
+    def issue(self, user_id: str, onboarding_completed: bool) -> str:
+        now = int(time.time())
+        payload = _b64encode(json.dumps({
+            "sub": user_id,
+            "onboarding_completed": onboarding_completed,
+            "iat": now,
+            "exp": now + self.ttl
+        }, separators=(",", ":")).encode())
+        signing_input = _HEADER + b"." + payload
+        return (signing_input + b"." + self._sign(signing_input)).decode()
+
+    def verify(self, token: str) -> dict:
+        """토큰의 클레임 ({"sub", "onboarding_completed", "iat", "exp"})"""
+        claims = self._verified.get(token)
+        if claims is not None:
+            if claims["exp"] > time.time():
+                self._verified.move_to_end(token)
+                self.cache_hits += 1
+                return claims
+            del self._verified[token]
+            raise InvalidToken("만료된 토큰입니다")
+
+        self.cache_misses += 1
+        try:
+            header, payload, signature = token.encode().split(b".")
+        except ValueError:
+            raise InvalidToken("잘못된 토큰 형식입니다")
+
+        # 알고리즘은 HS256 하나만 허용 (alg=none 등 헤더 변조 방지)
+        if header != _HEADER or not hmac.compare_digest(signature, self._sign(header + b"." + payload)):
+            raise InvalidToken("토큰 서명이 올바르지 않습니다")
+
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError:
+            raise InvalidToken("잘못된 토큰 형식입니다")
+        if claims.get("exp", 0) <= time.time():
+            raise InvalidToken("만료된 토큰입니다")
+
+        self._verified[token] = claims
+        while len(self._verified) > self.max_cached:
+            self._verified.popitem(last=False)
+        return claims
+
+
+def create_token_signer() -> TokenSigner:
+    """환경변수로 서명 키/수명 설정 (AUTH_TOKEN_SECRET, AUTH_TOKEN_TTL_SECONDS)"""
+    secret = os.getenv("AUTH_TOKEN_SECRET")
+    if not secret:
+        # 키가 없으면 프로세스별 임시 키 (앱 시작 시 경고 출력)
+        secret = secrets.token_hex(32)
+
+    return TokenSigner(
+        secret.encode(),
+        ttl=int(os.getenv("AUTH_TOKEN_TTL_SECONDS", 3600)),
+        max_cached=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 10000))
+    )
+
+
+token_signer = create_token_signer()
+
+# true 이면 x-user-id 헤더만으로는 인증하지 않음 (프론트엔드가 토큰으로 전환한 뒤 켠다)
+REQUIRE_TOKEN = os.getenv("AUTH_REQUIRE_TOKEN", "false").lower() == "true"
+
+
+def unauthorized(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={"error": message, "code": "UNAUTHORIZED"}
+    )
+
+
+def bearer_claims(authorization: str) -> dict:
+    """Authorization 헤더의 Bearer 토큰 검증 (실패 시 401)"""
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise unauthorized("Authorization 헤더는 Bearer 토큰이어야 합니다")
+    try:
+        return token_signer.verify(token.strip())
+    except InvalidToken as e:
+        raise unauthorized(str(e))
+
+
+# 헤더는 보안 스킴으로 선언 (OpenAPI 의 Authorize 에 표시되고, Header 파라미터와 달리
+# 라우트마다 검증 스키마를 만들지 않아 앱 시작 시 라우트 등록이 빠르다). 값은 헤더 원문 그대로 받는다.
+authorization_header = APIKeyHeader(
+    name="Authorization", scheme_name="BearerToken", auto_error=False, description="Bearer <access_token>"
+)
+user_id_header = APIKeyHeader(
+    name="x-user-id", scheme_name="UserIdHeader", auto_error=False, description="AUTH_REQUIRE_TOKEN 이 꺼져 있을 때만 허용"
+)
+
+
+async def current_token_claims(authorization: Optional[str] = Depends(authorization_header)) -> dict:
+    """토큰 클레임 (x-user-id 헤더는 허용하지 않음)"""
+    if not authorization:
+        raise unauthorized("로그인이 필요합니다")
+    return bearer_claims(authorization)
+
+
+async def current_user_id(
+    authorization: Optional[str] = Depends(authorization_header),
+    x_user_id: Optional[str] = Depends(user_id_header)
+) -> str:
+    """요청 사용자 ID (Bearer 토큰을 메모리에서만 검증, DB 조회 없음)"""
+    if authorization:
+        return bearer_claims(authorization)["sub"]
+
+    if x_user_id and not REQUIRE_TOKEN:
+        return x_user_id
+
+    raise unauthorized("로그인이 필요합니다")
@@ -4,7 +4,26 @@ import { useState, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
 import Navbar from '@/components/Navbar';
 import { getUserId, apiGet, apiPost } from '@/lib/api';
-import { JobPosting, UserProgress } from '@/types/api';
+import { JobPosting, JobPostingListResponse, UserProgress } from '@/types/api';
+
+// 채용 공고 목록을 next_cursor 를 따라 끝까지 불러옴 (한 번에 최대 100건)
+const JOB_POSTINGS_PAGE_SIZE = 100;
+const MAX_JOB_POSTING_PAGES = 10;
+
+const fetchAllJobPostings = async (): Promise<JobPosting[]> => {
+  const postings: JobPosting[] = [];
+  let cursor: string | null = null;
+  for (let page = 0; page < MAX_JOB_POSTING_PAGES; page++) {
+    const query: string = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+    const response: JobPostingListResponse = await apiGet<JobPostingListResponse>(
+      `/job-postings?limit=${JOB_POSTINGS_PAGE_SIZE}${query}`
+    );
+    postings.push(...response.data);
+    cursor = response.pagination.next_cursor;
+    if (!cursor) break;
+  }
+  return postings;
+};
 
 // 실제 채용 공고 데이터
 const REAL_JOB_POSTINGS = [
@@ -297,7 +316,7 @@ export default function GoalSettingPage() {
       setLoading(true);
       // API에서 채용 공고 데이터 가져오기
       try {
-        const postings = await apiGet<JobPosting[]>('/job-postings');
+        const postings = await fetchAllJobPostings();
         setJobPostings(postings.length > 0 ? postings : REAL_JOB_POSTINGS as any);
       } catch (error) {
         // API 실패시 실제 공고 데이터 사용
@@ -108,6 +108,16 @@ export interface JobPosting {
   updated_at?: string;
 }
 
+// GET /job-postings 응답 (최신순 커서 페이지네이션)
+export interface JobPostingListResponse {
+  data: JobPosting[];
+  pagination: {
+    limit: number;
+    next_cursor: string | null;
+    has_more: boolean;
+  };
+}
+
 export interface GapRequirement {
   description: string;
   is_met: boolean;